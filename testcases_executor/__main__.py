@@ -7,27 +7,49 @@ Functions:
     main()
 
 Imports:
+    sys
     from testcases_executor.tc_groups: TestCasesGroups
-    from testcases_executor.tc_parser: TestCasesParser
+    from testcases_executor.tc_parser: TestCasesParser, TestCasesMergeParser
     from testcases_executor.tc_runner: TestCasesRunner
+    from testcases_executor.tc_merge: save_result, RecordedGroups
+    from testcases_executor.tc_cache: clear_stalls
     from testcases_executor.tc_reporter.html_report: TestCasesHtmlReport
 """
+import sys
 from testcases_executor.tc_groups import TestCasesGroups
-from testcases_executor.tc_parser import TestCasesParser
+from testcases_executor.tc_parser import TestCasesParser, TestCasesMergeParser
 from testcases_executor.tc_runner import TestCasesRunner
+from testcases_executor.tc_merge import save_result, RecordedGroups
+from testcases_executor.tc_cache import clear_stalls
 from testcases_executor.tc_reporter.html_report import TestCasesHtmlReport
 
 
 def main():
     """
     Construct Groups, Parser and parse args, Suites and Runner tests, Report.
+
+    With 'merge' command, groups are rebuilt from saved results.
     """
-    tc_groups = TestCasesGroups()
-    parser = TestCasesParser(tc_groups)
-    args = parser.parse_args()
-    tc_groups.construct_suites(args)
-    result = TestCasesRunner().run(tc_groups)
-    TestCasesHtmlReport(result, args.open)
+    if sys.argv[1:2] == ['merge']:  # merge results saved by other runs
+        args = TestCasesMergeParser().parse_args(sys.argv[2:])
+        tc_groups = RecordedGroups(args.files)
+        result = TestCasesRunner(recorded=True).run(tc_groups)
+        result.start_time = tc_groups.start_time
+        stalls = False  # dumps in cache are of a local run
+    else:
+        tc_groups = TestCasesGroups()
+        parser = TestCasesParser(tc_groups)
+        args = parser.parse_args()
+        tc_groups.construct_suites(args)
+        clear_stalls()  # stacks dumped during previous run
+        result = TestCasesRunner(
+            args.jobs, args.by_group, args.failfast, args.mem,
+            args.journal, args.display, args.history, args.durations,
+            args.record_impact).run(tc_groups)
+        if args.json is not None:  # save it to merge later
+            save_result(result, args.json)
+        stalls = True
+    TestCasesHtmlReport(result, args.open, stalls)
 
 
 if __name__ == "__main__":
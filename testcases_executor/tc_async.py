@@ -0,0 +1,249 @@
+"""
+Module testcases_executor.tc_async
+
+Contain necessary class to run async testcases's tests on a shared loop.
+
+Classes:
+    SharedLoopSuite
+
+Variables:
+    __unittest: bool
+        hide frames of this module in tests's tracebacks, as unittest's.
+
+Imports:
+    asyncio
+    sys
+    time
+    from inspect: isawaitable
+    from unittest: TestSuite, SkipTest
+    from testcases_executor.tc_utils: timed_part
+    from testcases_executor.tc_watchdog: Watchdog
+"""
+import asyncio
+import sys
+import time
+from inspect import isawaitable
+from unittest import TestSuite, SkipTest
+from testcases_executor.tc_utils import timed_part
+from testcases_executor.tc_watchdog import Watchdog
+
+__unittest = True
+
+
+class SharedLoopSuite(TestSuite):
+    """
+    A subclass of unittest.TestSuite .
+
+    Used to run all tests of an IsolatedAsyncioTestCase on one event loop,
+    instead of creating and closing a loop for each test method. Tests of a
+    testcase with concurrent_tests attribute set to True are gathered.
+
+    Methods
+    ----------
+    gathers(testcase):
+        Return True if testcase's tests are gathered on one loop.
+    share_runner(test, runner):
+        Make test use runner and not create or close its own one.
+    run_test(test, result):
+        Run a test as a coroutine and add its outcome to result.
+    run_concurrently(runner, tests, result):
+        Run class and module fixtures and gather tests on runner's loop.
+    run(result, debug=False):
+        Override original one to run tests with the same asyncio runner.
+    """
+
+    @staticmethod
+    def gathers(testcase):
+        """
+        Return True if testcase's tests are gathered on one loop.
+
+        Parameters
+        ----------
+            testcase: unittest.TestCase subclass
+                testcase with concurrent_tests attribute set to True or not.
+
+        Return
+        ----------
+            bool
+                concurrent_tests set and asyncio.Runner available.
+        """
+        return hasattr(asyncio, 'Runner') and bool(getattr(
+            testcase, 'concurrent_tests', False))
+
+    @staticmethod
+    def share_runner(test, runner):
+        """
+        Make test use runner and not create or close its own one.
+
+        Marked on a shared loop, its timeouts are limited on the loop.
+
+        Parameters
+        ----------
+            test: IsolatedAsyncioTestCase
+                test method to run on runner's loop.
+            runner: asyncio.Runner
+                runner shared by all tests of suite.
+        """
+        test._asyncioRunner = runner
+        test._setupAsyncioRunner = lambda: None
+        test._tearDownAsyncioRunner = lambda: None
+        test._sharedLoop = True
+
+    @staticmethod
+    async def run_test(test, result):
+        """
+        Run a test as a coroutine and add its outcome to result.
+
+        As TestCase.run, cleanups are runned even if setUp failed, each one
+        whatever the previous ones raised, and errors of each part are all
+        added. The outcome is added when test is completed, with duration
+        since it started, so tests are displayed in order of completion.
+        Its parts are timed, but not its CPU time, shared by tests running
+        together. With result's watchdog, its async parts are limited by its
+        timeouts, a timeout recorded as error.
+
+        Parameters
+        ----------
+            test: IsolatedAsyncioTestCase
+                test method to run.
+            result: TestCasesResult
+                result updated with test's outcome.
+        """
+        result.startTest(test)
+        t_start = time.perf_counter_ns()
+        parts, outcomes = {}, []  # outcomes: [(part, status, err), ...]
+        method = getattr(test, test._testMethodName)
+        expecting_failure = getattr(
+            method, '__unittest_expecting_failure__', False) or getattr(
+            test, '__unittest_expecting_failure__', False)
+        limit = None  # [deadline, reason] of test's timeout
+        if getattr(result, 'watchdog', None) is not None:
+            limit = result.watchdog.test_limit()
+
+        async def run_part(part, function, *args, **kwargs):
+            try:
+                with timed_part(parts, part):
+                    returned = function(*args, **kwargs)
+                    if isawaitable(returned):
+                        await Watchdog.limited(returned, limit)
+            except KeyboardInterrupt:
+                raise
+            except SkipTest as e:
+                outcomes.append((part, 'skipped', str(e)))
+            except test.failureException:
+                outcomes.append((part, 'failed', sys.exc_info()))
+            except BaseException:  # as unittest, not raised out of gather
+                outcomes.append((part, 'errors', sys.exc_info()))
+            else:
+                return True
+            return False
+
+        for obj in (test.__class__, method):
+            if getattr(obj, '__unittest_skip__', False):
+                outcomes.append(('setUp', 'skipped', getattr(
+                    obj, '__unittest_skip_why__', '')))
+                break
+        else:
+            if (await run_part('setUp', test.setUp) and
+                    await run_part('setUp', test.asyncSetUp)):
+                await run_part('test', method)
+                if await run_part('tearDown', test.asyncTearDown):
+                    await run_part('tearDown', test.tearDown)
+            while test._cleanups:  # sync and async cleanups
+                function, args, kwargs = test._cleanups.pop()
+                await run_part('cleanup', function, *args, **kwargs)
+        result.end_concurrent_test(test, t_start, parts)
+        expected_failure = None
+        for part, status, err in outcomes:
+            if status == 'skipped':
+                result.addSkip(test, err)
+            elif part == 'test' and expecting_failure:
+                expected_failure = err
+            elif status == 'failed':
+                result.addFailure(test, err)
+            else:
+                result.addError(test, err)
+        if not outcomes:
+            if expecting_failure:
+                result.addUnexpectedSuccess(test)
+            else:
+                result.addSuccess(test)
+        elif expected_failure is not None and len(outcomes) == 1:
+            result.addExpectedFailure(test, expected_failure)
+        result.stopTest(test)
+
+    def run_concurrently(self, runner, tests, result):
+        """
+        Run class and module fixtures and gather tests on runner's loop.
+
+        Tests are started together, result is marked concurrent meanwhile.
+
+        Parameters
+        ----------
+            runner: asyncio.Runner
+                runner shared by all tests of suite.
+            tests: list
+                IsolatedAsyncioTestCase instances of the same testcase.
+            result: TestCasesResult
+                result updated by tests.
+
+        Return
+        ----------
+            result: TestCasesResult
+                result updated by tests.
+        """
+        top_level = False
+        if getattr(result, '_testRunEntered', False) is False:
+            result._testRunEntered = top_level = True
+        self._tearDownPreviousClass(tests[0], result)
+        self._handleModuleFixture(tests[0], result)
+        self._handleClassSetUp(tests[0], result)
+        result._previousTestClass = tests[0].__class__
+        if not (result.shouldStop or getattr(
+                tests[0].__class__, '_classSetupFailed', False) or getattr(
+                result, '_moduleSetUpFailed', False)):
+
+            async def gather_tests():
+                await asyncio.gather(*[asyncio.create_task(
+                    self.run_test(test, result),
+                    context=test._asyncioTestContext) for test in tests])
+
+            result.concurrent = True
+            try:
+                runner.run(gather_tests())
+            finally:
+                result.concurrent = False
+        if top_level:
+            self._tearDownPreviousClass(None, result)
+            self._handleModuleTearDown(result)
+            result._testRunEntered = False
+        return result
+
+    def run(self, result, debug=False):
+        """
+        Override original one to run tests with the same asyncio runner.
+
+        Without asyncio.Runner (python < 3.11), tests run on their own loop.
+
+        Parameters
+        ----------
+            result: TestCasesResult
+                result updated by tests.
+            debug: bool (default: False)
+                run tests without collecting errors in result.
+
+        Return
+        ----------
+            result: TestCasesResult
+                result updated by tests.
+        """
+        tests = [test for test in self if test is not None]
+        if not tests or not hasattr(asyncio, 'Runner'):
+            return super().run(result, debug)
+        loop_factory = getattr(tests[0], 'loop_factory', None)
+        with asyncio.Runner(debug=True, loop_factory=loop_factory) as runner:
+            for test in tests:
+                self.share_runner(test, runner)
+            if self.gathers(tests[0].__class__) and not debug:
+                return self.run_concurrently(runner, tests, result)
+            return super().run(result, debug)
@@ -0,0 +1,232 @@
+"""
+Module testcases_executor.tc_cache
+
+Contain functions to save and load datas from previous runs in a cache dir.
+
+Functions:
+    load_cache(name, default)
+    save_cache(name, datas)
+    tc_id(testcase)
+    load_durations()
+    save_durations(result)
+    load_timings(path)
+    expected_durations(test_ids, durations)
+    load_failed()
+    save_failed(result)
+    stall_path(test_id)
+    load_stalls()
+    clear_stalls()
+
+Variables:
+    CACHE_DIR: str
+        project local directory where datas are saved.
+    FIXTURES: tuple
+        class and module fixtures, whose errors have no test's record.
+
+Imports:
+    json
+    from os: makedirs, listdir
+    from os.path: join, isfile, isdir
+    from shutil: rmtree
+"""
+import json
+from os import makedirs, listdir
+from os.path import join, isfile, isdir
+from shutil import rmtree
+
+CACHE_DIR = '.tc_executor_cache'
+FIXTURES = ('setUpClass', 'tearDownClass', 'setUpModule', 'tearDownModule')
+
+
+def load_cache(name, default):
+    """
+    Load and return datas saved in cache's json file, or default.
+
+        Parameters:
+            name (str): name of json file in cache dir.
+            default (?): returned if file not exist or not valid.
+
+        Returns:
+            object: datas loaded from file or default.
+    """
+    path = join(CACHE_DIR, name)
+    if not isfile(path):
+        return default
+    try:
+        with open(path, 'r') as cache_file:
+            return json.load(cache_file)
+    except ValueError:  # file corrupted, start again from nothing
+        return default
+
+
+def save_cache(name, datas):
+    """
+    Save datas in cache's json file.
+
+        Parameters:
+            name (str): name of json file in cache dir.
+            datas (?): json serializable object.
+    """
+    makedirs(CACHE_DIR, exist_ok=True)
+    with open(join(CACHE_DIR, name), 'w') as cache_file:
+        json.dump(datas, cache_file)
+
+
+def tc_id(testcase):
+    """
+    Return testcase's id used in cache, like test.id() for a test method.
+
+        Parameters:
+            testcase (unittest.TestCase subclass): testcase.
+
+        Returns:
+            str: module.qualname .
+    """
+    return f"{testcase.__module__}.{testcase.__qualname__}"
+
+
+def load_durations():
+    """
+    Load and return durations of tests and testcases from previous runs.
+
+        Returns:
+            dict: {'tests': {test id: dur}, 'testcases': {testcase id: dur}}.
+    """
+    durations = load_cache('durations.json', {})
+    return {
+        'tests': durations.get('tests', {}),
+        'testcases': durations.get('testcases', {})}
+
+
+def save_durations(result):
+    """
+    Update durations from previous runs with the ones of result and save it.
+
+        Parameters:
+            result (TestCasesResult): result with records of tests runned.
+    """
+    durations = load_durations()
+    durations['tests'].update({
+        test.id(): record.duration
+        for test, record in result.records.items()})
+    durations['testcases'].update({
+        tc_id(testcase): duration
+        for testcase, duration in result.durations['testcases'].items()})
+    save_cache('durations.json', durations)
+
+
+def load_timings(path):
+    """
+    Load and return durations of tests from a shared timing file.
+
+    The file is given, not written by runs, so each machine running a shard
+    reads the same durations (a durations.json copied from a full run).
+
+        Parameters:
+            path (str): path of json file, like cache's durations.json .
+
+        Returns:
+            dict: {test id: duration}.
+    """
+    with open(path, 'r') as timing_file:
+        return json.load(timing_file).get('tests', {})
+
+
+def expected_durations(test_ids, durations):
+    """
+    Return expected duration of tests, from previous runs.
+
+    A test never runned is expected to last the mean of known tests, or
+    1 second without any, so that only proportions between tests matter.
+
+        Parameters:
+            test_ids (list): test.id() of tests to run.
+            durations (dict): {test id: duration} from previous runs.
+
+        Returns:
+            dict: {test id: expected duration in second}.
+    """
+    default = 1.0
+    if durations:
+        default = sum(durations.values()) / len(durations)
+    return {
+        test_id: durations.get(test_id, default) for test_id in test_ids}
+
+
+def load_failed():
+    """
+    Load and return ids of tests failed or in error in previous runs.
+
+        Returns:
+            set: test ids, and testcase ids for errors of their fixtures.
+    """
+    return set(load_cache('failed.json', []))
+
+
+def save_failed(result):
+    """
+    Update tests failed in previous runs with the ones of result and save it.
+
+    A test runned is kept if it failed or is in error, removed otherwise,
+    a test not runned (other selection) keeps its previous state. A testcase
+    runned is kept (its id) if a class or module fixture failed, its tests
+    without record.
+
+        Parameters:
+            result (TestCasesResult): result with records of tests runned.
+    """
+    failed = load_failed()
+    for test, record in result.records.items():
+        if record.status in ('failed', 'errors'):
+            failed.add(test.id())
+        else:
+            failed.discard(test.id())
+    for _, tc_tup in result.test_methods:
+        for testcase, _ in tc_tup:
+            if any([  # setUpClass (module.TestCase)...
+                    description.split(' ')[0] in FIXTURES
+                    for _, description, *_ in result.unrecorded.get(
+                        testcase, [])]):
+                failed.add(tc_id(testcase))
+            else:
+                failed.discard(tc_id(testcase))
+    save_cache('failed.json', sorted(failed))
+
+
+def stall_path(test_id):
+    """
+    Return path of file where stacks of a stalled test are dumped.
+
+        Parameters:
+            test_id (str): test.id() .
+
+        Returns:
+            str: path in stalls dir of cache dir, created if needed.
+    """
+    stalls_dir = join(CACHE_DIR, 'stalls')
+    makedirs(stalls_dir, exist_ok=True)
+    return join(stalls_dir, f"{test_id}.txt")
+
+
+def load_stalls():
+    """
+    Load and return stacks dumped for stalled tests.
+
+        Returns:
+            dict: {test id: content of dump file}, only stalled tests.
+    """
+    stalls_dir = join(CACHE_DIR, 'stalls')
+    if not isdir(stalls_dir):
+        return {}
+    stalls = {}
+    for f_name in listdir(stalls_dir):
+        with open(join(stalls_dir, f_name), 'r') as stall_file:
+            stalls[f_name[:-len('.txt')]] = stall_file.read()
+    return stalls
+
+
+def clear_stalls():
+    """
+    Remove stacks dumped during a previous run.
+    """
+    rmtree(join(CACHE_DIR, 'stalls'), ignore_errors=True)
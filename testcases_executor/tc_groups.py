@@ -14,13 +14,24 @@ Functions:
 Imports:
     sys
     from fnmatch: fnmatchcase
-    from unittest: TestCase, TestLoader, TestSuite
-    from testcases_executor.tc_utils: raise_error, check_type
+    from unittest: (
+        TestCase, IsolatedAsyncioTestCase, TestLoader, TestSuite)
+    from testcases_executor.tc_utils: (
+        raise_error, check_type, RESERVED_NAMES, GROUP_SETTINGS)
+    from testcases_executor.tc_async: SharedLoopSuite
+    from testcases_executor.tc_cache: tc_id, load_timings, load_failed
+    from testcases_executor.tc_merge: load_outcomes
+    from testcases_executor.tc_impact: changed_files, load_impact
 """
 import sys
 from fnmatch import fnmatchcase
-from unittest import TestCase, TestLoader, TestSuite
-from testcases_executor.tc_utils import raise_error, check_type
+from unittest import TestCase, IsolatedAsyncioTestCase, TestLoader, TestSuite
+from testcases_executor.tc_utils import (
+    raise_error, check_type, RESERVED_NAMES, GROUP_SETTINGS)
+from testcases_executor.tc_async import SharedLoopSuite
+from testcases_executor.tc_cache import tc_id, load_timings, load_failed
+from testcases_executor.tc_merge import load_outcomes
+from testcases_executor.tc_impact import changed_files, load_impact
 
 
 def import_groups():
@@ -121,6 +132,18 @@ class TestCasesGroup():
         instances subclass of unittest.TestCase .
     suites : list
         tuples (testcase, unittest.TestSuite object).
+    resumed : dict
+        {testcase: [(test, outcome), ...]} tests completed by an interrupted
+        run, removed from suites.
+    shared_loop : bool
+        run all tests of an IsolatedAsyncioTestCase on one event loop,
+        always done for one with concurrent_tests attribute set to True.
+    timeout : float or None
+        max duration in seconds of each test.
+    testcase_timeout : float or None
+        max duration in seconds of all tests of each testcase.
+    stall : float or None
+        duration in seconds between stacks dumps of a running test.
 
     Methods
     ----------
@@ -135,14 +158,17 @@ class TestCasesGroup():
         Parameters
         ----------
             group_tup : tuple
-                name, argument name and testcases's list or tuple.
+                name, argument name, testcases's list or tuple and optional
+                settings's dict.
 
         Raises
         ----------
-            ValueError: name empty string, arg with space, class not used once.
-            TypeError: testcase not a subclass of unittest.TestCase .
+            ValueError: name empty string, arg with space, class not used once,
+                unknown setting or not positive timeout.
+            TypeError: testcase not a subclass of unittest.TestCase , settings
+                not a dict or timeout not a number.
         """
-        group_name, group_arg_name, group_tc = group_tup
+        group_name, group_arg_name, group_tc = group_tup[:3]
         check_type(group_name, (str, ), "Group's name")
         if not group_name:  # name empty string
             raise_error(
@@ -156,10 +182,11 @@ class TestCasesGroup():
                 ValueError, "".join([
                     "Group's argument name must not contain space: ",
                     f"{group_arg_name}."]))
-        if group_arg_name in ['h', 'o']:  # arg name h or o
+        reserved_msg = " or ".join([f"'{n}'" for n in RESERVED_NAMES])
+        if group_arg_name in RESERVED_NAMES:  # arg name h, o...
             raise_error(
                 ValueError, "".join([
-                    "Group's argument name must not be 'h' or 'o': ",
+                    f"Group's argument name must not be {reserved_msg}: ",
                     f"{group_arg_name}."]))
         check_type(group_tc, (list, tuple), "Group's testcases")
         for testcase in group_tc:
@@ -173,19 +200,43 @@ class TestCasesGroup():
                 raise_error(TypeError, "".join([
                     "Item of group's testcases list or tuple must be ",
                     f"a {error_type}: {testcase}"]))
-            if testcase.__name__ in ['h', 'o']:  # testcase name h or o
+            if testcase.__name__ in RESERVED_NAMES:  # testcase name h, o...
                 raise_error(
                     ValueError, "".join([
-                        "TestCase's name must not be 'h' or 'o': ",
+                        f"TestCase's name must not be {reserved_msg}: ",
                         f"{testcase.__name__}."]))
             if group_tc.count(testcase) != 1:  # testcase not used once
                 raise_error(ValueError, "".join([
                     "Testcase's subclass must used once in group: ",
                     f"'{testcase.__name__}'."]))
-        self.name, self.arg_name, self.testcases = group_tup
+        g_settings = {}
+        if len(group_tup) == 4:  # optional settings
+            g_settings = group_tup[3]
+            check_type(g_settings, (dict, ), "Group's settings")
+            for s_name, s_value in g_settings.items():
+                if s_name not in GROUP_SETTINGS:  # unknown setting
+                    raise_error(ValueError, "".join([
+                        "Group's setting must be ",
+                        " or ".join([f"'{n}'" for n in GROUP_SETTINGS]),
+                        f": {s_name}."]))
+                check_type(s_value, (int, float), f"Group's {s_name}")
+                if isinstance(s_value, bool):  # an int, but not a number
+                    raise_error(TypeError, "".join([
+                        f"Group's {s_name} must be 'int' or 'float', ",
+                        f"not 'bool': {s_value}"]))
+                if not s_value > 0:  # not positive timeout, or nan
+                    raise_error(
+                        ValueError,
+                        f"Group's {s_name} must be positive: {s_value}.")
+        self.name, self.arg_name, self.testcases = group_tup[:3]
         if isinstance(self.testcases, tuple):  # convert to list
             self.testcases = list(self.testcases)
         self.suites = []
+        self.resumed = {}
+        self.shared_loop = False
+        self.timeout = g_settings.get('timeout')
+        self.testcase_timeout = g_settings.get('testcase_timeout')
+        self.stall = g_settings.get('stall')
 
     def update_suites(self, testcase, test_methods=None):
         """
@@ -198,10 +249,18 @@ class TestCasesGroup():
             test_methods: list (default: None)
                 names of test methods (str)
         """
+        suite_class = TestSuite
+        if issubclass(testcase, IsolatedAsyncioTestCase) and (
+                self.shared_loop or getattr(
+                    testcase, 'concurrent_tests', False)):
+            suite_class = SharedLoopSuite  # async tests on one loop
         if test_methods is None:
-            suite = GroupTestLoader().loadTestsFromTestCase(testcase)
+            loader = GroupTestLoader()
+            loader.suiteClass = suite_class
+            suite = loader.loadTestsFromTestCase(testcase)
         else:
-            suite = TestSuite([testcase(t_name) for t_name in test_methods])
+            suite = suite_class(
+                [testcase(t_name) for t_name in test_methods])
         self.suites.append((testcase, suite))
 
 
@@ -219,6 +278,14 @@ class TestCasesGroups(list):
     ----------
     construct_suites(args):
         Check args, update group's testsuites and remove group without suite.
+    shard_suites(shard, t_durations=None):
+        Keep only suites of a shard, balanced by durations or number of tests.
+    select_affected(changed, index):
+        Keep only tests runned by changed files, or never recorded.
+    select_failed(failed, only):
+        Keep only tests failed in previous runs, or run them first.
+    resume_suites(outcomes):
+        Remove tests completed by an interrupted run from suites.
     """
 
     def __init__(self, tc_groups=None):
@@ -228,11 +295,11 @@ class TestCasesGroups(list):
         Parameters
         ----------
             tc_groups : list or tuple (default: None)
-                tuples with 3 items each for items
+                tuples with 3 or 4 items each for items
 
         Raises
         ----------
-            IndexError: group tup not contain 3 items.
+            IndexError: group tup not contain 3 or 4 items.
             ValueError: group's name or testcase not used once.
         """
         sys.tracebacklimit = 0
@@ -242,11 +309,12 @@ class TestCasesGroups(list):
         super().__init__()
         for group_item in tc_groups:
             check_type(group_item, (tuple, ), "Item of groups")
-            if len(group_item) != 3:
-                raise_error(IndexError, "".join([  # not contain 3 items
+            if len(group_item) not in (3, 4):
+                raise_error(IndexError, "".join([  # not contain 3 or 4 items
                     "Group tuple must contain 3 items (group's name, ",
                     "group's argument name to run all of his testcases, ",
-                    f"testcases list or tuple), not {len(group_item)}"]))
+                    "testcases list or tuple) and optional settings dict, ",
+                    f"not {len(group_item)}"]))
             self.append(TestCasesGroup(group_item))
         error_value = None
         g_names = [g.name for g in self]
@@ -290,24 +358,183 @@ class TestCasesGroups(list):
             args :
                 result of TestCasesParser.parse_args() .
         """
-        if (len(sys.argv) == 1) or ((len(sys.argv) == 2) and args.open):
-            for tc_group in self:  # no arg or open timesatamp -> all tests
+        args_dict = vars(args)
+        all_tests = not any([  # no group or testcase arg -> all tests
+            args_dict[tc_group.arg_name] or any([
+                isinstance(args_dict[testcase.__name__], list)
+                for testcase in tc_group.testcases]) for tc_group in self])
+        for tc_group in self:
+            tc_group.shared_loop = args_dict['shared_loop']
+            if tc_group.timeout is None:  # group's setting first
+                tc_group.timeout = args_dict['timeout']
+            if tc_group.testcase_timeout is None:
+                tc_group.testcase_timeout = args_dict['testcase_timeout']
+            if tc_group.stall is None:
+                tc_group.stall = args_dict['stall']
+            if all_tests or args_dict[tc_group.arg_name]:  # group tests
                 for testcase in tc_group.testcases:
                     tc_group.update_suites(testcase)
-        else:
-            args_dict = vars(args)
-            for tc_group in self:
-                if args_dict[tc_group.arg_name]:  # group name arg, group tests
-                    for testcase in tc_group.testcases:
-                        tc_group.update_suites(testcase)
+            else:
+                for testcase in tc_group.testcases:
+                    t_names = args_dict[testcase.__name__]
+                    if isinstance(t_names, list):  # test case's name arg
+                        if not t_names:  # no param -> test case's tests
+                            tc_group.update_suites(testcase)
+                        else:  # method name(s) param -> methods's tests
+                            tc_group.update_suites(testcase, t_names)
+        if args_dict['shard'] is not None:
+            t_durations = None  # same on all machines, or by number
+            if args_dict['shard_durations'] is not None:
+                t_durations = load_timings(args_dict['shard_durations'])
+            self.shard_suites(args_dict['shard'], t_durations)
+        if args_dict['affected_by'] is not None:
+            self.select_affected(
+                changed_files(args_dict['affected_by']), load_impact())
+        if args_dict['failed'] is not None:  # after shard, same shards
+            self.select_failed(load_failed(), args_dict['failed'] == 'last')
+        if args_dict['resume'] is not None:  # after shard, same suites
+            self.resume_suites(load_outcomes(args_dict['resume']))
+        groups_to_remove = [g for g in self if not g.suites]
+        for group in groups_to_remove:  # remove group without suite
+            self.remove(group)
+
+    def shard_suites(self, shard, t_durations=None):
+        """
+        Keep only suites of a shard, balanced by durations or number of tests.
+
+        Suites are sorted by weight, durations of their tests given (mean for
+        a test without one) or number of tests without any, then each one is
+        given to the lightest shard. Durations are never the ones saved by
+        each machine's runs, which differ between shards, so same suites and
+        durations always give same shards, covering all suites once.
+
+        Parameters
+        ----------
+            shard : tuple
+                index (from 1) of shard to keep, number of shards.
+            t_durations : dict or None (default: None)
+                {test id: duration} of a shared timing file.
+        """
+        k_shard, n_shards = shard
+        default = 1
+        if t_durations:
+            default = sum(t_durations.values()) / len(t_durations)
+        weighted = []
+        for tc_group in self:
+            for testcase, suite in tc_group.suites:
+                t_ids = [
+                    f"{tc_id(testcase)}.{test._testMethodName}"
+                    for test in suite._tests]
+                if t_durations:
+                    weight = sum([
+                        t_durations.get(t_id, default) for t_id in t_ids])
+                else:  # no timing file, balanced by number of tests
+                    weight = len(t_ids)
+                weighted.append((-weight, tc_id(testcase), testcase))
+        loads = [0] * n_shards
+        kept = []
+        for neg_weight, _, testcase in sorted(weighted):
+            lightest = loads.index(min(loads))
+            loads[lightest] -= neg_weight
+            if lightest == k_shard - 1:
+                kept.append(testcase)
+        for tc_group in self:
+            tc_group.suites = [
+                (testcase, suite) for testcase, suite in tc_group.suites
+                if testcase in kept]
+
+    def select_affected(self, changed, index):
+        """
+        Keep only tests runned by changed files, or never recorded.
+
+        Suites without test kept are removed.
+
+        Parameters
+        ----------
+            changed : set
+                relative paths of files changed.
+            index : dict
+                {file's relative path: [test ids]} recorded by previous runs
+                with --record-impact .
+        """
+        recorded = {
+            test_id for test_ids in index.values() for test_id in test_ids}
+        affected = {
+            test_id for path in changed for test_id in index.get(path, [])}
+        for tc_group in self:
+            for testcase, suite in tc_group.suites:
+                suite._tests = [
+                    test for test in suite._tests
+                    if test.id() in affected or test.id() not in recorded]
+            tc_group.suites = [
+                (testcase, suite) for testcase, suite in tc_group.suites
+                if suite._tests]
+
+    def select_failed(self, failed, only):
+        """
+        Keep only tests failed in previous runs, or run them first.
+
+        Failed tests are runned first in their suite, suites with failed
+        tests first in their group and groups with failed tests first, each
+        in declaration order. All tests of a testcase whose fixture failed
+        (its id in failed) are failed ones. Without failed tests among the
+        selected ones (other group, shard...), all tests are kept.
+
+        Parameters
+        ----------
+            failed : set
+                ids of tests (and testcases) failed or in error in previous
+                runs.
+            only : bool
+                keep only failed tests (--last-failed), else all tests with
+                failed ones first (--failed-first).
+        """
+        t_failed = [  # failed tests of each group's suites
+            [[
+                test for test in suite._tests
+                if test.id() in failed or tc_id(testcase) in failed]
+             for testcase, suite in tc_group.suites] for tc_group in self]
+        if not any([any(g_failed) for g_failed in t_failed]):
+            return  # nothing selected failed, run all tests
+        groups_failed = {}
+        for tc_group, g_failed in zip(self, t_failed):
+            suites_failed, suites_other = [], []
+            for (testcase, suite), tests in zip(tc_group.suites, g_failed):
+                if tests:
+                    suites_failed.append((testcase, suite))
+                elif only:  # suite without failed test removed
+                    continue
                 else:
-                    for testcase in tc_group.testcases:
-                        t_names = args_dict[testcase.__name__]
-                        if isinstance(t_names, list):  # test case's name arg
-                            if not t_names:  # no param -> test case's tests
-                                tc_group.update_suites(testcase)
-                            else:  # method name(s) param -> methods's tests
-                                tc_group.update_suites(testcase, t_names)
-            groups_to_remove = [g for g in self if not g.suites]
-            for group in groups_to_remove:  # remove group without suite
-                self.remove(group)
+                    suites_other.append((testcase, suite))
+                if not only:  # then other tests
+                    tests.extend([
+                        test for test in suite._tests if test not in tests])
+                suite._tests = tests
+            tc_group.suites = suites_failed + suites_other
+            groups_failed[tc_group] = bool(suites_failed)
+        self.sort(  # stable, declaration order kept
+            key=lambda tc_group: not groups_failed[tc_group])
+
+    def resume_suites(self, outcomes):
+        """
+        Remove tests completed by an interrupted run from suites.
+
+        Completed tests are kept with their outcome in group's resumed, to be
+        added to result without being runned. A suite without remaining test
+        is kept, its testcase is reported with resumed tests.
+
+        Parameters
+        ----------
+            outcomes : dict
+                {test id: outcome} loaded from interrupted run's journal.
+        """
+        for tc_group in self:
+            for testcase, suite in tc_group.suites:
+                resumed = [
+                    (test, outcomes[test.id()]) for test in suite._tests
+                    if test.id() in outcomes]
+                if resumed:
+                    tc_group.resumed[testcase] = resumed
+                    suite._tests = [
+                        test for test in suite._tests
+                        if test.id() not in outcomes]
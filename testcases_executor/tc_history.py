@@ -0,0 +1,154 @@
+"""
+Module testcases_executor.tc_history
+
+Contain necessary class to record runs in a sqlite history.
+
+Classes:
+    RunHistory
+
+Variables:
+    HISTORY_PATH: str
+        sqlite database of runs in cache dir.
+    SCHEMA: str
+        tables of runs and of their tests, created if not exist.
+
+Imports:
+    atexit
+    queue
+    sqlite3
+    threading
+    time
+    from os import makedirs
+    from os.path: dirname, join
+    from testcases_executor.tc_cache: CACHE_DIR
+"""
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from os import makedirs
+from os.path import dirname, join
+from testcases_executor.tc_cache import CACHE_DIR
+
+HISTORY_PATH = join(CACHE_DIR, 'history.sqlite')
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, start_time TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs (id), test_id TEXT NOT NULL,
+    group_name TEXT, testcase TEXT NOT NULL, status TEXT NOT NULL,
+    duration REAL NOT NULL, timestamp REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS tests_test_id ON tests (test_id, run_id);
+"""
+
+
+class RunHistory():
+    """
+    A class to record a run and its tests's outcomes in a sqlite history.
+
+    Tests's rows are put in a queue, a thread writes them in one
+    transaction by batch of what is queued, so tests never wait for the
+    database. Rows queued when a run crashes are written at exit.
+
+    Attributes
+    ----------
+    path: str
+        path of sqlite database.
+    start_time: datetime
+        start time of tests, saved with the run.
+    batch_size: int
+        max rows written in one transaction.
+    queue: queue.Queue
+        rows not yet written, None to stop thread.
+    thread: threading.Thread
+        write rows queued.
+
+    Methods
+    ----------
+    write_test(test, group, outcome):
+        Queue a row with a test's outcome.
+    write_rows():
+        Create run, write rows queued by batches until stopped.
+    close():
+        Write rows queued and stop thread, called at exit if not closed.
+    """
+
+    def __init__(self, start_time, path=HISTORY_PATH, batch_size=500):
+        """
+        Start thread writing run and its tests in history.
+
+        Parameters
+        ----------
+            start_time: datetime
+                start time of tests.
+            path: str (default: HISTORY_PATH)
+                path of sqlite database, created if not exist.
+            batch_size: int (default: 500)
+                max rows written in one transaction.
+        """
+        self.path = path
+        self.start_time = start_time
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.write_rows, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)  # crashed run, rows queued kept
+
+    def write_test(self, test, group, outcome):
+        """
+        Queue a row with a test's outcome.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+            group: TestCasesGroup or None
+                group of test.
+            outcome: tuple
+                outcome returned by TestCasesResult.get_outcomes .
+        """
+        testcase = test.__class__
+        self.queue.put((
+            test.id(), getattr(group, 'name', None),
+            f"{testcase.__module__}.{testcase.__qualname__}", outcome[0],
+            outcome[1], time.time()))
+
+    def write_rows(self):
+        """
+        Create run, write rows queued by batches until stopped.
+        """
+        if dirname(self.path):
+            makedirs(dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path)  # used only by thread
+        try:
+            with connection:
+                connection.executescript(SCHEMA)
+                run_id = connection.execute(
+                    "INSERT INTO runs (start_time) VALUES (?)",
+                    (self.start_time.isoformat(), )).lastrowid
+            stopped = False
+            while not stopped:
+                rows = [self.queue.get()]  # wait next test
+                while len(rows) < self.batch_size:
+                    try:
+                        rows.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in rows:  # closed, last rows
+                    stopped = True
+                    rows = [row for row in rows if row is not None]
+                with connection:  # one transaction
+                    connection.executemany(
+                        "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(run_id, ) + row for row in rows])
+        finally:
+            connection.close()
+
+    def close(self):
+        """
+        Write rows queued and stop thread, called at exit if not closed.
+        """
+        self.queue.put(None)
+        self.thread.join()
+        atexit.unregister(self.close)
@@ -0,0 +1,239 @@
+"""
+Module testcases_executor.tc_impact
+
+Contain necessary class and functions to record source files runned by each
+test and select tests affected by changed files.
+
+Classes:
+    ImpactTracer
+
+Functions:
+    project_files(files)
+    load_impact()
+    save_impact(tests)
+    changed_files(paths)
+
+Variables:
+    MONITORING: module or None
+        sys.monitoring (python >= 3.12), None to trace with sys.settrace .
+    PACKAGE_DIR: str
+        directory of testcases_executor, its files not recorded.
+
+Imports:
+    subprocess
+    sys
+    from os: getcwd, sep
+    from os.path: abspath, dirname, normpath, relpath
+    from testcases_executor.tc_utils: raise_error
+    from testcases_executor.tc_cache: load_cache, save_cache
+"""
+import subprocess
+import sys
+from os import getcwd, sep
+from os.path import abspath, dirname, normpath, relpath
+from testcases_executor.tc_utils import raise_error
+from testcases_executor.tc_cache import load_cache, save_cache
+
+MONITORING = getattr(sys, 'monitoring', None)
+PACKAGE_DIR = dirname(abspath(__file__))
+
+
+class ImpactTracer():
+    """
+    A class to record source files runned by each test.
+
+    With sys.monitoring, each code object reports its file once by test,
+    then its event is disabled until next test. Else, a sys.settrace
+    function records file of each call without tracing lines. Only the
+    thread running tests is traced with sys.settrace .
+
+    Attributes
+    ----------
+    files: set or None
+        files runned by current test, None between tests.
+    tests: dict
+        {test id: files runned} of tests recorded.
+    monitored: bool
+        current test recorded with sys.monitoring .
+    previous: function or None
+        trace function replaced with sys.settrace, restored after test.
+
+    Methods
+    ----------
+    code_started(code, offset):
+        Record file of a code started, disable event until next test.
+    trace_call(frame, event, arg):
+        Record file of a function called, without tracing its lines.
+    start_test():
+        Start recording files runned by a test.
+    stop_test(test):
+        Stop recording and keep files runned by test.
+    """
+
+    def __init__(self):
+        """
+        Init tracer without test recorded.
+        """
+        self.files = None
+        self.tests = {}
+        self.monitored = False
+        self.previous = None
+
+    def code_started(self, code, offset):  # pylint: disable=unused-argument
+        """
+        Record file of a code started, disable event until next test.
+
+        Parameters
+        ----------
+            code: code
+                code object started.
+            offset: int
+                instruction offset.
+
+        Return
+        ----------
+            object
+                sys.monitoring.DISABLE .
+        """
+        self.files.add(code.co_filename)
+        return MONITORING.DISABLE
+
+    def trace_call(self, frame, event, arg):  # pylint: disable=unused-argument
+        """
+        Record file of a function called, without tracing its lines.
+
+        Parameters
+        ----------
+            frame: frame
+                frame of function called.
+            event: str
+                'call' for a new frame.
+            arg: None
+                not used.
+        """
+        if event == 'call':
+            self.files.add(frame.f_code.co_filename)
+
+    def start_test(self):
+        """
+        Start recording files runned by a test.
+
+        sys.monitoring is used if its coverage tool is free (not used by
+        coverage.py), else sys.settrace .
+        """
+        self.files = set()
+        tool_id = getattr(MONITORING, 'COVERAGE_ID', None)
+        self.monitored = (
+            MONITORING is not None and MONITORING.get_tool(tool_id) is None)
+        if self.monitored:
+            MONITORING.use_tool_id(tool_id, 'testcases_executor')
+            MONITORING.register_callback(
+                tool_id, MONITORING.events.PY_START, self.code_started)
+            MONITORING.set_events(tool_id, MONITORING.events.PY_START)
+            MONITORING.restart_events()  # codes disabled by previous test
+        else:
+            self.previous = sys.gettrace()
+            sys.settrace(self.trace_call)
+
+    def stop_test(self, test):
+        """
+        Stop recording and keep files runned by test.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+        """
+        if self.files is None:  # not started
+            return
+        if self.monitored:
+            tool_id = MONITORING.COVERAGE_ID
+            MONITORING.set_events(tool_id, 0)
+            MONITORING.register_callback(
+                tool_id, MONITORING.events.PY_START, None)
+            MONITORING.free_tool_id(tool_id)
+        else:
+            sys.settrace(self.previous)
+            self.previous = None
+        self.tests[test.id()] = self.files
+        self.files = None
+
+
+def project_files(files):
+    """
+    Return files of the project, relative to current directory.
+
+    Files of python, installed packages and testcases_executor are not in
+    current directory or ignored.
+
+        Parameters:
+            files (set): paths of files runned, as in code objects.
+
+        Returns:
+            set: normalized relative paths.
+    """
+    root = getcwd()
+    kept = set()
+    for path in files:
+        if path.startswith('<'):  # <frozen ...>, <string>
+            continue
+        path = abspath(path)
+        if path.startswith(PACKAGE_DIR + sep) or not path.startswith(
+                root + sep):
+            continue
+        kept.add(normpath(relpath(path, root)))
+    return kept
+
+
+def load_impact():
+    """
+    Load and return index of tests runned by each file, from previous runs.
+
+        Returns:
+            dict: {file's relative path: [test ids]}.
+    """
+    return load_cache('impact.json', {})
+
+
+def save_impact(tests):
+    """
+    Update index of tests runned by each file with tests recorded, save it.
+
+    Tests recorded replace their previous files, other tests are kept.
+
+        Parameters:
+            tests (dict): {test id: files runned} from ImpactTracer .
+    """
+    index = {
+        path: [test_id for test_id in test_ids if test_id not in tests]
+        for path, test_ids in load_impact().items()}
+    for test_id, files in tests.items():
+        for path in project_files(files):
+            index.setdefault(path, []).append(test_id)
+    save_cache('impact.json', {
+        path: sorted(test_ids) for path, test_ids in sorted(index.items())
+        if test_ids})
+
+
+def changed_files(paths):
+    """
+    Return changed files, given or changed in git working tree.
+
+        Parameters:
+            paths (list): files's paths, or ['git-diff'] for files changed
+                since last commit (git diff HEAD).
+
+        Returns:
+            set: normalized relative paths.
+
+        Raises:
+            ValueError: git diff failed.
+    """
+    if paths == ['git-diff']:
+        try:
+            paths = subprocess.run(
+                ['git', 'diff', '--name-only', '--relative', 'HEAD'],
+                capture_output=True, text=True, check=True).stdout.splitlines()
+        except (OSError, subprocess.CalledProcessError) as error:
+            raise_error(ValueError, f"git diff failed: {error}")
+    return {normpath(path) for path in paths}
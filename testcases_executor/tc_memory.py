@@ -0,0 +1,134 @@
+"""
+Module testcases_executor.tc_memory
+
+Contain necessary class and function to measure memory used by each test.
+
+Classes:
+    MemoryTracer
+
+Functions:
+    current_rss()
+
+Imports:
+    tracemalloc
+    from mmap: PAGESIZE
+"""
+import tracemalloc
+from mmap import PAGESIZE
+
+
+def current_rss():
+    """
+    Return resident set size of the process, read in /proc (Linux).
+
+        Returns:
+            int or None: RSS in bytes, None if unknown.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as statm:
+            return int(statm.read().split()[1]) * PAGESIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class MemoryTracer():
+    """
+    A class to measure peak of memory allocated and RSS growth of tests.
+
+    Used as context manager around a testcase's suite, tracemalloc traces
+    allocations with one frame only, cheapest setting. Peak is the max of
+    memory allocated by python since test started, RSS growth includes
+    other allocations (C extensions...) but not memory already reserved.
+
+    Attributes
+    ----------
+    active: bool
+        measure memory of tests.
+    started: bool
+        tracemalloc started by tracer, stopped at exit.
+    t_traced: int
+        memory traced when current test started, in bytes.
+    t_rss: int or None
+        RSS when current test started, in bytes.
+
+    Methods
+    ----------
+    __enter__():
+        Start tracemalloc if not already tracing.
+    __exit__(*exc_infos):
+        Stop tracemalloc if started by tracer.
+    start_test():
+        Reset peak of memory traced and keep start values.
+    measure():
+        Return peak of memory allocated and RSS growth since test started.
+    """
+
+    def __init__(self, active=False):
+        """
+        Set tracer, measuring only if active.
+
+        Parameters
+        ----------
+            active: bool (default: False)
+                measure memory of tests.
+        """
+        self.active = active
+        self.started = False
+        self.t_traced = 0
+        self.t_rss = None
+
+    def __enter__(self):
+        """
+        Start tracemalloc if not already tracing.
+
+        Return
+        ----------
+            self
+        """
+        if self.active and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+        return self
+
+    def __exit__(self, *exc_infos):
+        """
+        Stop tracemalloc if started by tracer.
+
+        Parameters
+        ----------
+            exc_infos: tuple
+                exception type, value and traceback, or None.
+        """
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def start_test(self):
+        """
+        Reset peak of memory traced and keep start values.
+
+        Without tracemalloc.reset_peak (python < 3.9), traces are cleared.
+        """
+        if not self.active:
+            return
+        getattr(tracemalloc, 'reset_peak', tracemalloc.clear_traces)()
+        self.t_traced = tracemalloc.get_traced_memory()[0]
+        self.t_rss = current_rss()
+
+    def measure(self):
+        """
+        Return peak of memory allocated and RSS growth since test started.
+
+        Return
+        ----------
+            tuple
+                peak in bytes, RSS growth in bytes (None if unknown), or
+                None, None if not active.
+        """
+        if not self.active:
+            return None, None
+        peak = tracemalloc.get_traced_memory()[1] - self.t_traced
+        rss = current_rss()
+        if rss is None or self.t_rss is None:
+            return peak, None
+        return peak, rss - self.t_rss
@@ -0,0 +1,513 @@
+"""
+Module testcases_executor.tc_merge
+
+Contain necessary classes and functions to save results in json files, or
+in a journal as tests complete, and rebuild groups from them, runned by
+TestCasesRunner to merge them in one.
+
+Classes:
+    Journal
+    RecordedTestCase
+    RecordedSuite
+    RecordedGroup
+    RecordedGroups
+
+Functions:
+    save_result(result, path)
+    read_journal(path)
+    load_journal(path)
+    load_outcomes(path)
+
+Variables:
+    OUTCOME_KEYS: list
+        keys of a test's outcome in a journal's line, in outcome's order.
+
+Imports:
+    atexit
+    json
+    threading
+    from datetime: datetime
+    from os.path: getmtime
+"""
+import atexit
+import json
+import threading
+from datetime import datetime
+from os.path import getmtime
+
+OUTCOME_KEYS = [
+    'status', 'duration', 'err', 'cpu', 'parts', 'mem_peak', 'mem_rss']
+
+
+def save_result(result, path):
+    """
+    Save tests runned in result, with their outcomes, in a json file.
+
+    File content is {'start_time': iso format, 'groups': [[group's name, [
+    [testcase's qualname, module, [[name, doc, status, duration, err], ...],
+    [[status, description, err, parent's name], ...]], ...]], ...]}, lists
+    to keep it small and fast to load. Errors without record (setUpClass,
+    subtests...) are saved with their testcase, parent's name of a subtest
+    failing its test else None.
+
+        Parameters:
+            result (TestCasesResult): result of runned tests.
+            path (str): path of json file.
+    """
+    all_tests = [  # get outcomes in one time for all tests
+        t_method for group, tc_tup in result.test_methods
+        for testcase, t_methods in tc_tup for t_method in t_methods]
+    outcomes = iter(result.get_outcomes(all_tests))
+    groups = []
+    for group, tc_tup in result.test_methods:
+        g_testcases = []
+        for testcase, t_methods in tc_tup:
+            tc_tests = []
+            for t_method in t_methods:
+                outcome = next(outcomes)
+                if outcome is not None:  # runned
+                    tc_tests.append([
+                        t_method._testMethodName, t_method._testMethodDoc,
+                        *outcome])
+            tc_errors = [
+                [status, description, err, None if index is None else
+                 t_methods[index]._testMethodName]
+                for status, description, err, index in (
+                    result.unrecorded.get(testcase, []))]
+            g_testcases.append([
+                testcase.__qualname__, testcase.__module__, tc_tests,
+                tc_errors])
+        groups.append([group.name, g_testcases])
+    with open(path, 'w') as json_file:
+        json.dump({
+            'start_time': result.start_time.isoformat(), 'groups': groups},
+            json_file, separators=(',', ':'))
+
+
+class Journal():
+    """
+    A class to write a json line by test completed in a journal file.
+
+    The first line is {"start_time": iso format}, then a line by test with
+    its id, group, module, testcase, name, doc and outcome, or by error
+    without record with its description instead of id. Lines are kept
+    in a buffer written when bigger than flush_size or, by a timer thread,
+    flush_interval seconds after the first line kept. So a run killed (OOM,
+    CI timeout) loses only its last lines, and the journal can be read by
+    other tools during the run.
+
+    Attributes
+    ----------
+    file: file
+        journal file, opened in write mode.
+    buffer: list
+        lines not yet written.
+    size: int
+        number of characters in buffer.
+    flush_size: int
+        characters in buffer written at once.
+    flush_interval: float
+        max seconds a line is kept in buffer.
+    timer: threading.Timer or None
+        flush buffer after flush_interval.
+    lock: threading.Lock
+        protect buffer and file shared with timer.
+
+    Methods
+    ----------
+    write(datas):
+        Add a json line to buffer, flush it if needed or start timer.
+    write_test(test, group, outcome):
+        Write a line with a test's outcome.
+    write_error(testcase, group, error, parent):
+        Write a line with an error without record of a testcase.
+    flush():
+        Write lines in buffer and flush file.
+    close():
+        Flush and close file, called at exit if not closed.
+    """
+
+    def __init__(
+            self, path, start_time, flush_size=65536, flush_interval=1.0):
+        """
+        Open journal file and write start time.
+
+        Parameters
+        ----------
+            path: str
+                path of journal file, json lines.
+            start_time: datetime
+                start time of tests.
+            flush_size: int (default: 65536)
+                characters in buffer written at once.
+            flush_interval: float (default: 1.0)
+                max seconds a line is kept in buffer.
+        """
+        self.file = open(path, 'w')
+        self.buffer = []
+        self.size = 0
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.timer = None
+        self.lock = threading.Lock()
+        atexit.register(self.close)  # crashed run, lines in buffer kept
+        self.write({'start_time': start_time.isoformat()})
+        self.flush()  # journal readable with a start time at once
+
+    def write(self, datas):
+        """
+        Add a json line to buffer, flush it if needed or start timer.
+
+        Parameters
+        ----------
+            datas: dict
+                serialized in a json line.
+        """
+        line = json.dumps(datas, separators=(',', ':')) + '\n'
+        with self.lock:
+            self.buffer.append(line)
+            self.size += len(line)
+            if self.size < self.flush_size:
+                if self.timer is None:
+                    self.timer = threading.Timer(
+                        self.flush_interval, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+        self.flush()
+
+    def write_test(self, test, group, outcome):
+        """
+        Write a line with a test's outcome.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+            group: TestCasesGroup or None
+                group of test.
+            outcome: tuple
+                outcome returned by TestCasesResult.get_outcomes .
+        """
+        testcase = test.__class__
+        datas = {
+            'id': test.id(), 'group': getattr(group, 'name', None),
+            'module': testcase.__module__, 'testcase': testcase.__qualname__,
+            'name': test._testMethodName, 'doc': test._testMethodDoc}
+        datas.update(zip(OUTCOME_KEYS, outcome))
+        self.write(datas)
+
+    def write_error(self, testcase, group, error, parent):
+        """
+        Write a line with an error without record of a testcase.
+
+        Parameters
+        ----------
+            testcase: unittest.TestCase subclass
+                testcase of error.
+            group: TestCasesGroup or None
+                group of testcase.
+            error: tuple
+                status, description and formatted error.
+            parent: str or None
+                name of test failed by this subtest, else None.
+        """
+        status, description, err = error
+        self.write({
+            'group': getattr(group, 'name', None),
+            'module': testcase.__module__, 'testcase': testcase.__qualname__,
+            'description': description, 'status': status, 'err': err,
+            'parent': parent})
+
+    def flush(self):
+        """
+        Write lines in buffer and flush file.
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.buffer and not self.file.closed:
+                self.file.write(''.join(self.buffer))
+                self.file.flush()
+            self.buffer, self.size = [], 0
+
+    def close(self):
+        """
+        Flush and close file, called at exit if not closed.
+        """
+        self.flush()
+        self.file.close()
+        atexit.unregister(self.close)
+
+
+def read_journal(path):
+    """
+    Yield datas of each line of a journal.
+
+    A line not complete (run killed while writing it) is ignored.
+
+        Parameters:
+            path (str): path of journal file.
+
+        Yields:
+            dict: start time, then id, group, testcase... of a test.
+    """
+    with open(path, 'r') as journal_file:
+        for line in journal_file:
+            try:
+                yield json.loads(line)
+            except ValueError:  # truncated
+                continue
+
+
+def load_journal(path):
+    """
+    Load a journal and return its datas like a json file saved by --json .
+
+    A journal whose first line was lost has no start time (None).
+
+        Parameters:
+            path (str): path of journal file.
+
+        Returns:
+            dict: {'start_time': iso format or None, 'groups': [[group's
+                name, [[testcase's qualname, module, [[name, doc, *outcome]
+                , ...], [[status, description, err, parent's name], ...]],
+                ...]], ...]}.
+    """
+    start_time, groups = None, {}
+    for datas in read_journal(path):
+        if 'start_time' in datas:
+            start_time = datas['start_time']
+            continue
+        testcases = groups.setdefault(datas['group'], {})
+        tests, errors = testcases.setdefault(
+            (datas['testcase'], datas['module']), ([], []))
+        if 'description' in datas:  # error without record
+            errors.append([
+                datas['status'], datas['description'], datas['err'],
+                datas['parent']])
+        else:
+            tests.append([datas['name'], datas['doc']] + [
+                datas.get(key) for key in OUTCOME_KEYS])
+    return {'start_time': start_time, 'groups': [
+        [g_name, [[*tc_key, *tc_datas] for tc_key, tc_datas in (
+            testcases.items())]] for g_name, testcases in groups.items()]}
+
+
+def load_outcomes(path):
+    """
+    Load outcomes of tests completed in a journal, used to resume its run.
+
+        Parameters:
+            path (str): path of journal file.
+
+        Returns:
+            dict: {test id: [status, duration, err, cpu, parts, mem_peak,
+                mem_rss]}.
+    """
+    return {
+        datas['id']: [datas.get(key) for key in OUTCOME_KEYS]
+        for datas in read_journal(path) if 'id' in datas}
+
+
+class RecordedTestCase():
+    """
+    A class, base of testcases rebuilt from saved results.
+
+    A subclass with same name and module is created for each saved testcase,
+    its instances represent saved test methods.
+
+    Attributes
+    ----------
+    _testMethodName: str
+        test method's name.
+    _testMethodDoc: str or None
+        test method's docstring.
+
+    Methods
+    ----------
+    id():
+        Return test's id, like unittest.TestCase.id() .
+    """
+    __slots__ = ('_testMethodName', '_testMethodDoc')
+
+    def __init__(self, t_name, t_doc):
+        """
+        Set attributes used in result and report.
+
+        Parameters
+        ----------
+            t_name: str
+                test method's name.
+            t_doc: str or None
+                test method's docstring.
+        """
+        self._testMethodName = t_name
+        self._testMethodDoc = t_doc
+
+    def id(self):
+        """
+        Return test's id, like unittest.TestCase.id() .
+
+        Return
+        ----------
+            str
+                module.qualname.name .
+        """
+        return ".".join([
+            self.__module__, self.__class__.__qualname__,
+            self._testMethodName])
+
+
+class RecordedSuite():
+    """
+    A class to represent a testcase's suite from saved results.
+
+    Attributes
+    ----------
+    _tests: list
+        RecordedTestCase instances, like tests of unittest.TestSuite .
+    outcomes: list
+        (status, duration, err) for each test.
+    errors: list
+        (status, description, err, index) for each error without record,
+        index of test failed by this subtest, else None.
+
+    Methods
+    ----------
+    __call__(result):
+        Add saved outcomes to result, like a runned suite.
+    """
+
+    def __init__(self):
+        """
+        Init an empty suite.
+        """
+        self._tests = []
+        self.outcomes = []
+        self.errors = []
+
+    def __call__(self, result):
+        """
+        Add saved outcomes to result, like a runned suite.
+
+        Errors without record are added after outcomes, a test failed by
+        its subtests counted with them.
+
+        Parameters
+        ----------
+            result: TestCasesResult
+                result updated with outcomes.
+        """
+        parents = {index for *_, index in self.errors if index is not None}
+        for index, (test, outcome) in enumerate(
+                zip(self._tests, self.outcomes)):
+            result.add_outcome(test, *outcome, subtests=index in parents)
+        for status, description, err, index in self.errors:
+            result.add_unrecorded_error(
+                status, description, err,
+                None if index is None else self._tests[index])
+
+
+class RecordedGroup():
+    """
+    A class to represent a group from saved results.
+
+    Attributes
+    ----------
+    name: str
+        group's name.
+    suites: list
+        [(testcase, RecordedSuite), ...] like TestCasesGroup.suites .
+    resumed: dict
+        empty, like TestCasesGroup without --resume .
+    timeout, testcase_timeout, stall: None
+        like TestCasesGroup, saved tests are not runned.
+    """
+
+    def __init__(self, name):
+        """
+        Init group without suite.
+
+        Parameters
+        ----------
+            name: str
+                group's name.
+        """
+        self.name = name
+        self.suites = []
+        self.resumed = {}
+        self.timeout, self.testcase_timeout, self.stall = None, None, None
+
+
+class RecordedGroups(list):
+    """
+    A class to represent a list of RecordedGroup object, from json files.
+
+    Groups, testcases and tests are merged by names in order of appearance.
+    A test saved in several files keeps the outcome of the last one, a
+    testcase the errors without record of the last one. A journal without
+    start time is dated by its last write, if no file has a start time.
+
+    Attributes
+    ----------
+    start_time: datetime
+        first start time of saved results.
+    """
+
+    def __init__(self, paths):
+        """
+        Load json files and construct groups, testcases and suites.
+
+        Parameters
+        ----------
+            paths: list
+                paths of json files maked with save_result, or journals
+                (.jsonl) written by Journal.
+        """
+        super().__init__()
+        merged = {}  # {g_name: {(module, qualname): [{t_name: [doc, ...]},
+        start_times = []  # errors]}}
+        for path in paths:
+            if path.endswith('.jsonl'):
+                datas = load_journal(path)
+            else:
+                with open(path, 'r') as json_file:
+                    datas = json.load(json_file)
+            if datas['start_time'] is not None:  # else journal's line lost
+                start_times.append(
+                    datetime.fromisoformat(datas['start_time']))
+            for g_name, g_testcases in datas['groups']:
+                testcases = merged.setdefault(g_name, {})
+                for tc_qualname, tc_module, tc_tests, *tc_errors in (
+                        g_testcases):  # no errors in files of old versions
+                    tc_datas = testcases.setdefault(
+                        (tc_module, tc_qualname), [{}, []])
+                    for t_name, *t_datas in tc_tests:
+                        tc_datas[0][t_name] = t_datas
+                    if tc_errors and (tc_errors[0] or tc_tests):  # runned
+                        tc_datas[1] = tc_errors[0]
+        if not start_times:
+            start_times = [datetime.fromtimestamp(getmtime(paths[-1]))]
+        self.start_time = min(start_times)
+        for g_name, testcases in merged.items():
+            group = RecordedGroup(g_name)
+            for (tc_module, tc_qualname), (tests, errors) in (
+                    testcases.items()):
+                testcase = type(tc_qualname.split('.')[-1], (
+                    RecordedTestCase, ), {
+                        '__module__': tc_module, '__qualname__': tc_qualname,
+                        '__slots__': ()})
+                suite = RecordedSuite()
+                for t_name, (t_doc, *outcome) in tests.items():
+                    suite._tests.append(testcase(t_name, t_doc))
+                    suite.outcomes.append(outcome)
+                t_names = list(tests)
+                suite.errors = [
+                    (status, description, err, t_names.index(parent) if (
+                        parent in tests) else None)
+                    for status, description, err, parent in errors]
+                group.suites.append((testcase, suite))
+            self.append(group)
@@ -0,0 +1,319 @@
+"""
+Module testcases_executor.tc_parallel
+
+Contain necessary class and functions to run testcases's suites in workers.
+
+Classes:
+    SharedStopResult
+    TestCasesOutcomes
+
+Functions:
+    make_tasks(groups, by_group)
+    schedule_tasks(tasks, durations)
+    init_worker(event, mem, display)
+    run_task(task)
+    run_indexed_task(indexed_task)
+    warm_context(tasks)
+
+Variables:
+    stop_event: multiprocessing.Event or None
+        in a worker with failfast, set by first failure or error of any one.
+    trace_memory: bool
+        in a worker with --mem, measure memory used by each test.
+    test_display: str
+        in a worker, display of tests in output ('tests', 'dots' or
+        'progress' without any).
+
+Imports:
+    from io: StringIO
+    from multiprocessing: get_context, get_all_start_methods
+    from unittest.runner: _WritelnDecorator
+    from testcases_executor.tc_result: TestCasesResult
+    from testcases_executor.tc_cache: tc_id
+    from testcases_executor.tc_watchdog: Watchdog
+    from testcases_executor.tc_memory: MemoryTracer
+"""
+from io import StringIO
+from multiprocessing import get_context, get_all_start_methods
+from unittest.runner import _WritelnDecorator
+from testcases_executor.tc_result import TestCasesResult
+from testcases_executor.tc_cache import tc_id
+from testcases_executor.tc_watchdog import Watchdog
+from testcases_executor.tc_memory import MemoryTracer
+
+stop_event = None
+trace_memory = False
+test_display = 'tests'
+
+
+def make_tasks(groups, by_group=False):
+    """
+    Make tasks with testcases's suites, ordered by declaration.
+
+        Parameters:
+            groups (TestCasesGroups): groups with suites constructed.
+            by_group (bool): a task for each group, else for each testcase.
+
+        Returns:
+            list: tasks, lists of (testcase, names of tests, suite's class,
+                group's settings).
+    """
+    tasks = []
+    for group in groups:
+        settings = (group.timeout, group.testcase_timeout, group.stall)
+        g_testcases = [(testcase, [
+            test._testMethodName for test in suite._tests
+        ], suite.__class__, settings) for testcase, suite in group.suites]
+        if by_group:  # group's testcases runned serially in same worker
+            tasks.append(g_testcases)
+        else:
+            tasks.extend([[tc_item] for tc_item in g_testcases])
+    return tasks
+
+
+def schedule_tasks(tasks, durations):
+    """
+    Index tasks and sort them longest first with durations of previous runs.
+
+    A test without previous duration is expected to last the mean duration.
+
+        Parameters:
+            tasks (list): tasks made by make_tasks, ordered by declaration.
+            durations (dict): {'tests': {test id: duration}, ...}.
+
+        Returns:
+            list: (index of task, task), longest first.
+    """
+    t_durations = durations['tests']
+    default = 0
+    if t_durations:
+        default = sum(t_durations.values()) / len(t_durations)
+
+    def expected_duration(indexed_task):
+        return sum([
+            t_durations.get(f"{tc_id(testcase)}.{t_name}", default)
+            for testcase, t_names, *_ in indexed_task[1]
+            for t_name in t_names])
+
+    return sorted(enumerate(tasks), key=expected_duration, reverse=True)
+
+
+class SharedStopResult(TestCasesResult):
+    """
+    A subclass of TestCasesResult .
+
+    Used in workers, to stop all of them when one stops with failfast.
+
+    Attributes
+    ----------
+    shouldStop: bool
+        True if stopped, in this worker or another one with stop_event.
+    """
+
+    @property
+    def shouldStop(self):
+        """
+        Return True if stopped, in this worker or another one.
+        """
+        return self._should_stop or (
+            stop_event is not None and stop_event.is_set())
+
+    @shouldStop.setter
+    def shouldStop(self, value):
+        """
+        Set stopped, and stop other workers with stop_event.
+
+        Parameters
+        ----------
+            value: bool
+                stopped or not.
+        """
+        self._should_stop = value
+        if value and stop_event is not None:
+            stop_event.set()
+
+
+def init_worker(event, mem, display='tests'):
+    """
+    Set stop_event, trace_memory and test_display in a new worker.
+
+        Parameters:
+            event (multiprocessing.Event or None): shared with failfast.
+            mem (bool): measure memory used by each test.
+            display (str): display of tests, 'tests', 'dots' or 'progress'.
+    """
+    global stop_event, trace_memory, test_display
+    stop_event, trace_memory, test_display = event, mem, display
+
+
+def run_task(task):
+    """
+    Run serially testcases's suites in worker with result writing in buffer.
+
+    With failfast, a stopped testcase is interrupted between tests and next
+    ones are not runned (outcomes None). Errors without record (setUpClass,
+    subtests...) are returned with outcomes.
+
+        Parameters:
+            task (list): tuples (testcase, names of tests, suite's class,
+                group's settings).
+
+        Returns:
+            list: (output written by result, outcomes of tests, errors
+                without record) by testcase.
+    """
+    t_outcomes = []
+    for testcase, t_names, suite_class, settings in task:
+        if stop_event is not None and stop_event.is_set():  # cancelled
+            t_outcomes.append(('', [None] * len(t_names), []))
+            continue
+        stream = _WritelnDecorator(StringIO())
+        result = SharedStopResult(stream)
+        result.failfast = stop_event is not None
+        result.display = test_display  # progress updated by main process
+        suite = suite_class([testcase(t_name) for t_name in t_names])
+        tests = list(suite._tests)
+        result.watchdog = Watchdog(*settings)  # interrupt too long tests
+        result.memory = MemoryTracer(trace_memory)
+        with result.watchdog, result.memory:
+            suite(result)
+        t_outcomes.append((
+            stream.getvalue(), result.get_outcomes(tests),
+            result.get_unrecorded_errors(tests)))
+    return t_outcomes
+
+
+def run_indexed_task(indexed_task):
+    """
+    Run a task and return its outcomes with its index.
+
+        Parameters:
+            indexed_task (tuple): index of task, task.
+
+        Returns:
+            tuple: index of task, list of (output, outcomes, errors) by
+                testcase.
+    """
+    t_index, task = indexed_task
+    return t_index, run_task(task)
+
+
+def warm_context(tasks):
+    """
+    Return a multiprocessing context creating workers already warm.
+
+    With forkserver, the server imports testcases.py and testcases's modules
+    once, then each worker is forked from it with all imported, instead of
+    importing them again in each worker. Without it (Windows), default one.
+
+        Parameters:
+            tasks (list): tasks made by make_tasks.
+
+        Returns:
+            multiprocessing.context.BaseContext: context used to make pool.
+    """
+    if 'forkserver' not in get_all_start_methods():
+        return get_context()
+    modules = ['testcases', 'testcases_executor.tc_parallel']
+    for task in tasks:
+        for testcase, *_ in task:
+            if testcase.__module__ not in modules:
+                modules.append(testcase.__module__)
+    context = get_context('forkserver')
+    context.set_forkserver_preload(modules)
+    return context
+
+
+class TestCasesOutcomes():
+    """
+    A class to get testcases's outcomes from workers, ordered by declaration.
+
+    Tasks are submitted longest first to a pool of processes and complete in
+    any order, outcome completed before previous ones (in declaration order)
+    is kept until all previous are completed.
+
+    Attributes
+    ----------
+    pool: multiprocessing.Pool
+        worker processes, forked from a warm server if possible.
+    stop_event: multiprocessing.Event or None
+        with failfast, set by the first failure or error in workers.
+    unordered: iterator
+        (index, [(output, outcomes, errors), ...]) in order of completion.
+    completed: dict
+        {index: [(output, outcomes, errors), ...]} completed, not returned.
+    index: int
+        index of the next task's outcomes to return.
+    current: list
+        (output, outcomes, errors) of the task being returned, testcase by
+        testcase.
+
+    Methods
+    ----------
+    close():
+        Close the pool and wait for the worker processes to exit.
+    """
+
+    def __init__(
+            self, tasks, jobs, durations, failfast=False, mem=False,
+            display='tests'):
+        """
+        Create the pool and submit all tasks.
+
+        Parameters
+        ----------
+            tasks: list
+                lists of (testcase, names of tests, suite's class, settings).
+            jobs: int
+                number of worker processes.
+            durations: dict
+                durations of tests and testcases from previous runs.
+            failfast: bool (default: False)
+                stop all workers on first failure or error.
+            mem: bool (default: False)
+                measure memory used by each test in workers.
+            display: str (default: 'tests')
+                display of tests in workers's output.
+        """
+        context = warm_context(tasks)
+        self.stop_event = None
+        if failfast:
+            self.stop_event = context.Event()
+        self.pool = context.Pool(
+            jobs, initializer=init_worker,
+            initargs=(self.stop_event, mem, display))
+        self.unordered = self.pool.imap_unordered(
+            run_indexed_task, schedule_tasks(tasks, durations))
+        self.completed = {}
+        self.index = 0
+        self.current = []
+
+    def __iter__(self):
+        """
+        Return self, outcomes are got with next.
+        """
+        return self
+
+    def __next__(self):
+        """
+        Wait until next testcase is completed, keeping others, and return it.
+
+        Return
+        ----------
+            tuple: output, outcomes, errors for the next testcase in
+                declaration order.
+        """
+        while not self.current:
+            while self.index not in self.completed:
+                t_index, t_outcomes = next(self.unordered)
+                self.completed[t_index] = t_outcomes
+            self.current = self.completed.pop(self.index)
+            self.index += 1
+        return self.current.pop(0)
+
+    def close(self):
+        """
+        Close the pool and wait for the worker processes to exit.
+        """
+        self.pool.close()
+        self.pool.join()
@@ -6,15 +6,110 @@ Contain necessary classes to make a parser for groups of TestCases.
 Classes:
     TestCasesHelpFormatter
     TestCasesParser
+    TestCasesMergeParser
+
+Functions:
+    shard_type(value)
+    positive_float(value)
+    positive_int(value)
+    non_negative_int(value)
 
 Imports:
-    from argparse import ArgumentParser, HelpFormatter
+    from argparse import ArgumentParser, ArgumentTypeError, HelpFormatter
     from testcases_executor.tc_utils: MUTED, BOLD, S_RESET
 """
-from argparse import ArgumentParser, HelpFormatter
+from argparse import ArgumentParser, ArgumentTypeError, HelpFormatter
 from testcases_executor.tc_utils import MUTED, BOLD, S_RESET
 
 
+def shard_type(value):
+    """
+    Convert shard argument K/N to a tuple, K index from 1 of N shards.
+
+        Parameters:
+            value (str): K/N .
+
+        Returns:
+            tuple: (K, N) .
+
+        Raises:
+            ArgumentTypeError: not K/N with 1 <= K <= N .
+    """
+    try:
+        k_shard, n_shards = [int(v) for v in value.split('/')]
+    except ValueError:
+        raise ArgumentTypeError(f"must be K/N, not '{value}'")
+    if not 1 <= k_shard <= n_shards:
+        raise ArgumentTypeError(f"K must be between 1 and N, not '{value}'")
+    return k_shard, n_shards
+
+
+def positive_float(value):
+    """
+    Convert argument to a float greater than 0, as group's settings.
+
+        Parameters:
+            value (str): number of seconds.
+
+        Returns:
+            float: value converted.
+
+        Raises:
+            ArgumentTypeError: not a number or not positive.
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise ArgumentTypeError(f"must be a number, not '{value}'")
+    if not number > 0:  # nan not positive
+        raise ArgumentTypeError(f"must be positive, not '{value}'")
+    return number
+
+
+def positive_int(value):
+    """
+    Convert argument to an integer greater than 0.
+
+        Parameters:
+            value (str): number of workers.
+
+        Returns:
+            int: value converted.
+
+        Raises:
+            ArgumentTypeError: not an integer or not positive.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(f"must be an integer, not '{value}'")
+    if number < 1:
+        raise ArgumentTypeError(f"must be positive, not '{value}'")
+    return number
+
+
+def non_negative_int(value):
+    """
+    Convert argument to an integer greater than or equal to 0.
+
+        Parameters:
+            value (str): number of tests displayed, 0 for none.
+
+        Returns:
+            int: value converted.
+
+        Raises:
+            ArgumentTypeError: not an integer or negative.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(f"must be an integer, not '{value}'")
+    if number < 0:
+        raise ArgumentTypeError(f"must not be negative, not '{value}'")
+    return number
+
+
 class TestCasesHelpFormatter(HelpFormatter):
     """
     A subclass of argparse.HelpFormatter .
@@ -114,6 +209,8 @@ class TestCasesParser(ArgumentParser):
         Add default options arguments.
     add_args_groups:
         Add groups of arguments for each TestCasesGroup.
+    parse_args:
+        Parse arguments, exit with error if options are incompatible.
     """
 
     def __init__(self, tc_groups):
@@ -143,11 +240,123 @@ class TestCasesParser(ArgumentParser):
         ----------
             o, open : store_true
                 arg to open html report in browser after tests.
+            j, jobs : int (default: 1)
+                number of worker processes used to run testcases.
+            by-group : store_true
+                arg to run groups concurrently, testcases of a group serially.
+            shared-loop : store_true
+                arg to run async testcase's tests on one event loop.
+            shard : K/N (default: None)
+                run only testcases of shard K of N.
+            shard-durations : str (default: None)
+                path of json file with tests's durations balancing shards.
+            json : str (default: None)
+                path of json file where result is saved, to merge it later.
+            failfast : store_true
+                arg to stop on first failure or error, in all workers.
+            timeout : float (default: None)
+                max duration in seconds of each test.
+            testcase-timeout : float (default: None)
+                max duration in seconds of all tests of each testcase.
+            stall : float (default: None)
+                duration in seconds between stacks dumps of a running test.
+            mem : store_true
+                arg to measure memory used by each test.
+            journal : str (default: None)
+                path of json lines file written as tests complete.
+            resume : str (default: None)
+                path of an interrupted run's journal, its tests not runned.
+            history : store_true
+                arg to record run in a sqlite history of runs.
+            durations : int (default: 0)
+                number of slowest tests and testcases displayed.
+            last-failed : store_const (dest: failed)
+                arg to run only tests failed in previous runs.
+            failed-first : store_const (dest: failed)
+                arg to run tests failed in previous runs first.
+            record-impact : store_true
+                arg to record source files runned by each test.
+            affected-by : list (default: None)
+                changed files, or git-diff, to run only tests affected.
+            q, quiet : store_const (dest: display)
+                arg to display a character by test.
+            progress : store_const (dest: display)
+                arg to display a progress line updated.
         """
         self._optionals.title = "Options"  # title for options
         self.add_argument(  # arg to open report diretly in browser
             "-o", "--open", action='store_true',
             help="Open html report in browser after tests.")
+        self.add_argument(  # arg to run testcases in worker processes
+            "-j", "--jobs", type=positive_int, default=1,
+            help="Run testcases in N worker processes.")
+        self.add_argument(  # arg to keep group's testcases in same worker
+            "--by-group", action='store_true',
+            help="Run each group's testcases serially in the same worker.")
+        self.add_argument(  # arg to share event loop between async tests
+            "--shared-loop", action='store_true',
+            help="Run IsolatedAsyncioTestCase's tests on one event loop.")
+        self.add_argument(  # arg to run a part of testcases
+            "--shard", type=shard_type, default=None,
+            help="Run only testcases of shard K/N (e.g. 2/8).")
+        self.add_argument(  # arg to balance shards, same on all machines
+            "--shard-durations", metavar="PATH", default=None,
+            help="Balance shards with tests's durations of a json file.")
+        self.add_argument(  # arg to save result for merge command
+            "--json", metavar="PATH", default=None,
+            help="Save result in a json file, to merge it later.")
+        self.add_argument(  # arg to stop on first failure or error
+            "--failfast", action='store_true',
+            help="Stop on first failure or error.")
+        self.add_argument(  # arg to interrupt a too long test
+            "--timeout", metavar="SECONDS", type=positive_float, default=None,
+            help="Interrupt a test running longer, recorded as error.")
+        self.add_argument(  # arg to interrupt a too long testcase
+            "--testcase-timeout", metavar="SECONDS", type=positive_float,
+            default=None,
+            help="Interrupt testcase's tests running longer, as errors.")
+        self.add_argument(  # arg to dump stacks of a stalled test
+            "--stall", metavar="SECONDS", type=positive_float, default=None,
+            help="Dump stacks of a test running longer, every SECONDS.")
+        self.add_argument(  # arg to measure memory used by tests
+            "--mem", action='store_true',
+            help="Measure memory peak and RSS growth of each test.")
+        self.add_argument(  # arg to write tests outcomes as they complete
+            "--journal", metavar="PATH", default=None,
+            help="Write a json line by test completed, during the run.")
+        self.add_argument(  # arg to skip tests completed by previous run
+            "--resume", metavar="PATH", default=None,
+            help="Run only tests not completed in a run's journal.")
+        self.add_argument(  # arg to keep tests outcomes of each run
+            "--history", action='store_true',
+            help="Record run and its tests in a sqlite history of runs.")
+        self.add_argument(  # arg to rank tests by duration
+            "--durations", metavar="N", type=non_negative_int, default=0,
+            help="Display the N slowest tests and testcases.")
+        self.add_argument(  # arg to run again only failed tests
+            "--last-failed", action='store_const', dest='failed',
+            const='last', default=None,
+            help="Run only tests failed in previous runs, all if none.")
+        self.add_argument(  # arg to run failed tests before others
+            "--failed-first", action='store_const', dest='failed',
+            const='first',
+            help="Run tests failed in previous runs first, then others.")
+        self.add_argument(  # arg to record files runned by tests
+            "--record-impact", action='store_true',
+            help="".join([
+                "Record source files runned by each test, in main process ",
+                "(not gathered async tests)."]))
+        self.add_argument(  # arg to run only tests affected by changes
+            "--affected-by", metavar="FILE", nargs='+', default=None,
+            help="Run only tests runned files changed, git-diff for git's.")
+        self.add_argument(  # arg to display a character by test
+            "-q", "--quiet", action='store_const', dest='display',
+            const='dots', default='tests',
+            help="Display a character by test, not its line.")
+        self.add_argument(  # arg to display only a progress line
+            "--progress", action='store_const', dest='display',
+            const='progress',
+            help="Display a progress line updated, not tests's lines.")
 
     def add_args_groups(self, tc_groups):
         """
@@ -175,3 +384,61 @@ class TestCasesParser(ArgumentParser):
                 arg_group.add_argument(  # arg with testcase's name
                     f"-{tc.__name__}", help=f"{' '.join(t_names)}",
                     nargs='*', choices=t_names)  # tests's names for params
+
+    def parse_args(self, args=None, namespace=None):
+        """
+        Parse arguments, exit with error if options are incompatible.
+
+        Parameters
+        ----------
+            args : list or None (default: None)
+                arguments, sys.argv[1:] if None.
+            namespace : argparse.Namespace or None (default: None)
+                object where arguments are set.
+
+        Return
+        ----------
+            argparse.Namespace
+                parsed arguments.
+        """
+        parsed = super().parse_args(args, namespace)
+        if parsed.by_group and parsed.jobs < 2:  # no worker, no group's one
+            self.error("argument --by-group: needs -j N with N > 1")
+        if parsed.record_impact and parsed.jobs > 1:  # tests in main process
+            self.error("".join([
+                "argument --record-impact: not allowed with -j N, tests ",
+                "are runned in main process"]))
+        return parsed
+
+
+class TestCasesMergeParser(ArgumentParser):
+    """
+    A subclass of argparse.ArgumentParser .
+
+    A custom ArgumentParser for merge command, after 'merge' in command line.
+    """
+
+    def __init__(self):
+        """
+        Init Parser and add arguments.
+
+        Arguments
+        ----------
+            files : nargs (+)
+                paths of json files saved with --json or --journal .
+            o, open : store_true
+                arg to open html report in browser after merge.
+        """
+        super().__init__(
+            formatter_class=TestCasesHelpFormatter, description=''.join([
+                'Merge results saved with --json or --journal by several ',
+                'runs, in one ',
+                'html report.']),
+            epilog="-\n", allow_abbrev=False)
+        self._optionals.title = "Options"  # title for options
+        self.add_argument(  # saved results
+            "files", nargs='+',
+            help="Json files saved with --json, or journals (.jsonl).")
+        self.add_argument(  # arg to open report diretly in browser
+            "-o", "--open", action='store_true',
+            help="Open html report in browser after merge.")
@@ -7,16 +7,31 @@ Classes:
     ContextInfos
     ContextHeader
     ContextGroup
+    ContextTestCase
     ContextMethod
+    ContextError
     ContextReport
 
-Functions:
-    make_errors_dict
+Variables:
+    STATUS_CONTEXTS: dict
+        {status: (status's name, Fontawesome icon, bootstrap4 color)}.
 
 Imports:
-    from testcases_executor.tc_utils: format_duration
+    from testcases_executor.tc_utils: (
+        format_duration, format_timing, format_memory)
+    from testcases_executor.tc_cache: load_stalls
 """
-from testcases_executor.tc_utils import format_duration
+from testcases_executor.tc_utils import (
+    format_duration, format_timing, format_memory)
+from testcases_executor.tc_cache import load_stalls
+
+STATUS_CONTEXTS = {
+    'success': ("SUCCESS", 'thumbs-o-up', 'success'),
+    'failed': ("FAIL", 'thumbs-o-down', 'warning'),
+    'errors': ("ERROR", 'times-circle', 'danger'),
+    'skipped': ("SKIP", 'cut', 'info'),
+    'expectedFails': ("Expected Fail", 'stop-circle-o', 'danger'),
+    'unexpectedSuccesses': ("Unexpected Success", 'hand-stop-o', 'success')}
 
 
 class ContextInfos(dict):
@@ -103,9 +118,12 @@ class ContextGroup(ContextInfos):
         group's name.
     testcases: list
         ContextTestCase objects.
+    stats: dict
+        {'p50': duration formated, ..., 'max': ...} of tests's durations.
     """
 
-    def __init__(self, g_name, status, n_tests, duration, testcases):
+    def __init__(
+            self, g_name, status, n_tests, duration, testcases, stats=None):
         """
         Init ContextInfos and add value for start_time key.
 
@@ -121,9 +139,14 @@ class ContextGroup(ContextInfos):
                 duration of all group's tests in second.
             testcases: list
                 ContextTestCase objects.
+            stats: dict or None (default: None)
+                percentiles of tests's durations, by duration_stats .
         """
         super().__init__(status, n_tests, duration)
-        self.update({'name': g_name, 'testcases': testcases})
+        self.update({
+            'name': g_name, 'testcases': testcases, 'stats': {
+                name: format_duration(stat)
+                for name, stat in (stats or {}).items()}})
 
 
 class ContextTestCase(dict):
@@ -142,9 +165,11 @@ class ContextTestCase(dict):
         ContextMethod objects.
     duration: str
         duration formated in second or millisecond.
+    errors: list
+        ContextError objects, errors without record (setUpClass...).
     """
 
-    def __init__(self, tc_name, tc_module, duration, t_methods):
+    def __init__(self, tc_name, tc_module, duration, t_methods, errors=None):
         """
         Init dict and update with parameters.
 
@@ -158,11 +183,13 @@ class ContextTestCase(dict):
                 duration of all testcase's tests in second.
             t_methods: list
                 ContextMethod objects.
+            errors: list or None (default: None)
+                ContextError objects.
         """
         super().__init__()
         self.update({
             'name': tc_name, 'module': tc_module, 't_methods': t_methods,
-            'duration': format_duration(duration)})
+            'duration': format_duration(duration), 'errors': errors or []})
 
 
 class ContextMethod(dict):
@@ -183,80 +210,99 @@ class ContextMethod(dict):
         test method's name.
     doc: str
         test method's docstring.
+    error: str or None
+        formatted error or skip reason.
     duration: str
         duration formated in second or millisecond.
+    timing: str
+        durations of setUp, test, tearDown, cleanup and CPU time, or empty.
+    memory: str
+        peak of memory allocated and RSS growth, or empty without --mem.
+    mem_peak: int or None
+        peak of memory allocated in bytes, used to sort tests.
+    stall: str or None
+        stacks dumped while test was stalled.
+    same_error: str or None
+        testcase.test displayed with same traceback, not repeated.
     """
 
-    def __init__(self, t_method, duration, t_errors):
+    def __init__(self, t_method, record, stall=None, same_error=None):
         """
-        Init dict, add status values by checking errors lists and update.
+        Init dict, add status values with test's record and update.
 
         Parameters
         ----------
             t_method: TestCase's method
                 original test method used to construct self.
-            duration: float
-                duration of all tests in second.
-            t_errors: dict
-                key t_method -> error, key errors failures... -> list tests.
+            record: TestRecord
+                test's outcome, status, duration, error, timing and memory.
+            stall: str or None (default: None)
+                stacks dumped while test was stalled.
+            same_error: str or None (default: None)
+                testcase.test displayed with same traceback.
         """
         super().__init__()
-        if t_method in t_errors['failures']:
-            self.update({
-                'status_name': "FAIL", 'status_icon': "thumbs-o-down",
-                'status_color': "warning", 'error': t_errors[t_method]})
-        elif t_method in t_errors['errors']:
-            self.update({
-                'status_name': "ERROR", 'status_icon': "times-circle",
-                'status_color': "danger", 'error': t_errors[t_method]})
-        elif t_method in t_errors['skipped']:
-            self.update({
-                'status_name': "SKIP", 'status_icon': "cut",
-                'status_color': "info", 'error': t_errors[t_method]})
-        elif t_method in t_errors['exp_fails']:
-            self.update({
-                'status_name': "Expected Fail", 'status_icon': "stop-circle-o",
-                'status_color': "danger", 'error': t_errors[t_method]})
-        else:
-            self.update({'status_color': 'success', 'error': None})
-            if t_method in t_errors['unex_suc']:
-                self.update({
-                    'status_name': "Unexpected Success",
-                    'status_icon': 'hand-stop-o'})
-            else:
-                self.update({
-                    'status_name': "SUCCESS", 'status_icon': 'thumbs-o-up'})
+        status_name, status_icon, status_color = STATUS_CONTEXTS[
+            record.status]
         self.update({
+            'status_name': status_name, 'status_icon': status_icon,
+            'status_color': status_color, 'error': record.err,
             'name': t_method._testMethodName, 'doc': t_method._testMethodDoc,
-            'duration': format_duration(duration)})
+            'duration': format_duration(record.duration),
+            'timing': format_timing(record.parts, record.cpu),
+            'memory': format_memory(record.mem_peak, record.mem_rss),
+            'mem_peak': record.mem_peak, 'stall': stall,
+            'same_error': same_error})
 
 
-def make_errors_dict(failures, errors, skipped, expFails, unexpSucc):
+class ContextError(dict):
     """
-    Construct t_errors dict used to init ContextMethod in init ContextReport.
+    A subclass of dict.
 
-    Parameters
-    ----------
-        failures, errors, skipped, expFails, unexpSucc: lists
-            errors list from result
+    Represent an error without record (setUpClass, setUpModule, subtest...)
+    with datas needed in template error_line.html .
 
-    Return
+    Keys - Values
     ----------
-        t_errors: dict
-            key t_method -> error, key errors failures... -> list tests.
+    status_name: str
+        FAIL or ERROR.
+    status_icon: str
+        name of Fontawesome icon.
+    status_color: str
+        warning or danger (bootstrap4 colors names).
+    name: str
+        error's description, setUpClass (module.TestCase)...
+    anchor: str
+        used in html id, unique in testcase.
+    error: str
+        formatted error.
+    same_error: str or None
+        testcase.test displayed with same traceback, not repeated.
     """
-    t_errors = {}
-    for error_key, errors_list in [
-            ('failures', failures), ('errors', errors),
-            ('skipped', skipped),
-            ('exp_fails', expFails)]:
-        tests = []
-        for test, err in errors_list:
-            tests.append(test)
-            t_errors[test] = err
-        t_errors[error_key] = tests
-    t_errors['unex_suc'] = unexpSucc
-    return t_errors
+
+    def __init__(self, description, status, err, anchor, same_error=None):
+        """
+        Init dict, add status values and update with parameters.
+
+        Parameters
+        ----------
+            description: str
+                error's description.
+            status: str
+                failed or errors.
+            err: str
+                formatted error.
+            anchor: str
+                used in html id, unique in testcase.
+            same_error: str or None (default: None)
+                testcase.test displayed with same traceback.
+        """
+        super().__init__()
+        status_name, status_icon, status_color = STATUS_CONTEXTS[status]
+        self.update({
+            'status_name': status_name, 'status_icon': status_icon,
+            'status_color': status_color, 'name': description,
+            'anchor': anchor, 'error': err, 'same_error': same_error})
 
 
 class ContextReport():
@@ -275,7 +321,7 @@ class ContextReport():
         ContextGroup instances with necessary datas for groups.html .
     """
 
-    def __init__(self, project_name, result):
+    def __init__(self, project_name, result, stalls=True):
         """
         Constructs all attributes context used result object.
 
@@ -285,30 +331,54 @@ class ContextReport():
                 name used in title.
             result: tc_result.TestCasesResult
                 result of tests.
+            stalls: bool (default: True)
+                load stacks dumped for stalled tests, during this run.
         """
         self.title = f"{project_name} Tests Results"  # title
         self.header = ContextHeader(  # header
             result.status['total'], result.start_time,
             result.n_tests['total'], result.durations['total'])
-        t_errors = make_errors_dict(  # errors_dict
-            result.failures, result.errors, result.skipped,
-            result.expectedFailures, result.unexpectedSuccesses)
+        if stalls:  # stacks dumped for stalled tests
+            stalls = load_stalls()
+        seen = {}  # {traceback: first test with it}, displayed once
         self.groups = []  # groups
         for group, tc_tup in result.test_methods:
             g_testcases = []  # group's testcases
             for testcase, t_methods in tc_tup:
                 tc_methods = []  # testcase's methods
                 for t_method in t_methods:
+                    stall = None
+                    if stalls:  # test's id only needed with stalls
+                        stall = stalls.get(t_method.id())
+                    record = result.records[t_method]
+                    same_error = None  # traceback already displayed
+                    if record.err is not None and record.status != 'skipped':
+                        same_error = seen.get(record.err)
+                        if same_error is None:
+                            seen[record.err] = ".".join([
+                                testcase.__name__, t_method._testMethodName])
                     t_context = ContextMethod(
-                        t_method, result.durations['tests'][t_method],
-                        t_errors)
+                        t_method, record, stall, same_error)
                     tc_methods.append(t_context)
+                tc_errors = []  # testcase's errors without record
+                for status, description, err, index in result.unrecorded.get(
+                        testcase, []):
+                    if index is not None:  # displayed with its test
+                        continue
+                    same_error = seen.get(err)
+                    if same_error is None:
+                        seen[err] = description
+                    tc_errors.append(ContextError(
+                        description, status, err, f"error{len(tc_errors)}",
+                        same_error))
                 tc_context = ContextTestCase(
                     testcase.__name__, testcase.__module__,
-                    result.durations['testcases'][testcase], tc_methods)
+                    result.durations['testcases'][testcase], tc_methods,
+                    tc_errors)
                 g_testcases.append(tc_context)
             group_context = ContextGroup(
                 group.name, result.status['groups'][group],
                 result.n_tests['groups'][group],
-                result.durations['groups'][group], g_testcases)
+                result.durations['groups'][group], g_testcases,
+                result.stats['groups'].get(group))
             self.groups.append(group_context)
@@ -29,7 +29,7 @@ class TestCasesHtmlReport():
     Use result to get context datas and with a base template construct file.
     """
 
-    def __init__(self, result, open_in_browser=False):
+    def __init__(self, result, open_in_browser=False, stalls=True):
         """
         Init env, get template base and context to construct report file.
 
@@ -39,13 +39,16 @@ class TestCasesHtmlReport():
                 result of tests.
             open_in_browser: bool (default: False)
                 open or not report in browser.
+            stalls: bool (default: True)
+                show stacks dumped for stalled tests, not for merged
+                results.
         """
         result.stream.writeln("Generating html report ...\n")
         env = Environment(
             loader=PackageLoader('testcases_executor.tc_reporter'),
             autoescape=True)    # load template base
         report_template = env.get_template('report_template.html')
-        context_report = ContextReport(basename(getcwd()), result)
+        context_report = ContextReport(basename(getcwd()), result, stalls)
         with open('./tc_executor_report.html', 'w') as report_file:
             report_file.write(report_template.render(  # html report file
                 title=context_report.title, header=context_report.header,
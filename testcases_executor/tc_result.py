@@ -1,23 +1,151 @@
 """
 Module testcases_executor.tc_result
 
-Contain necessary class to make result for groups of TestCases.
+Contain necessary classes to make result for groups of TestCases.
 
-Class:
+Classes:
+    TestRecord
+    TestDurations
     TestCasesResult
 
+Variables:
+    __unittest: bool
+        frames of timed calls hidden in tracebacks, like unittest's ones.
+
 Imports:
     time
+    from collections.abc: Mapping
+    from datetime: datetime
+    from functools: wraps
     from unittest: TestResult
+    from unittest.case: _SubTest
+    from unittest.suite: _ErrorHolder
     from testcases_executor.tc_utils: (
-        format_duration, GREEN, BLUE, RED, YELLOW, MAGENTA, C_RESET,
-        BOLD, MUTED, S_RESET)
+        format_duration, format_clock, timed_part, format_timing,
+        format_memory, duration_stats, format_stats, GREEN, BLUE, RED,
+        YELLOW, MAGENTA, C_RESET, BOLD, MUTED, S_RESET, STATUSES, DOTS,
+        TEST_PARTS)
+    from testcases_executor.tc_traces: TracebackStore
 """
 import time
+from collections.abc import Mapping
+from datetime import datetime
+from functools import wraps
 from unittest import TestResult
+from unittest.case import _SubTest
+from unittest.suite import _ErrorHolder
 from testcases_executor.tc_utils import (
-    format_duration, GREEN, BLUE, RED, YELLOW, MAGENTA, C_RESET,
-    BOLD, MUTED, S_RESET)
+    format_duration, format_clock, timed_part, format_timing, format_memory,
+    duration_stats, format_stats, GREEN, BLUE, RED, YELLOW, MAGENTA, C_RESET,
+    BOLD, MUTED, S_RESET, STATUSES, DOTS, TEST_PARTS)
+from testcases_executor.tc_traces import TracebackStore
+
+__unittest = True
+
+
+class TestRecord():
+    """
+    A class to represent the outcome of a test runned, compact with slots.
+
+    Attributes
+    ----------
+    duration: float
+        test duration in second.
+    status: str
+        success, failed, errors, skipped, expectedFails...
+    err: str or None
+        formatted error or skip reason, same object as in errors lists.
+    cpu: float or None
+        CPU time in second of the process while test was running.
+    parts: dict or None
+        {part's name: duration in second} for setUp, test, tearDown and
+        cleanup runned.
+    mem_peak: int or None
+        peak of memory allocated by test in bytes, measured with --mem.
+    mem_rss: int or None
+        growth of process's RSS during test in bytes, measured with --mem.
+    """
+    __slots__ = (
+        'duration', 'status', 'err', 'cpu', 'parts', 'mem_peak', 'mem_rss')
+
+    def __init__(
+            self, duration, status='success', err=None, cpu=None, parts=None,
+            mem_peak=None, mem_rss=None):
+        """
+        Set attributes.
+
+        Parameters
+        ----------
+            duration: float
+                test duration in second.
+            status: str (default: 'success')
+                success, failed, errors, skipped, expectedFails...
+            err: str or None (default: None)
+                formatted error or skip reason.
+            cpu: float or None (default: None)
+                CPU time in second.
+            parts: dict or None (default: None)
+                {part's name: duration in second}.
+            mem_peak: int or None (default: None)
+                peak of memory allocated in bytes.
+            mem_rss: int or None (default: None)
+                RSS growth in bytes.
+        """
+        self.duration = duration
+        self.status = status
+        self.err = err
+        self.cpu = cpu
+        self.parts = parts
+        self.mem_peak = mem_peak
+        self.mem_rss = mem_rss
+
+
+class TestDurations(Mapping):
+    """
+    A subclass of collections.abc.Mapping .
+
+    Read-only {test: duration} of tests runned, taken from result's records,
+    as durations['tests'] was before tests's outcomes were records.
+
+    Attributes
+    ----------
+    result: TestCasesResult
+        result whose records have the durations.
+    """
+
+    def __init__(self, result):
+        """
+        Set result.
+
+        Parameters
+        ----------
+            result: TestCasesResult
+                result whose records have the durations.
+        """
+        self.result = result
+
+    def __getitem__(self, test):
+        """
+        Return test's duration in second.
+
+        Parameters
+        ----------
+            test: TestCase method
+                test runned.
+        """
+        return self.result.records[test].duration
+
+    def __iter__(self):
+        """
+        Return iterator over tests runned.
+        """
+        return iter(self.result.records)
+
+    def __len__(self):
+        """
+        Return number of tests runned.
+        """
+        return len(self.result.records)
 
 
 class TestCasesResult(TestResult):
@@ -37,16 +165,88 @@ class TestCasesResult(TestResult):
     test_methods: list
         [(group, [(testcase, test methods), ...]), ...]
     durations: dict
-        {'groups': {g: dur}, 'testcases': {tc: dur}, 'tests': {t: dur}}
+        {'groups': {g: dur}, 'testcases': {tc: dur}, 'tests':
+        TestDurations}, tests's ones read from records.
+    records: dict
+        {test: TestRecord} of tests runned, their outcomes.
+    unrecorded: dict
+        {testcase: [(status, description, err, index), ...]} errors
+        without record of testcase's suite, as get_unrecorded_errors .
     n_tests: dict
         {group: {status: number of tests}}
+    stats: dict
+        {'groups': {group: percentiles}, 'total': percentiles} of tests's
+        durations, percentiles returned by duration_stats .
+    watchdog: Watchdog or None
+        interrupt tests running longer than timeouts of current testcase.
+    memory: MemoryTracer or None
+        measure memory used by tests of current testcase.
+    journal: Journal or None
+        write a json line by test completed, with --journal.
+    history: RunHistory or None
+        record tests completed in history of runs, with --history.
+    impact: ImpactTracer or None
+        record source files runned by each test, with --record-impact.
+    counts: dict
+        {'total': {status: n}, 'groups': {group: {status: n}}}, updated
+        with each test.
+    group: TestCasesGroup or None
+        group of tests runned, counted in counts['groups'].
+    test_t_start: int
+        perf_counter_ns when current test started.
+    test_cpu_start: int or None
+        process_time_ns when current test started, None if not measured.
+    test_parts: dict
+        {part's name: duration in second} of current test.
+    concurrent: bool
+        tests of current testcase gathered, started together, their start
+        times set when they complete.
+    subtests_status: str or None
+        'failed' or 'errors' if a subtest of current test failed, its
+        record made when it stops.
+    subtests_err: str or None
+        formatted error of first subtest failed, in current test's record.
+    traces: TracebackStore
+        each different traceback kept once, shared by tests.
+    display: str
+        'tests' a line by test, 'dots' a character by test (-q) or
+        'progress' a progress line updated (--progress).
+    planned: int or None
+        number of tests to run, shown in progress line.
+    expected: dict
+        {test id: expected duration} of planned tests not yet completed,
+        without resumed ones.
+    expected_done: float
+        expected duration of tests completed, compared to elapsed time.
+    expected_left: float
+        expected duration of tests not yet completed.
 
     Methods
     ----------
     startTest(test):
-        Called before execute each method test, set test start time.
+        Called before execute each method test, set test start times.
+    stopTest(test):
+        Called after execute each method test, stop its timeout.
+    end_concurrent_test(test, t_start, parts):
+        Called when a gathered test completes, before its outcome.
+    timed(call, part):
+        Return call adding its duration to current test's part.
+    complete_record(test):
+        Update test's record with parts runned after outcome.
+    _exc_info_to_string(err, test):
+        Format error like unittest, traceback kept once in traces.
+    write_journal(test):
+        Write test's outcome in journal and history, if any.
+    start_group(group):
+        Count status of next tests for group.
+    count(status):
+        Count a status, in total and for current group.
+    set_status(test, status, err=None, subtests=False):
+        Save test's status and error in its record, count and display it.
+    update_progress(test):
+        Update progress line with tests runned, failed, errors and ETA.
     addFoo(test_t_stop, test, status):
-        Calcul and save test duration, display it with status.
+        Calcul and save test duration in its record, display it with status.
     addSuccess(test):
         Called when a test has completed successfully.
     addError(test, err):
@@ -59,12 +259,30 @@ class TestCasesResult(TestResult):
         Called when an expected failure/error occurred.
     addUnexpectedSuccess(test):
         Called when a test was expected to fail, but succeed.
+    addSubTest(test, subtest, err):
+        Called at the end of a subtest, count it if failed.
+    add_holder_error(test, err):
+        Save and display an error not of a test, setUpClass's one...
+    get_outcomes(tests):
+        Get and return status, duration, error, timing and memory by test.
+    get_unrecorded_errors(tests, listed=(0, 0)):
+        Get and return errors and failures without record, subtests's...
+    keep_unrecorded(testcase, tests, listed):
+        Keep errors without record of a testcase, write them in journal.
+    add_outcome(test, status, duration, err, cpu=None, parts=None, ...):
+        Save a test outcome coming from another result without display it.
+    add_unrecorded_error(status, description, err, parent=None):
+        Save an error without record coming from another result.
     printErrors():
         Display errors and failures.
-    printErrorList(flavour, errors, e_color):
-        Display errors or failures list.
+    printErrorList(flavour, errors, e_color, seen=None):
+        Display errors or failures list, a same traceback once.
     printTotal(run, duration):
         Display total, number of tests and duration.
+    printStats(group_tests=None):
+        Save and display percentiles of tests's durations, group or final.
+    printSlowest(n):
+        Display the n slowest tests and testcases.
     get_n_tests(group_tests):
         Get and return all numbers tests by status depending if group or final.
     printInfos(group_tests=None):
@@ -86,13 +304,39 @@ class TestCasesResult(TestResult):
         self.stream = stream
         self.start_time = 0
         self.test_methods = []
-        self.durations = {'groups': {}, 'testcases': {}, 'tests': {}}
+        self.records = {}
+        self.durations = {
+            'groups': {}, 'testcases': {}, 'tests': TestDurations(self)}
+        self.unrecorded = {}
         self.n_tests = {'groups': {}}
+        self.stats = {'groups': {}}
         self.status = {'groups': {}}
+        self.watchdog = None
+        self.memory = None
+        self.journal = None
+        self.history = None
+        self.impact = None
+        self.counts = {'total': dict.fromkeys(STATUSES, 0), 'groups': {}}
+        self.group = None
+        self.test_t_start = 0
+        self.test_cpu_start = None
+        self.test_parts = {}
+        self.concurrent = False
+        self.subtests_status, self.subtests_err = None, None
+        self.traces = TracebackStore()
+        self.display = 'tests'
+        self.planned = None
+        self.expected = {}
+        self.expected_done = 0
+        self.expected_left = 0
 
     def startTest(self, test):
         """
-        Called before execute each method test, set test start time.
+        Called before execute each method test, set test start times.
+
+        Test's parts are timed, setUp, test, tearDown and cleanups, and its
+        memory measured with a memory tracer. A gathered test is only
+        counted, others run meanwhile.
 
         Parameters
         ----------
@@ -100,29 +344,289 @@ class TestCasesResult(TestResult):
                 the test method runned.
         """
         super().startTest(test)
-        self.stream.write(test._testMethodName)
-        self.stream.write(" ... ")
+        if self.concurrent:  # timed by SharedLoopSuite.run_test
+            return
+        if self.display == 'tests':
+            self.stream.write(test._testMethodName)
+            self.stream.write(" ... ")
+            self.stream.flush()
+        self.test_parts = {}
+        self.subtests_status, self.subtests_err = None, None
+        for name, part in TEST_PARTS.items():
+            setattr(test, name, self.timed(getattr(test, name), part))
+        if self.memory is not None:
+            self.memory.start_test()
+        if self.impact is not None:
+            self.impact.start_test()
+        self.test_cpu_start = time.process_time_ns()
+        self.test_t_start = time.perf_counter_ns()
+        if self.watchdog is not None:  # start test's timeout
+            self.watchdog.start_test(test)
+
+    def stopTest(self, test):
+        """
+        Called after execute each method test, stop its timeout.
+
+        A test failed only by its subtests has no outcome of its own, its
+        record is made with the status of its subtests, already counted,
+        and the error of the first one.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+        """
+        if self.watchdog is not None:
+            self.watchdog.stop_test()
+        if self.impact is not None:
+            self.impact.stop_test(test)
+        if self.subtests_status is not None and test not in self.records:
+            label = {
+                'failed': f"{YELLOW}FAIL{C_RESET}",
+                'errors': f"{RED}ERROR{C_RESET}"}[self.subtests_status]
+            self.addFoo(time.perf_counter_ns(), test, label)
+            self.set_status(
+                test, self.subtests_status, self.subtests_err, True)
+        self.complete_record(test)
+        self.write_journal(test)
+        super().stopTest(test)
+
+    def end_concurrent_test(self, test, t_start, parts):
+        """
+        Called when a gathered test completes, before its outcome.
+
+        Its name is displayed with its outcome, in order of completion,
+        without CPU time, shared by tests running together.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+            t_start: int
+                perf_counter_ns when test started.
+            parts: dict
+                {part's name: duration in second} of test.
+        """
+        if self.display == 'tests':
+            self.stream.write(test._testMethodName)
+            self.stream.write(" ... ")
+            self.stream.flush()
+        self.test_t_start, self.test_parts = t_start, parts
+        self.test_cpu_start = None
+        self.subtests_status, self.subtests_err = None, None
+
+    def timed(self, call, part):
+        """
+        Return call adding its duration to current test's part.
+
+        Parameters
+        ----------
+            call: method
+                _callSetUp, _callTestMethod, _callTearDown or _callCleanup .
+            part: str
+                setUp, test, tearDown or cleanup.
+
+        Return
+        ----------
+            function
+                wrapper of call.
+        """
+        parts = self.test_parts
+
+        @wraps(call)
+        def timed_call(*args, **kwargs):
+            with timed_part(parts, part):
+                return call(*args, **kwargs)
+
+        return timed_call
+
+    def complete_record(self, test):
+        """
+        Update test's record with parts runned after outcome.
+
+        A failure or an error is added as soon as it occurs, before tearDown
+        and cleanups, its record (duration, CPU time and memory) is
+        completed when the test stops.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+        """
+        record = self.records.get(test)
+        if record is None or record.parts is not self.test_parts:
+            return  # not runned with this result
+        record.duration = round(
+            (time.perf_counter_ns() - self.test_t_start) / 1e9, 6)
+        if self.test_cpu_start is not None:
+            record.cpu = round(
+                (time.process_time_ns() - self.test_cpu_start) / 1e9, 6)
+        if self.memory is not None and self.memory.active and (
+                not self.concurrent):
+            record.mem_peak, record.mem_rss = self.memory.measure()
+
+    def _exc_info_to_string(self, err, test):
+        """
+        Format error like unittest, traceback kept once in traces.
+
+        Used by TestResult for errors, failures, subtests and expected
+        failures, tests failing the same way share one string.
+
+        Parameters
+        ----------
+            err: tuple
+                values as returned by sys.exc_info().
+            test: TestCase method
+                the test method runned.
+
+        Return
+        ----------
+            str
+                formatted traceback, interned.
+        """
+        return self.traces.intern(super()._exc_info_to_string(err, test))
+
+    def write_journal(self, test):
+        """
+        Write test's outcome in journal and history, if any.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+        """
+        if test not in self.records:
+            return
+        for output in [self.journal, self.history]:
+            if output is not None:
+                output.write_test(
+                    test, self.group, self.get_outcomes([test])[0])
+
+    def start_group(self, group):
+        """
+        Count status of next tests for group.
+
+        Parameters
+        ----------
+            group: TestCasesGroup
+                group of next tests runned.
+        """
+        self.group = group
+        self.counts['groups'][group] = dict.fromkeys(STATUSES, 0)
+
+    def count(self, status):
+        """
+        Count a status, in total and for current group.
+
+        Parameters
+        ----------
+            status: str
+                success, failed, errors, skipped, expectedFails...
+        """
+        self.counts['total'][status] += 1
+        if self.group is not None:
+            self.counts['groups'][self.group][status] += 1
+
+    def set_status(self, test, status, err=None, subtests=False):
+        """
+        Save test's status and error in its record, count and display it.
+
+        Displayed with a character (-q) or in progress line (--progress),
+        else with its duration by addFoo.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned, with a record maked by addFoo.
+            status: str
+                success, failed, errors, skipped, expectedFails...
+            err: str or None (default: None)
+                formatted error or skip reason.
+            subtests: bool (default: False)
+                failed by its subtests, counted with them.
+        """
+        record = self.records[test]
+        record.status, record.err = status, err
+        if not subtests:
+            self.count(status)
+        if self.display == 'dots':
+            self.stream.write(DOTS[status])
+            self.stream.flush()
+        self.update_progress(test)
+
+    def update_progress(self, test):
+        """
+        Update progress line with tests runned, failed, errors and ETA.
+
+        Only with --progress, in main process where planned is known. ETA
+        is elapsed time scaled by expected durations of tests left over
+        the ones of tests completed, so it follows speed of this run (and
+        jobs). Line is redrawn by stream at most every interval.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method completed.
+        """
+        if self.display != 'progress' or self.planned is None:
+            return
+        expected = self.expected.pop(test.id(), None)
+        if expected is not None:  # runned, not resumed
+            self.expected_done += expected
+            self.expected_left -= expected
+        counts = self.counts['total']
+        percent = self.testsRun * 100 // max(self.planned, 1)
+        line = f" {self.testsRun}/{self.planned} tests ({percent}%)"
+        for status, color in [('failed', YELLOW), ('errors', RED)]:
+            if counts[status]:
+                line += f", {color}{counts[status]} {status}{C_RESET}"
+        elapsed = (datetime.now() - self.start_time).total_seconds()
+        line += f" {MUTED}{format_clock(elapsed)} elapsed"
+        if self.expected_done > 0:
+            eta = elapsed * max(self.expected_left, 0) / self.expected_done
+            line += f", ETA {format_clock(eta)}"
+        self.stream.update_line(f"{line}{S_RESET}")
         self.stream.flush()
-        self.test_t_start = time.time()
 
     def addFoo(self, test_t_stop, test, status):
         """
-        Calcul and save test duration, display it with status.
+        Calcul and save test duration in its record, display it with status.
+
+        Memory used is displayed with duration, durations of parts and CPU
+        time muted, for parts runned before the outcome. Memory of gathered
+        tests is not measured, shared by tests running together.
 
         Parameters
         ----------
-            test_t_stop: time
-                test time stop.
+            test_t_stop: int
+                perf_counter_ns when test stopped.
             test: TestCase method
                 the test method runned.
             status: str
                 OK, ERROR, FAIL, SKIP....
         """
-        t_duration = test_t_stop - self.test_t_start
-        self.durations['tests'][test] = round(t_duration, 6)
+        t_duration = (test_t_stop - self.test_t_start) / 1e9
+        cpu = None
+        if self.test_cpu_start is not None:
+            cpu = round(
+                (time.process_time_ns() - self.test_cpu_start) / 1e9, 6)
+        mem_peak, mem_rss = None, None
+        if self.memory is not None and not self.concurrent:
+            mem_peak, mem_rss = self.memory.measure()
+        self.records[test] = TestRecord(
+            round(t_duration, 6), cpu=cpu, parts=self.test_parts,
+            mem_peak=mem_peak, mem_rss=mem_rss)
+        if self.display != 'tests':  # character or progress line
+            return
         duration_str = format_duration(t_duration)
+        memory = format_memory(mem_peak, mem_rss)
+        if memory:
+            memory = f" {BLUE}{memory}{C_RESET}"
+        timing = format_timing(self.test_parts, cpu)
+        if timing:
+            timing = f" {MUTED}({timing}){S_RESET}"
         self.stream.writeln(
-            f"{status} ... {MAGENTA}{duration_str}{C_RESET}")
+            f"{status} ... {MAGENTA}{duration_str}{C_RESET}{memory}{timing}")
         self.stream.flush()
 
     def addSuccess(self, test):
@@ -134,21 +638,29 @@ class TestCasesResult(TestResult):
             test: TestCase method
                 the test method runned.
         """
-        self.addFoo(time.time(), test, f"{GREEN}OK{C_RESET}")
+        self.addFoo(time.perf_counter_ns(), test, f"{GREEN}OK{C_RESET}")
+        self.set_status(test, 'success')
 
     def addError(self, test, err):
         """
         Called when an error has occurred.
 
+        An error of setUpClass, setUpModule, tearDownClass... has an
+        _ErrorHolder for test, without record.
+
         Parameters
         ----------
-            test: TestCase method
+            test: TestCase method or _ErrorHolder
                 the test method runned.
             err: tuple
                 values as returned by sys.exc_info().
         """
-        self.addFoo(time.time(), test, f"{RED}ERROR{C_RESET}")
+        if isinstance(test, _ErrorHolder):  # not a test, no duration
+            self.add_holder_error(test, err)
+            return
+        self.addFoo(time.perf_counter_ns(), test, f"{RED}ERROR{C_RESET}")
         super().addError(test, err)
+        self.set_status(test, 'errors', self.errors[-1][1])
 
     def addFailure(self, test, err):
         """
@@ -161,8 +673,9 @@ class TestCasesResult(TestResult):
             err: tuple
                 values as returned by sys.exc_info().
         """
-        self.addFoo(time.time(), test, f"{YELLOW}FAIL{C_RESET}")
+        self.addFoo(time.perf_counter_ns(), test, f"{YELLOW}FAIL{C_RESET}")
         super().addFailure(test, err)
+        self.set_status(test, 'failed', self.failures[-1][1])
 
     def addSkip(self, test, reason):
         """
@@ -175,8 +688,9 @@ class TestCasesResult(TestResult):
             reason: str
                 represent the reason of skipped.
         """
-        self.addFoo(time.time(), test, f"{BLUE}SKIP{C_RESET}")
+        self.addFoo(time.perf_counter_ns(), test, f"{BLUE}SKIP{C_RESET}")
         super().addSkip(test, reason)
+        self.set_status(test, 'skipped', reason)
 
     def addExpectedFailure(self, test, err):
         """
@@ -189,8 +703,11 @@ class TestCasesResult(TestResult):
             err: tuple
                 values as returned by sys.exc_info().
         """
-        self.addFoo(time.time(), test, f"{RED}expected failure{C_RESET}")
+        self.addFoo(
+            time.perf_counter_ns(), test, f"{RED}expected failure{C_RESET}")
         super().addExpectedFailure(test, err)
+        self.set_status(
+            test, 'expectedFails', self.expectedFailures[-1][1])
 
     def addUnexpectedSuccess(self, test):
         """
@@ -201,20 +718,251 @@ class TestCasesResult(TestResult):
             test: TestCase method
                 the test method runned.
         """
-        self.addFoo(time.time(), test, f"{GREEN}unexpected success{C_RESET}")
+        self.addFoo(
+            time.perf_counter_ns(), test,
+            f"{GREEN}unexpected success{C_RESET}")
+        self.set_status(test, 'unexpectedSuccesses')
         super().addUnexpectedSuccess(test)
 
+    def addSubTest(self, test, subtest, err):
+        """
+        Called at the end of a subtest, count it if failed.
+
+        A failed subtest is listed and counted, its test is recorded with
+        the worst status of its subtests when it stops.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+            subtest: unittest.case._SubTest
+                the subtest.
+            err: tuple or None
+                values as returned by sys.exc_info(), None if succeed.
+        """
+        super().addSubTest(test, subtest, err)
+        if err is None:
+            return
+        if issubclass(err[0], test.failureException):  # listed by super
+            self.count('failed')
+            self.subtests_status = self.subtests_status or 'failed'
+            if self.subtests_err is None:
+                self.subtests_err = self.failures[-1][1]
+        else:
+            self.count('errors')
+            self.subtests_status = 'errors'
+            if self.subtests_err is None:
+                self.subtests_err = self.errors[-1][1]
+
+    def add_holder_error(self, test, err):
+        """
+        Save and display an error not of a test, setUpClass's one...
+
+        Listed and counted with errors, without record nor duration.
+
+        Parameters
+        ----------
+            test: _ErrorHolder
+                with description of the failing fixture.
+            err: tuple
+                values as returned by sys.exc_info().
+        """
+        super().addError(test, err)
+        self.count('errors')
+        if self.display == 'tests':
+            self.stream.writeln(f"{test.description} ... {RED}ERROR{C_RESET}")
+        elif self.display == 'dots':
+            self.stream.write(DOTS['errors'])
+        self.stream.flush()
+        self.update_progress(test)
+
+    def get_outcomes(self, tests):
+        """
+        Get and return status, duration, error, timing and memory by test.
+
+        Parameters
+        ----------
+            tests: list
+                test methods runned with this result.
+
+        Return
+        ----------
+            list
+                (status, duration, err, cpu, parts, mem_peak, mem_rss) for
+                each test, None if not runned.
+        """
+        outcomes = []
+        for test in tests:
+            record = self.records.get(test)
+            if record is None:  # not runned
+                outcomes.append(None)
+            else:
+                outcomes.append((
+                    record.status, record.duration, record.err, record.cpu,
+                    record.parts, record.mem_peak, record.mem_rss))
+        return outcomes
+
+    def get_unrecorded_errors(self, tests, listed=(0, 0)):
+        """
+        Get and return errors and failures without record, subtests's...
+
+        Errors of setUpClass, setUpModule, tearDownClass... and failed
+        subtests are not in outcomes of tests, they are sent with them.
+
+        Parameters
+        ----------
+            tests: list
+                test methods runned with this result.
+            listed: tuple (default: (0, 0))
+                numbers of errors and failures listed before tests runned,
+                not returned.
+
+        Return
+        ----------
+            list
+                (status, description, err, index) for each one, index of
+                test whose record has this subtest's error, else None.
+        """
+        unrecorded = []
+        for status, errors in [
+                ('errors', self.errors[listed[0]:]),
+                ('failed', self.failures[listed[1]:])]:
+            for test, err in errors:
+                if test in self.records:  # in test's outcome
+                    continue
+                index = None
+                parent = getattr(test, 'test_case', None)  # subtest's test
+                if parent in tests and self.records[parent].err == err:
+                    index = tests.index(parent)
+                unrecorded.append((status, str(test), err, index))
+        return unrecorded
+
+    def keep_unrecorded(self, testcase, tests, listed):
+        """
+        Keep errors without record of a testcase, write them in journal.
+
+        Parameters
+        ----------
+            testcase: unittest.TestCase subclass
+                testcase whose suite was runned.
+            tests: list
+                testcase's test methods runned.
+            listed: tuple
+                numbers of errors and failures listed before its suite
+                runned.
+        """
+        errors = self.get_unrecorded_errors(tests, listed)
+        if not errors:
+            return
+        self.unrecorded[testcase] = errors
+        if self.journal is not None:
+            for status, description, err, index in errors:
+                self.journal.write_error(
+                    testcase, self.group, (status, description, err), None if
+                    index is None else tests[index]._testMethodName)
+
+    def add_outcome(
+            self, test, status, duration, err, cpu=None, parts=None,
+            mem_peak=None, mem_rss=None, subtests=False):
+        """
+        Save a test outcome coming from another result without display it.
+
+        With failfast, a failure or an error stops the result. A test
+        failed by its subtests is counted and listed with them.
+
+        Parameters
+        ----------
+            test: TestCase method
+                the test method runned.
+            status: str
+                success, failed, errors, skipped, expectedFails...
+            duration: float
+                test duration in second.
+            err: str or None
+                formatted error, skip reason or None.
+            cpu: float or None (default: None)
+                CPU time in second.
+            parts: dict or None (default: None)
+                {part's name: duration in second}.
+            mem_peak: int or None (default: None)
+                peak of memory allocated in bytes.
+            mem_rss: int or None (default: None)
+                RSS growth in bytes.
+            subtests: bool (default: False)
+                failed by its subtests, added by add_unrecorded_error .
+        """
+        self.testsRun += 1
+        if subtests:  # record only, counted with subtests
+            self.records[test] = TestRecord(
+                duration, status, err, cpu, parts, mem_peak, mem_rss)
+            self.write_journal(test)
+            self.update_progress(test)
+            return
+        if status in ('failed', 'errors', 'expectedFails'):
+            err = self.traces.intern(err)  # shared with same tracebacks
+        self.records[test] = TestRecord(
+            duration, status, err, cpu, parts, mem_peak, mem_rss)
+        self.count(status)
+        if status == 'failed':
+            self.failures.append((test, err))
+        elif status == 'errors':
+            self.errors.append((test, err))
+        elif status == 'skipped':
+            self.skipped.append((test, err))
+        elif status == 'expectedFails':
+            self.expectedFailures.append((test, err))
+        elif status == 'unexpectedSuccesses':
+            self.unexpectedSuccesses.append(test)
+        self.write_journal(test)
+        self.update_progress(test)
+        if status in ('failed', 'errors') and self.failfast:
+            self.stop()
+
+    def add_unrecorded_error(self, status, description, err, parent=None):
+        """
+        Save an error without record coming from another result.
+
+        Listed and counted like in the result it comes from, with an
+        _ErrorHolder for test. With failfast, it stops the result.
+
+        Parameters
+        ----------
+            status: str
+                failed or errors.
+            description: str
+                setUpClass (module.TestCase), subtest's description...
+            err: str
+                formatted error.
+            parent: TestCase method or None (default: None)
+                test of a failed subtest, whose record has its error.
+        """
+        holder = _ErrorHolder(description)
+        holder.test_case = parent  # like a subtest
+        err = self.traces.intern(err)
+        if status == 'failed':
+            self.failures.append((holder, err))
+        else:
+            self.errors.append((holder, err))
+        self.count(status)
+        self.update_progress(holder)
+        if self.failfast:
+            self.stop()
+
     def printErrors(self):
         """
         Display errors and failures.
         """
         self.stream.writeln()
-        self.printErrorList('ERROR', self.errors, RED)
-        self.printErrorList('FAIL', self.failures, YELLOW)
+        seen = {}  # {traceback: first test displayed with it}
+        self.printErrorList('ERROR', self.errors, RED, seen)
+        self.printErrorList('FAIL', self.failures, YELLOW, seen)
 
-    def printErrorList(self, flavour, errors, e_color):
+    def printErrorList(self, flavour, errors, e_color, seen=None):
         """
-        Display errors or failures list.
+        Display errors or failures list, a same traceback once.
+
+        A traceback already displayed is replaced by the test displayed
+        with it, the first one with the number of tests failing the same.
 
         Parameters
         ----------
@@ -224,11 +972,18 @@ class TestCasesResult(TestResult):
                 tuples with test in 1st item, err(str) in 2nd.
             e_color: str
                 represent a color, green for succces, ...
+            seen: dict or None (default: None)
+                {traceback: test} already displayed.
         """
+        if seen is None:
+            seen = {}
         for test, err in errors:
-            tc_name = test.__class__.__name__
-            method_name = test._testMethodName
-            test_str = f"{BOLD}{tc_name}{S_RESET}.{method_name}"
+            if isinstance(test, (_SubTest, _ErrorHolder)):  # setUpClass...
+                test_name = test_str = str(test)
+            else:
+                tc_name = test.__class__.__name__
+                test_name = f"{tc_name}.{test._testMethodName}"
+                test_str = f"{BOLD}{tc_name}{S_RESET}.{test._testMethodName}"
             self.stream.writeln(self.separator1)
             self.stream.writeln(
                 f"{e_color}{flavour}{S_RESET}: {test_str}")
@@ -236,7 +991,16 @@ class TestCasesResult(TestResult):
             self.stream.writeln(
                 f"{e_color}{err.splitlines()[-1]}{C_RESET}")
             self.stream.writeln(self.separator2)
+            if err in seen:  # same traceback already displayed
+                self.stream.writeln(
+                    f"{MUTED}Same traceback as {seen[err]}{S_RESET}\n")
+                continue
+            seen[err] = test_name
             self.stream.writeln(f"{MUTED}{err}{S_RESET}")
+            n_tests = self.traces.count(err)
+            if n_tests > 1:
+                self.stream.writeln(
+                    f"{MUTED}Same traceback for {n_tests} tests{S_RESET}\n")
 
     def printTotal(self, run, duration):
         """
@@ -256,6 +1020,54 @@ class TestCasesResult(TestResult):
         self.stream.writeln(
             f"{ran_text} in {MAGENTA}{format_duration(duration)}{C_RESET}")
 
+    def printStats(self, group_tests=None):
+        """
+        Save and display percentiles of tests's durations, group or final.
+
+        Parameters
+        ----------
+            group_tests: tuple (default: None)
+                group for first item, associated tests methods for second one.
+        """
+        if group_tests is None:  # all tests runned
+            stats = duration_stats([
+                record.duration for record in self.records.values()])
+            self.stats['total'] = stats
+        else:
+            stats = duration_stats([
+                self.records[t_method].duration
+                for t_method in group_tests[1] if t_method in self.records])
+            self.stats['groups'][group_tests[0]] = stats
+        if stats:
+            self.stream.writeln(f"{MUTED}{format_stats(stats)}{S_RESET}")
+
+    def printSlowest(self, n):
+        """
+        Display the n slowest tests and testcases.
+
+        Parameters
+        ----------
+            n: int
+                number of tests and of testcases displayed.
+        """
+        tests = sorted(
+            self.records.items(), key=lambda item: item[1].duration,
+            reverse=True)[:n]
+        testcases = sorted(
+            self.durations['testcases'].items(), key=lambda item: item[1],
+            reverse=True)[:n]
+        self.stream.writeln(f"{BOLD}Slowest {len(tests)} tests{S_RESET}")
+        for test, record in tests:
+            self.stream.writeln(
+                f" {MAGENTA}{format_duration(record.duration):>12}"
+                f"{C_RESET} {test.id()}")
+        self.stream.writeln(
+            f"\n{BOLD}Slowest {len(testcases)} testcases{S_RESET}")
+        for testcase, duration in testcases:
+            self.stream.writeln(
+                f" {MAGENTA}{format_duration(duration):>12}{C_RESET}"
+                f" {testcase.__module__}.{testcase.__qualname__}")
+
     def get_n_tests(self, group_tests):
         """
         Get and return all numbers tests by status depending if group or final.
@@ -270,27 +1082,16 @@ class TestCasesResult(TestResult):
             dict
                 numbers of tests for each status.
         """
-        if group_tests is not None:  # for a group
-            test_methods = group_tests[1]
-            failed, errors, exp_fails, unexp_succ, skipped = 0, 0, 0, 0, 0
-            for t_method in test_methods:
-                if t_method in [fail[0] for fail in self.failures]:
-                    failed += 1
-                elif t_method in [err[0] for err in self.errors]:
-                    errors += 1
-                elif t_method in [efail[0] for efail in self.expectedFailures]:
-                    exp_fails += 1
-                elif t_method in self.unexpectedSuccesses:
-                    unexp_succ += 1
-                elif t_method in [skp[0] for skp in self.skipped]:
-                    skipped += 1
-        else:  # for final total
-            failed, errors, exp_fails, unexp_succ, skipped = map(len, (
-                self.failures, self.errors, self.expectedFailures,
-                self.unexpectedSuccesses, self.skipped))
-        return {
-            'failed': failed, 'errors': errors, 'skipped': skipped,
-            'expectedFails': exp_fails, 'unexpectedSuccesses': unexp_succ}
+        if group_tests is None:  # for final total
+            counts = self.counts['total']
+        elif group_tests[0] in self.counts['groups']:  # counted group
+            counts = self.counts['groups'][group_tests[0]]
+        else:  # tests runned without start_group, count them with index
+            counts = dict.fromkeys(STATUSES, 0)
+            for t_method in group_tests[1]:
+                if t_method in self.records:
+                    counts[self.records[t_method].status] += 1
+        return {status: counts[status] for status in STATUSES[1:]}
 
     def printInfos(self, group_tests=None):
         """
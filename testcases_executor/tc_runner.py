@@ -7,67 +7,278 @@ Class:
     TestCasesRunner
 
 Imports:
+    sys
     from datetime: datetime
     from unittest: TextTestRunner
     from testcases_executor.tc_utils: (
         format_duration, BOLD, MUTED, S_RESET, MAGENTA)
     from testcases_executor.tc_result: TestCasesResult
+    from testcases_executor.tc_parallel: make_tasks, TestCasesOutcomes
+    from testcases_executor.tc_async: SharedLoopSuite
+    from testcases_executor.tc_cache: (
+        load_durations, save_durations, expected_durations, save_failed)
+    from testcases_executor.tc_watchdog: Watchdog
+    from testcases_executor.tc_memory: MemoryTracer
+    from testcases_executor.tc_merge: Journal
+    from testcases_executor.tc_history: RunHistory
+    from testcases_executor.tc_impact: ImpactTracer, save_impact
+    from testcases_executor.tc_stream: BatchedStream
 """
+import sys
 from datetime import datetime
 from unittest import TextTestRunner
 from testcases_executor.tc_utils import (
     format_duration, BOLD, MUTED, S_RESET, MAGENTA)
 from testcases_executor.tc_result import TestCasesResult
+from testcases_executor.tc_parallel import make_tasks, TestCasesOutcomes
+from testcases_executor.tc_async import SharedLoopSuite
+from testcases_executor.tc_cache import (
+    load_durations, save_durations, expected_durations, save_failed)
+from testcases_executor.tc_watchdog import Watchdog
+from testcases_executor.tc_memory import MemoryTracer
+from testcases_executor.tc_merge import Journal
+from testcases_executor.tc_history import RunHistory
+from testcases_executor.tc_impact import ImpactTracer, save_impact
+from testcases_executor.tc_stream import BatchedStream
 
 
 class TestCasesRunner(TextTestRunner):
     """
     A subclass of unittest.TextTestRunner .
 
-    Use to run groups's tests suites and display result in shell.
+    Use to run groups's tests suites and display result in shell, written
+    in sys.stderr by batches with -q or --progress, else line by line so a
+    test's own output stays under its line.
+
+    Attributes
+    ----------
+    jobs: int
+        number of worker processes, 1 to run tests in main process.
+    by_group: bool
+        run each group's testcases serially in the same worker.
+    failfast: bool
+        stop on first failure or error, in main process or in all workers.
+    mem: bool
+        measure peak of memory allocated and RSS growth of each test.
+    journal_path: str or None
+        path of journal where a json line is written by test completed.
+    display: str
+        'tests' a line by test, 'dots' a character by test or 'progress' a
+        progress line, testcases's titles only with tests.
+    history: bool
+        record run and its tests's outcomes in history of runs.
+    slowest: int
+        number of slowest tests and testcases displayed at the end.
+    impact: bool
+        record source files runned by each test, tests runned in main
+        process.
+    recorded: bool
+        results recorded by other runs (merge), caches not updated.
+    outcomes: TestCasesOutcomes or None
+        (output, outcomes, errors) of suites runned in workers, ordered by
+        declaration.
 
     Methods
     ----------
+    run_suite(result, suite):
+        Run a suite, or get its outcomes from workers, and update result.
     run_group_suites(result, group):
         Run suites for a group, update result durations and test_methods.
+    plan_progress(result, groups, durations):
+        Set tests planned and their expected durations for progress line.
     run(groups):
         Run all groups's suites, update result and return it.
     """
 
-    def __init__(self):
+    def __init__(
+            self, jobs=1, by_group=False, failfast=False, mem=False,
+            journal_path=None, display='tests', history=False, slowest=0,
+            impact=False, recorded=False):
         """
         Init unittest.TextTestRunner with TestCasesResult for result class.
+
+        Parameters
+        ----------
+            jobs: int (default: 1)
+                number of worker processes used to run testcases's suites.
+            by_group: bool (default: False)
+                run groups concurrently, testcases of a group serially.
+            failfast: bool (default: False)
+                stop on first failure or error.
+            mem: bool (default: False)
+                measure memory used by each test.
+            journal_path: str or None (default: None)
+                write a journal of tests completed.
+            display: str (default: 'tests')
+                display of tests, 'tests', 'dots' or 'progress'.
+            history: bool (default: False)
+                record run in history of runs.
+            slowest: int (default: 0)
+                display the slowest tests and testcases, 0 for none.
+            impact: bool (default: False)
+                record source files runned by each test.
+            recorded: bool (default: False)
+                results recorded by other runs, caches not updated.
+        """
+        stream = sys.stderr
+        if display != 'tests':  # characters or progress line by batches
+            stream = BatchedStream(sys.stderr)
+        super().__init__(
+            stream=stream, resultclass=TestCasesResult, failfast=failfast)
+        self.jobs = jobs
+        self.by_group = by_group
+        self.mem = mem
+        self.journal_path = journal_path
+        self.display = display
+        self.history = history
+        self.slowest = slowest
+        self.impact = impact
+        self.recorded = recorded
+        self.outcomes = None
+
+    def run_suite(self, result, suite):
+        """
+        Run a suite, or get its outcomes from workers, and update result.
+
+        Errors without record from workers (setUpClass, subtests...) are
+        added after outcomes, a test failed by its subtests counted with
+        them.
+
+        Parameters
+        ----------
+            result: TestCasesResult
+                needed to update his properties with tests outcomes.
+            suite: unittest.TestSuite
+                testcase's tests suite.
+
+        Return
+        ----------
+            bool
+                suite runned, False if cancelled in workers (failfast).
         """
-        super().__init__(resultclass=TestCasesResult)
+        if self.outcomes is None:
+            suite(result)
+        else:  # runned in a worker, display its output and save outcomes
+            output, outcomes, errors = next(self.outcomes)
+            self.stream.write(output)
+            self.stream.flush()
+            parents = {index for *_, index in errors if index is not None}
+            for index, (test, outcome) in enumerate(
+                    zip(suite._tests, outcomes)):
+                if outcome is not None:
+                    result.add_outcome(
+                        test, *outcome, subtests=index in parents)
+            for status, description, err, index in errors:
+                result.add_unrecorded_error(
+                    status, description, err,
+                    None if index is None else suite._tests[index])
+            return bool(errors) or not outcomes or any(  # not cancelled
+                outcome is not None for outcome in outcomes)
+        return True
 
     def run_group_suites(self, result, group):
         """
         Run suites for a group, update result durations and test_methods.
 
+        When result is stopped (failfast), next suites are not runned and
+        only tests runned are kept, as testcases cancelled in workers.
+        Outcomes of tests resumed from an interrupted run are added before
+        remaining tests are runned. Errors without record (setUpClass,
+        subtests...) are kept by testcase. Gathered async tests overlap, their
+        testcase lasts as the longest one.
+
         Parameters
         ----------
             result: TestCasesResult
                 needed to update his properties durations and test_methods.
             group : TestCasesGroup
                 used suites property to get and run testcases with tests suite.
+
+        Return
+        ----------
+            bool
+                group runned, False if all its testcases were cancelled.
         """
-        tc_group = []
+        tc_group, n_cancelled = [], 0
+        result.start_group(group)  # count status of group's tests
         for testcase, suite in group.suites:
-            test_methods = [test_method for test_method in suite._tests]
+            if result.shouldStop:  # failfast, next suites not runned
+                break
+            resumed = group.resumed.get(testcase, [])
+            test_methods = [test_method for test_method, _ in resumed]
+            test_methods.extend(suite._tests)
+            verbose = self.display == 'tests'
+            if verbose:
+                self.stream.writeln(result.separator2)
+                self.stream.writeln(  # test case title
+                    f"\n{BOLD} --- {testcase.__name__} ---{S_RESET}")
+                self.stream.writeln(
+                    f"{MUTED} {testcase.__module__}.py{S_RESET}\n")
+            for test_method, outcome in resumed:  # completed, not runned
+                result.add_outcome(test_method, *outcome)
+            if resumed and verbose:
+                self.stream.writeln(
+                    f"{MUTED} {len(resumed)} tests resumed{S_RESET}\n")
+            result.watchdog = Watchdog(  # interrupt too long tests
+                group.timeout, group.testcase_timeout, group.stall)
+            result.memory = MemoryTracer(  # in workers if runned in them
+                self.mem and self.outcomes is None)
+            listed = (len(result.errors), len(result.failures))
+            with result.watchdog, result.memory:
+                runned = self.run_suite(result, suite)  # run tests suite
+            result.watchdog, result.memory = None, None
+            if not runned and not resumed:  # cancelled in a worker
+                n_cancelled += 1
+                if verbose:
+                    self.stream.writeln(
+                        f"{MUTED} cancelled by failfast{S_RESET}\n")
+                continue
+            test_methods = [  # not runned after failfast stop
+                test_method for test_method in test_methods
+                if test_method in result.records]
+            result.keep_unrecorded(testcase, test_methods, listed)
             tc_group.append((testcase, test_methods))
-            self.stream.writeln(result.separator2)
-            self.stream.writeln(  # test case title
-                f"\n{BOLD} --- {testcase.__name__} ---{S_RESET}")
-            self.stream.writeln(
-                f"{MUTED} {testcase.__module__}.py{S_RESET}\n")
-            suite(result)  # run tests suite
-            tc_duration = 0  # calcul, save testcase duration
-            for test_method in test_methods:
-                tc_duration += result.durations['tests'][test_method]
+            t_durations = [  # calcul, save testcase duration
+                result.records[test_method].duration
+                for test_method in test_methods]
+            tc_duration = sum(t_durations)
+            if SharedLoopSuite.gathers(testcase):  # tests started together
+                tc_duration = sum(t_durations[:len(resumed)]) + max(
+                    t_durations[len(resumed):], default=0)
             result.durations['testcases'][testcase] = tc_duration
-            self.stream.writeln(  # display it
-                f"\n ... {MAGENTA}{format_duration(tc_duration)}{S_RESET}\n")
+            if verbose:  # display it
+                self.stream.writeln(
+                    f"\n ... {MAGENTA}{format_duration(tc_duration)}"
+                    f"{S_RESET}\n")
+        if self.display == 'dots':  # end group's line of characters
+            self.stream.writeln()
+        if n_cancelled and not tc_group:  # not in summaries and report
+            return False
         result.test_methods.append((group, tc_group))
+        return True
+
+    @staticmethod
+    def plan_progress(result, groups, durations):
+        """
+        Set tests planned and their expected durations for progress line.
+
+        Parameters
+        ----------
+            result: TestCasesResult
+                needed to update his properties planned and expected.
+            groups : TestCasesGroups
+                groups's suites of tests selected, and tests resumed.
+            durations: dict
+                {test id: duration} from previous runs.
+        """
+        test_ids, n_resumed = [], 0
+        for group in groups:
+            for testcase, suite in group.suites:
+                test_ids.extend([test.id() for test in suite._tests])
+                n_resumed += len(group.resumed.get(testcase, []))
+        result.planned = len(test_ids) + n_resumed
+        result.expected = expected_durations(test_ids, durations)
+        result.expected_left = sum(result.expected.values())
 
     def run(self, groups):  # pylint: disable=arguments-differ
         """
@@ -83,13 +294,36 @@ class TestCasesRunner(TextTestRunner):
         """
         result = self.resultclass(self.stream)
         result.failfast = self.failfast
+        result.display = self.display
+        durations = None  # from previous runs
+        if self.jobs > 1 or self.display == 'progress':
+            durations = load_durations()
+        if self.display == 'progress':
+            self.plan_progress(result, groups, durations['tests'])
         self.stream.writeln("\nRunning tests...\n")
         self.stream.writeln(result.separator1)
         result.start_time = datetime.now()  # start tests
+        if self.journal_path is not None:  # written as tests complete
+            result.journal = Journal(self.journal_path, result.start_time)
+        if self.history:  # recorded by a thread as tests complete
+            result.history = RunHistory(result.start_time)
+        if self.impact:  # files runned by tests recorded in main process
+            result.impact = ImpactTracer()
+        elif self.jobs > 1:  # run all suites in workers
+            self.outcomes = TestCasesOutcomes(
+                make_tasks(groups, self.by_group), self.jobs, durations,
+                self.failfast, self.mem, self.display)
         for group in groups:
+            if result.shouldStop:  # failfast, next groups not runned
+                break
             self.stream.writeln(f"{result.separator1}\n")
             self.stream.writeln(f"{BOLD}{MUTED} {group.name}{S_RESET}\n")
-            self.run_group_suites(result, group)  # run group's suites
+            if not self.run_group_suites(result, group):  # run its suites
+                if self.display != 'tests':  # else said by each testcase
+                    self.stream.writeln(
+                        f"{MUTED} cancelled by failfast{S_RESET}\n")
+                self.stream.writeln(f"\n{result.separator1}")
+                continue
             g_tests = []   # group's tests
             g_duration = 0   # calcul, save group duration
             for testcase, t_methods in result.test_methods[-1][1]:
@@ -100,10 +334,21 @@ class TestCasesRunner(TextTestRunner):
             result.durations['groups'][group] = g_duration
             self.stream.writeln(f"{result.separator2}\n {MUTED}")
             result.printTotal(n_tests, g_duration)  # display them
+            result.printStats((group, g_tests))  # durations percentiles
             result.printInfos((group, g_tests))  # display group's info
             self.stream.writeln(f"\n{result.separator1}")
+        if self.outcomes is not None:  # all suites runned in workers
+            self.outcomes.close()
+            self.outcomes = None
+        if result.journal is not None:
+            result.journal.close()
+        if result.history is not None:
+            result.history.close()
         self.stream.writeln(result.separator1)
         result.printErrors()  # display errors
+        if self.slowest:  # what to optimize first
+            result.printSlowest(self.slowest)
+            self.stream.writeln(f"\n{result.separator1}")
         self.stream.writeln(
             f"{BOLD}{result.separator1}\n{result.separator1}\n")
         total_tests = result.testsRun  # calcul, save total duration
@@ -111,7 +356,15 @@ class TestCasesRunner(TextTestRunner):
         total_duration = sum(result.durations['groups'].values())
         result.durations['total'] = total_duration
         result.printTotal(total_tests, total_duration)  # display it
+        result.printStats()
         result.printInfos()  # display final infos
         self.stream.writeln(
             f"\n{BOLD}{result.separator1}\n{result.separator1}\n{S_RESET}")
+        if self.display != 'tests':
+            self.stream.flush(True)  # last batch written
+        if not self.recorded:  # not runned on this machine
+            save_durations(result)  # used to schedule next runs
+            save_failed(result)  # used by --last-failed, --failed-first
+        if result.impact is not None:  # used by --affected-by
+            save_impact(result.impact.tests)
         return result
@@ -0,0 +1,137 @@
+"""
+Module testcases_executor.tc_stream
+
+Contain necessary class to write tests's output in terminal by batches.
+
+Classes:
+    BatchedStream
+
+Imports:
+    atexit
+    threading
+    time
+"""
+import atexit
+import threading
+import time
+
+
+class BatchedStream():
+    """
+    A class to write a stream by batches, with an updatable last line.
+
+    Text written is kept in a buffer, flush writes it at most every
+    interval, a timer writes what remains after interval so a long test's
+    output is not delayed more, or exit if the run crashes. Used like a
+    file by unittest.runner._WritelnDecorator, only with -q or --progress .
+
+    A progress line is replaced on each update, displayed with next flush
+    after text written and erased before next text.
+
+    Attributes
+    ----------
+    stream: file
+        sys.stderr, written by batches.
+    buffer: list
+        text not yet written.
+    line: str or None
+        progress line to display, None if displayed or without.
+    shown: bool
+        progress line displayed, erased before next text.
+    interval: float
+        min seconds between two writes.
+    t_flush: float
+        monotonic time of last write.
+    timer: threading.Timer or None
+        flush after interval.
+    lock: threading.Lock
+        protect buffer and stream shared with timer.
+
+    Methods
+    ----------
+    write(text):
+        Keep text in buffer.
+    update_line(line):
+        Replace progress line, displayed with next flush.
+    flush(force=False):
+        Write buffer and progress line if interval elapsed, else by timer.
+    """
+
+    def __init__(self, stream, interval=0.1):
+        """
+        Wrap stream with an empty buffer.
+
+        Parameters
+        ----------
+            stream: file
+                sys.stderr .
+            interval: float (default: 0.1)
+                min seconds between two writes.
+        """
+        self.stream = stream
+        self.buffer = []
+        self.line = None
+        self.shown = False
+        self.interval = interval
+        self.t_flush = 0
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        """
+        Keep text in buffer.
+
+        Parameters
+        ----------
+            text: str
+                written with next flush.
+        """
+        with self.lock:
+            self.buffer.append(text)
+
+    def update_line(self, line):
+        """
+        Replace progress line, displayed with next flush.
+
+        Parameters
+        ----------
+            line: str
+                progress line, without new line.
+        """
+        with self.lock:
+            self.line = line
+
+    def flush(self, force=False):
+        """
+        Write buffer and progress line if interval elapsed, else by timer.
+
+        Parameters
+        ----------
+            force: bool (default: False)
+                write them now, at the end of tests.
+        """
+        with self.lock:
+            if not force and time.monotonic() - self.t_flush < self.interval:
+                if self.timer is None:  # remaining text written later
+                    self.timer = threading.Timer(
+                        self.interval, self.flush, (True, ))
+                    self.timer.daemon = True
+                    self.timer.start()
+                    atexit.register(self.flush, True)  # crashed run
+                return
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+                atexit.unregister(self.flush)
+            text = ''.join(self.buffer)
+            self.buffer = []
+            if text and self.shown:  # erase progress line
+                text = f"\r\x1b[K{text}"
+                self.shown = False
+            if self.line is not None:
+                text = f"{text}\r{self.line}\x1b[K"
+                self.line, self.shown = None, True
+            if text:
+                self.stream.write(text)
+                self.stream.flush()
+            self.t_flush = time.monotonic()
@@ -0,0 +1,100 @@
+"""
+Module testcases_executor.tc_traces
+
+Contain necessary class and function to keep each different traceback once.
+
+Classes:
+    TracebackStore
+
+Functions:
+    traceback_signature(trace)
+
+Variables:
+    ADDRESS: re.Pattern
+        memory address in a traceback (repr of objects).
+
+Imports:
+    re
+"""
+import re
+
+ADDRESS = re.compile(r'\b0x[0-9a-fA-F]+\b')
+
+
+def traceback_signature(trace):
+    """
+    Return traceback normalized, same for tracebacks differing by addresses.
+
+        Parameters:
+            trace (str): formatted traceback.
+
+        Returns:
+            str: traceback with memory addresses replaced, trace itself if
+                without any.
+    """
+    return ADDRESS.sub('0x?', trace)
+
+
+class TracebackStore():
+    """
+    A class to keep each different traceback once, by signature.
+
+    When a shared fixture breaks, tests fail with the same traceback, each
+    test keeps a reference to the traceback of the first one, so memory
+    used by tracebacks grows only with different ones.
+
+    Attributes
+    ----------
+    traces: dict
+        {signature: first traceback with it}.
+    counts: dict
+        {signature: number of tests with traceback}.
+
+    Methods
+    ----------
+    intern(trace):
+        Keep traceback if new, return the one kept for its signature.
+    count(trace):
+        Return number of tests with traceback.
+    """
+
+    def __init__(self):
+        """
+        Init an empty store.
+        """
+        self.traces = {}
+        self.counts = {}
+
+    def intern(self, trace):
+        """
+        Keep traceback if new, return the one kept for its signature.
+
+        Parameters
+        ----------
+            trace: str
+                formatted traceback.
+
+        Return
+        ----------
+            str
+                traceback kept, shared by tests with same signature.
+        """
+        signature = traceback_signature(trace)
+        self.counts[signature] = self.counts.get(signature, 0) + 1
+        return self.traces.setdefault(signature, trace)
+
+    def count(self, trace):
+        """
+        Return number of tests with traceback.
+
+        Parameters
+        ----------
+            trace: str
+                formatted traceback.
+
+        Return
+        ----------
+            int
+                number of tests, 0 if not kept.
+        """
+        return self.counts.get(traceback_signature(trace), 0)
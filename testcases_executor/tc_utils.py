@@ -7,11 +7,39 @@ Functions:
     raise_error(error_type, error_msg)
     check_type(obj, desired_classes, obj_msg)
     format_duration(duration)
+    format_clock(duration)
+    timed_part(parts, part)
+    format_timing(parts, cpu)
+    format_size(size)
+    format_memory(mem_peak, mem_rss)
+    duration_stats(durations)
+    format_stats(stats)
 
 Variables:
     PREFIX, MUTED, BOLD, RED, S_RESET, C_RESET: str
         colors and style
+    RESERVED_NAMES: list
+        short options names that group or testcase can't use as argument.
+    GROUP_SETTINGS: list
+        names of settings in optional dict, 4th item of group tuple.
+    STATUSES: list
+        names of tests status, used in outcomes and counters.
+    DOTS: dict
+        {status: character displayed with -q}.
+    TEST_PARTS: dict
+        {name of TestCase's method calling a test's part: part's name}.
+    PERCENTILES: list
+        percentiles of tests's durations displayed for groups.
+
+Imports:
+    math
+    time
+    from contextlib: contextmanager
 """
+import math
+import time
+from contextlib import contextmanager
+
 PREFIX = "\x1b["
 MUTED = f"{PREFIX}2m"
 BOLD = f"{PREFIX}1m"
@@ -22,6 +50,18 @@ BLUE = f"{PREFIX}36m"
 MAGENTA = f"{PREFIX}35m"
 S_RESET = f"{PREFIX}0m"
 C_RESET = f"{PREFIX}39m"
+RESERVED_NAMES = ['h', 'o', 'j', 'q']
+GROUP_SETTINGS = ['timeout', 'testcase_timeout', 'stall']
+STATUSES = [
+    'success', 'failed', 'errors', 'skipped', 'expectedFails',
+    'unexpectedSuccesses']
+DOTS = {
+    'success': '.', 'failed': 'F', 'errors': 'E', 'skipped': 's',
+    'expectedFails': 'x', 'unexpectedSuccesses': 'u'}
+TEST_PARTS = {
+    '_callSetUp': 'setUp', '_callTestMethod': 'test',
+    '_callTearDown': 'tearDown', '_callCleanup': 'cleanup'}
+PERCENTILES = [50, 90, 99]
 
 
 def raise_error(error_type, error_msg):
@@ -77,3 +117,131 @@ def format_duration(duration):
         duration *= 1000
         d_unit = 'ms'
     return f"{str(round(duration, 3))} {d_unit}"
+
+
+def format_clock(duration):
+    """
+    Return a long duration like a clock, elapsed or remaining time of a run.
+
+        Parameters:
+            duration (float): duration in second.
+
+        Returns:
+            str: h:mm:ss, or m:ss under an hour.
+    """
+    minutes, seconds = divmod(int(duration), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02}:{seconds:02}"
+    return f"{minutes}:{seconds:02}"
+
+
+@contextmanager
+def timed_part(parts, part):
+    """
+    Add the duration of the code runned inside to a test's part.
+
+        Parameters:
+            parts (dict): {part's name: duration in second} of a test.
+            part (str): setUp, test, tearDown or cleanup.
+    """
+    t_start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        parts[part] = parts.get(part, 0) + (
+            time.perf_counter_ns() - t_start) / 1e9
+
+
+def format_timing(parts, cpu):
+    """
+    Format durations of test's parts and CPU time, in parts order.
+
+        Parameters:
+            parts (dict or None): {part's name: duration in second}.
+            cpu (float or None): CPU time in second.
+
+        Return:
+            string like 'setUp 1.2 ms, test 3.0 ms, CPU 4.1 ms', or empty.
+    """
+    infos = [
+        f"{part} {format_duration(parts[part])}"
+        for part in TEST_PARTS.values() if part in (parts or {})]
+    if cpu is not None:
+        infos.append(f"CPU {format_duration(cpu)}")
+    return ", ".join(infos)
+
+
+def format_size(size):
+    """
+    Format a size of memory in B, KiB, MiB or GiB.
+
+        Parameters:
+            size (int): size in bytes, can be negative (growth).
+
+        Return:
+            string like '1.5 MiB'.
+    """
+    for unit in ['B', 'KiB', 'MiB']:
+        if abs(size) < 1024:
+            break
+        size /= 1024
+    else:
+        unit = 'GiB'
+    return f"{round(size, 1)} {unit}"
+
+
+def format_memory(mem_peak, mem_rss):
+    """
+    Format peak of memory allocated and RSS growth of a test.
+
+        Parameters:
+            mem_peak (int or None): peak of memory allocated in bytes.
+            mem_rss (int or None): RSS growth in bytes.
+
+        Return:
+            string like 'peak 1.5 MiB, RSS +2.0 MiB', or empty.
+    """
+    infos = []
+    if mem_peak is not None:
+        infos.append(f"peak {format_size(mem_peak)}")
+    if mem_rss is not None:
+        sign = '+' if mem_rss >= 0 else ''
+        infos.append(f"RSS {sign}{format_size(mem_rss)}")
+    return ", ".join(infos)
+
+
+def duration_stats(durations):
+    """
+    Return percentiles (nearest rank) and max of tests's durations.
+
+        Parameters:
+            durations (list): durations of tests in second.
+
+        Return:
+            dict: {'p50': duration, 'p90': ..., 'p99': ..., 'max': ...},
+                empty without durations.
+    """
+    if not durations:
+        return {}
+    durations = sorted(durations)
+    stats = {
+        f"p{rank}": durations[math.ceil(rank * len(durations) / 100) - 1]
+        for rank in PERCENTILES}
+    stats['max'] = durations[-1]
+    return stats
+
+
+def format_stats(stats):
+    """
+    Format percentiles and max of tests's durations.
+
+        Parameters:
+            stats (dict): returned by duration_stats .
+
+        Return:
+            string like 'p50 1.2 ms, p90 3.0 ms, p99 4.1 ms, max 5.0 ms'.
+    """
+    return ", ".join([
+        f"{name} {format_duration(duration)}"
+        for name, duration in stats.items()])
@@ -0,0 +1,363 @@
+"""
+Module testcases_executor.tc_watchdog
+
+Contain necessary classes to interrupt tests running longer than timeouts
+and dump stacks of stalled tests.
+
+Classes:
+    TestTimeout
+    Watchdog
+
+Variables:
+    __unittest: bool
+        frames of guarded calls hidden in tracebacks, like unittest's ones.
+
+Imports:
+    asyncio
+    faulthandler
+    signal
+    threading
+    time
+    from functools: wraps
+    from inspect: iscoroutinefunction
+    from os: fstat, remove
+    from testcases_executor.tc_utils: format_duration, TEST_PARTS
+    from testcases_executor.tc_cache: stall_path
+"""
+import asyncio
+import faulthandler
+import signal
+import threading
+import time
+from functools import wraps
+from inspect import iscoroutinefunction
+from os import fstat, remove
+from testcases_executor.tc_utils import format_duration, TEST_PARTS
+from testcases_executor.tc_cache import stall_path
+
+__unittest = True
+
+
+class TestTimeout(BaseException):
+    """
+    A subclass of BaseException .
+
+    Raised in a test running longer than its timeout. Not an Exception, so
+    not catched by test's code but recorded as error by unittest.
+    """
+
+
+class Watchdog():
+    """
+    A class to interrupt testcase's tests running longer than timeouts.
+
+    Used as context manager around a testcase's suite, with SIGALRM (not on
+    Windows, only in main thread). Timeout is raised only in setUp, test
+    method, tearDown or cleanups, recorded as error, and only once by test.
+    Tests started after testcase's timeout are interrupted at start.
+    Tests on a loop shared with other tests (SharedLoopSuite) are limited
+    on the loop instead, SIGALRM would stop it anywhere: the awaited part
+    is cancelled and timeout raised in test, at its next await. With
+    stall, stacks of all threads are dumped by faulthandler in test's stall
+    file, every stall seconds after the first ones.
+
+    Attributes
+    ----------
+    timeout: float or None
+        max duration in seconds of each test.
+    tc_timeout: float or None
+        max duration in seconds of all testcase's tests.
+    stall: float or None
+        duration in seconds between stacks dumps of a running test.
+    stall_file: file or None
+        file where stacks of running test are dumped.
+    active: bool
+        timeouts set and SIGALRM usable.
+    tc_deadline: float or None
+        time.monotonic() when testcase's timeout is exceeded.
+    reason: str or None
+        message of timeout to raise in current test.
+    inside: bool
+        a part of test (setUp, method...) is running.
+    expired: bool
+        timeout exceeded outside a part, raised at start of next one.
+    previous_handler: callable or None
+        SIGALRM's handler restored at exit.
+
+    Methods
+    ----------
+    __enter__():
+        Install SIGALRM's handler and start testcase's timeout.
+    __exit__(*exc_infos):
+        Disarm timer and restore previous SIGALRM's handler.
+    alarm(signum, frame):
+        Handler of SIGALRM, raise timeout inside a test's part or keep it.
+    guard(call):
+        Return call raising timeout if exceeded, marked inside test's part.
+    test_limit():
+        Return deadline and reason of the starting test's timeout.
+    limited(awaitable, limit):
+        Await awaitable, raise timeout once if limit's deadline exceeded.
+    limit_call(call, limit):
+        Return call of async functions limited on test's loop.
+    start_test(test):
+        Arm timer for a test and guard its parts.
+    stop_test():
+        Disarm test's timer and stop dumps.
+    start_stall(test):
+        Dump stacks in test's stall file if test is stalled.
+    stop_stall():
+        Stop dumps, remove stall file if test not stalled.
+    """
+
+    def __init__(self, timeout=None, tc_timeout=None, stall=None):
+        """
+        Set timeouts, active if one of them set and SIGALRM usable.
+
+        Parameters
+        ----------
+            timeout: float or None (default: None)
+                max duration in seconds of each test.
+            tc_timeout: float or None (default: None)
+                max duration in seconds of all testcase's tests.
+            stall: float or None (default: None)
+                duration in seconds between stacks dumps of a running test.
+        """
+        self.timeout = timeout
+        self.tc_timeout = tc_timeout
+        self.stall = stall
+        self.stall_file = None
+        self.active = bool(timeout or tc_timeout) and hasattr(
+            signal, 'setitimer') and (
+            threading.current_thread() is threading.main_thread())
+        self.tc_deadline = None
+        self.reason = None
+        self.inside = False
+        self.expired = False
+        self.previous_handler = None
+
+    def __enter__(self):
+        """
+        Install SIGALRM's handler and start testcase's timeout.
+
+        Return
+        ----------
+            self
+        """
+        if self.tc_timeout:
+            self.tc_deadline = time.monotonic() + self.tc_timeout
+        if self.active:
+            self.previous_handler = signal.signal(signal.SIGALRM, self.alarm)
+        return self
+
+    def __exit__(self, *exc_infos):
+        """
+        Disarm timer and restore previous SIGALRM's handler.
+
+        Parameters
+        ----------
+            exc_infos: tuple
+                exception type, value and traceback, or None.
+        """
+        self.stop_stall()
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.previous_handler)
+
+    def alarm(self, signum, frame):
+        """
+        Handler of SIGALRM, raise timeout inside a test's part or keep it.
+
+        Parameters
+        ----------
+            signum: int
+                SIGALRM .
+            frame: frame
+                interrupted frame.
+
+        Raises
+        ----------
+            TestTimeout: inside a test's part.
+        """
+        if self.inside:
+            raise TestTimeout(self.reason)
+        self.expired = True  # raised at start of next test's part
+
+    def guard(self, call):
+        """
+        Return call raising timeout if exceeded, marked inside test's part.
+
+        Parameters
+        ----------
+            call: method
+                _callSetUp, _callTestMethod, _callTearDown or _callCleanup .
+
+        Return
+        ----------
+            function
+                wrapper of call.
+        """
+        @wraps(call)
+        def guarded_call(*args, **kwargs):
+            if self.expired:  # exceeded outside a part, raised once
+                self.expired = False
+                raise TestTimeout(self.reason)
+            self.inside = True
+            try:
+                return call(*args, **kwargs)
+            finally:
+                self.inside = False
+
+        return guarded_call
+
+    def test_limit(self):
+        """
+        Return deadline and reason of the starting test's timeout.
+
+        Return
+        ----------
+            list or None
+                [time.monotonic() when exceeded, message], None without
+                timeout.
+        """
+        delay, reason = None, None
+        if self.timeout:
+            delay = self.timeout
+            reason = f"Test timeout of {format_duration(delay)}"
+        if self.tc_deadline is not None:
+            tc_delay = self.tc_deadline - time.monotonic()
+            if delay is None or tc_delay < delay:
+                delay = tc_delay
+                reason = "".join([
+                    "Testcase timeout of ", format_duration(self.tc_timeout)])
+        if delay is None:
+            return None
+        return [time.monotonic() + delay, reason]
+
+    @staticmethod
+    async def limited(awaitable, limit):
+        """
+        Await awaitable, raise timeout once if limit's deadline exceeded.
+
+        Parameters
+        ----------
+            awaitable: awaitable
+                part of a test running on a shared loop.
+            limit: list or None
+                [deadline, message] of test, deadline None once raised.
+
+        Return
+        ----------
+            object
+                awaitable's result.
+
+        Raises
+        ----------
+            TestTimeout: deadline exceeded while awaiting.
+        """
+        if limit is None or limit[0] is None:
+            return await awaitable
+        try:
+            async with asyncio.timeout(limit[0] - time.monotonic()) as t_out:
+                return await awaitable
+        except TimeoutError:
+            if not t_out.expired():  # raised by test itself
+                raise
+        limit[0] = None  # raised once by test
+        raise TestTimeout(limit[1])
+
+    def limit_call(self, call, limit):
+        """
+        Return call of async functions limited on test's loop.
+
+        Parameters
+        ----------
+            call: method
+                _callAsync or _callMaybeAsync of IsolatedAsyncioTestCase .
+            limit: list
+                [deadline, message] of test.
+
+        Return
+        ----------
+            function
+                wrapper of call.
+        """
+        @wraps(call)
+        def limited_call(func, *args, **kwargs):
+            if not iscoroutinefunction(func):
+                return call(func, *args, **kwargs)
+
+            async def limited_func():
+                return await self.limited(func(*args, **kwargs), limit)
+
+            return call(limited_func)
+
+        return limited_call
+
+    def start_test(self, test):
+        """
+        Arm timer for a test and guard its parts.
+
+        A test on a shared loop has its async calls limited instead.
+
+        Parameters
+        ----------
+            test: TestCase
+                test method starting.
+        """
+        if self.stall:
+            self.start_stall(test)
+        if getattr(test, '_sharedLoop', False):  # not SIGALRM on loop
+            limit = self.test_limit()
+            if limit is not None:
+                for name in ('_callAsync', '_callMaybeAsync'):
+                    setattr(test, name, self.limit_call(
+                        getattr(test, name), limit))
+            return
+        if not self.active:
+            return
+        self.inside, self.expired = False, False
+        deadline, self.reason = self.test_limit()
+        delay = deadline - time.monotonic()
+        for name in TEST_PARTS:
+            setattr(test, name, self.guard(getattr(test, name)))
+        if delay <= 0:  # testcase's timeout already exceeded
+            self.expired = True
+        else:
+            signal.setitimer(signal.ITIMER_REAL, delay)
+
+    def stop_test(self):
+        """
+        Disarm test's timer and stop dumps.
+        """
+        self.stop_stall()
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            self.inside, self.expired = False, False
+
+    def start_stall(self, test):
+        """
+        Dump stacks in test's stall file if test is stalled.
+
+        Parameters
+        ----------
+            test: TestCase
+                test method starting.
+        """
+        self.stop_stall()  # previous test not stopped (concurrent tests)
+        self.stall_file = open(stall_path(test.id()), 'w')
+        faulthandler.dump_traceback_later(
+            self.stall, repeat=True, file=self.stall_file)
+
+    def stop_stall(self):
+        """
+        Stop dumps, remove stall file if test not stalled.
+        """
+        if self.stall_file is None:
+            return
+        faulthandler.cancel_dump_traceback_later()
+        stalled = fstat(self.stall_file.fileno()).st_size > 0
+        self.stall_file.close()
+        if not stalled:
+            remove(self.stall_file.name)
+        self.stall_file = None
@@ -16,19 +16,47 @@ from testcases_executor.tests.test_tc_utils import TestUtilsFunctions
 from testcases_executor.tests.test_tc_groups import (
     TestGroupsFunctions, TestLoader, TestGroup, TestGroups)
 from testcases_executor.tests.test_tc_parser import (
-    TestHelpFormatter, TestParser)
-from testcases_executor.tests.test_tc_result import TestTestCasesResult
+    TestParserFunctions, TestHelpFormatter, TestParser, TestMergeParser)
+from testcases_executor.tests.test_tc_result import (
+    TestTestRecord, TestTestDurations, TestTestCasesResult)
 from testcases_executor.tests.test_tc_runner import TestTestRunner
+from testcases_executor.tests.test_tc_parallel import (
+    TestParallelFunctions, TestSharedStopResult, TestTestCasesOutcomes)
+from testcases_executor.tests.test_tc_async import TestSharedLoopSuite
+from testcases_executor.tests.test_tc_cache import TestCacheFunctions
+from testcases_executor.tests.test_tc_watchdog import TestWatchdog
+from testcases_executor.tests.test_tc_memory import (
+    TestMemoryFunctions, TestMemoryTracer)
+from testcases_executor.tests.test_tc_stream import TestBatchedStream
+from testcases_executor.tests.test_tc_traces import (
+    TestTracesFunctions, TestTracebackStore)
+from testcases_executor.tests.test_tc_history import TestRunHistory
+from testcases_executor.tests.test_tc_impact import (
+    TestImpactFunctions, TestImpactTracer)
+from testcases_executor.tests.test_tc_merge import (
+    TestMergeFunctions, TestJournal, TestRecordedTestCase, TestRecordedSuite,
+    TestRecordedGroups)
 from testcases_executor.tests.test_tc_reporter import (
     TestTestCasesHtmlReport, TestContextInfos, TestContextHeader,
     TestContextGroup, TestContextTestCase, TestContextMethod,
-    TestContextsFunctions, TestContextReport)
+    TestContextError, TestContextReport)
 
 
 __all__ = [
     'TestMainFunctions', 'TestUtilsFunctions', 'TestGroupsFunctions',
-    'TestLoader', 'TestGroup', 'TestGroups', 'TestHelpFormatter', 'TestParser',
-    'TestTestCasesResult', 'TestTestRunner', 'TestTestCasesHtmlReport',
+    'TestLoader', 'TestGroup', 'TestGroups', 'TestParserFunctions',
+    'TestHelpFormatter', 'TestParser', 'TestMergeParser',
+    'TestTestRecord', 'TestTestDurations', 'TestTestCasesResult',
+    'TestTestRunner',
+    'TestParallelFunctions',
+    'TestSharedStopResult', 'TestTestCasesOutcomes', 'TestSharedLoopSuite',
+    'TestCacheFunctions', 'TestWatchdog', 'TestMemoryFunctions',
+    'TestMemoryTracer', 'TestBatchedStream', 'TestTracesFunctions',
+    'TestTracebackStore', 'TestRunHistory', 'TestImpactFunctions',
+    'TestImpactTracer',
+    'TestMergeFunctions', 'TestJournal', 'TestRecordedTestCase',
+    'TestRecordedSuite', 'TestRecordedGroups',
+    'TestTestCasesHtmlReport',
     'TestContextInfos', 'TestContextHeader', 'TestContextGroup',
-    'TestContextTestCase', 'TestContextMethod', 'TestContextsFunctions',
+    'TestContextTestCase', 'TestContextMethod', 'TestContextError',
     'TestContextReport']
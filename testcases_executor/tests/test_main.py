@@ -26,13 +26,20 @@ class TestMainFunctions(TestCase):
     ----------
     test_main():
         Assert if groups is constructed, parsed and testscases runned.
+    test_main_merge():
+        Assert saved results merged and reported with merge command.
     """
 
+    @patch('testcases_executor.__main__.sys')
+    @patch('testcases_executor.__main__.clear_stalls')
+    @patch('testcases_executor.__main__.save_result')
     @patch('testcases_executor.__main__.TestCasesHtmlReport')
     @patch('testcases_executor.__main__.TestCasesGroups')
     @patch('testcases_executor.__main__.TestCasesParser')
     @patch('testcases_executor.__main__.TestCasesRunner')
-    def test_main(self, mock_runner, mock_parser, mock_groups, mock_report):
+    def test_main(
+            self, mock_runner, mock_parser, mock_groups, mock_report,
+            mock_save, mock_clear, mock_sys):
         """
         Assert if groups is constructed, parsed and testscases runned.
 
@@ -48,13 +55,19 @@ class TestMainFunctions(TestCase):
             Mock of TestCasesGroups.
         mock_report : Mock
             Mock of TestCasesHtmlReport.
+        mock_save : Mock
+            Mock of tc_merge.save_result .
+        mock_clear : Mock
+            Mock of tc_cache.clear_stalls .
+        mock_sys : Mock
+            Mock of sys to set argv.
 
         Assertions:
         ----------
         assertEqual:
             Assert if groups called once.
         assert_called_once_with:
-            parser .parse_args, groups.construct_suites,
+            parser .parse_args, groups.construct_suites, clear_stalls,
             runner .run, report called once with parameter
         """
         groups = Mock()
@@ -64,14 +77,80 @@ class TestMainFunctions(TestCase):
         mock_runner.return_value = runner
         parse_args = Mock()
         parse_args.open = 'open'
+        parse_args.jobs = 'jobs'
+        parse_args.by_group = 'by_group'
+        parse_args.failfast = 'failfast'
+        parse_args.mem = 'mem'
+        parse_args.journal = 'journal'
+        parse_args.display = 'display'
+        parse_args.history = 'history'
+        parse_args.durations = 'durations'
+        parse_args.record_impact = 'record_impact'
+        parse_args.json = None
         parser = Mock()
         parser.parse_args.return_value = parse_args
         mock_parser.return_value = parser
+        mock_sys.argv = ['testcases_executor', '-j', '2']
         main()
         self.assertEqual(mock_groups.call_count, 1)
         mock_parser.assert_called_once_with(groups)
         parser.parse_args.assert_called_once_with()
         groups.construct_suites.assert_called_once_with(parse_args)
-        mock_runner.assert_called_once_with()
+        mock_clear.assert_called_once_with()
+        mock_runner.assert_called_once_with(
+            'jobs', 'by_group', 'failfast', 'mem', 'journal', 'display',
+            'history', 'durations', 'record_impact')
         runner.run.assert_called_once_with(groups)
-        mock_report.assert_called_once_with('Result', 'open')
+        mock_report.assert_called_once_with('Result', 'open', True)
+        mock_save.assert_not_called()
+        parse_args.json = 'result.json'
+        main()
+        mock_save.assert_called_once_with('Result', 'result.json')
+
+    @patch('testcases_executor.__main__.sys')
+    @patch('testcases_executor.__main__.TestCasesHtmlReport')
+    @patch('testcases_executor.__main__.RecordedGroups')
+    @patch('testcases_executor.__main__.TestCasesMergeParser')
+    @patch('testcases_executor.__main__.TestCasesRunner')
+    def test_main_merge(
+            self, mock_runner, mock_parser, mock_groups, mock_report,
+            mock_sys):
+        """
+        Assert saved results merged and reported with merge command.
+
+        Parameters:
+        ----------
+        mock_runner : Mock
+            Mock of TestCasesRunner.
+        mock_parser : Mock
+            Mock of TestCasesMergeParser.
+        mock_groups : Mock
+            Mock of RecordedGroups.
+        mock_report : Mock
+            Mock of TestCasesHtmlReport.
+        mock_sys : Mock
+            Mock of sys to set argv.
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            parser .parse_args, groups, runner .run, report called once with
+            parameter, without stacks dumped by a local run.
+        assert_called_with:
+            Assert runner maked for recorded results.
+        assertEqual:
+            Assert result start time.
+        """
+        mock_sys.argv = ['testcases_executor', 'merge', 'a.json', 'b.json']
+        args = Mock(files=['a.json', 'b.json'], open='open')
+        mock_parser().parse_args.return_value = args
+        mock_groups.return_value = Mock(start_time='start time')
+        result = Mock()
+        mock_runner().run.return_value = result
+        main()
+        mock_parser().parse_args.assert_called_once_with(['a.json', 'b.json'])
+        mock_groups.assert_called_once_with(['a.json', 'b.json'])
+        mock_runner.assert_called_with(recorded=True)  # no cache saved
+        mock_runner().run.assert_called_once_with(mock_groups())
+        self.assertEqual(result.start_time, 'start time')
+        mock_report.assert_called_once_with(result, 'open', False)
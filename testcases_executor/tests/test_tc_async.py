@@ -0,0 +1,329 @@
+"""
+Module testcases_executor.tests.test_tc_async .
+
+Contain TestCase for testcases_executor.tc_async .
+
+unittest.TestCase sublasses:
+    TestSharedLoopSuite
+
+Imports:
+    asyncio
+    time
+    from unittest: TestCase, IsolatedAsyncioTestCase, expectedFailure
+    from unittest.mock: patch, Mock
+    from testcases_executor.tc_async: SharedLoopSuite
+    from testcases_executor.tc_result: TestCasesResult
+"""
+import asyncio
+import time
+from unittest import TestCase, IsolatedAsyncioTestCase, expectedFailure
+from unittest.mock import patch, Mock
+from testcases_executor.tc_async import SharedLoopSuite
+from testcases_executor.tc_result import TestCasesResult
+
+
+class SubclassTCloop(IsolatedAsyncioTestCase):
+    """
+    A subclass of unittest.IsolatedAsyncioTestCase .
+
+    Save running loop of each test method.
+    """
+    loops = []
+
+    async def test_one(self):
+        self.loops.append(asyncio.get_running_loop())
+
+    async def test_two(self):
+        self.loops.append(asyncio.get_running_loop())
+
+
+class SubclassTCconcurrent(IsolatedAsyncioTestCase):
+    """
+    A subclass of unittest.IsolatedAsyncioTestCase .
+
+    Declared concurrency-safe, tests are awaiting.
+    """
+    concurrent_tests = True
+
+    async def asyncSetUp(self):
+        self.cleaned = []
+        self.addAsyncCleanup(self.async_cleanup)
+
+    async def async_cleanup(self):
+        self.cleaned.append(True)
+
+    async def test_one(self):
+        await asyncio.sleep(0.2)
+
+    async def test_two(self):
+        await asyncio.sleep(0.2)
+
+    async def test_skip(self):
+        self.skipTest('reason')
+
+    @expectedFailure
+    async def test_exp_fail(self):
+        await asyncio.sleep(0.1)
+        self.assertTrue(False)
+
+
+class TestSharedLoopSuite(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_async.SharedLoopSuite .
+
+    Methods
+    ----------
+    test_gathers():
+        Assert tests gathered only with concurrent_tests and asyncio.Runner .
+    test_share_runner():
+        Assert test use runner and not create or close its own one.
+    test_run():
+        Assert all tests runned on the same loop and result updated.
+    test_run_without_runner():
+        Assert tests runned as TestSuite without asyncio.Runner .
+    test_run_concurrently():
+        Assert concurrent tests gathered, each with its status and duration.
+    test_run_test():
+        Assert failures, errors and unexpected success added to result.
+    test_run_test_parts():
+        Assert tests started first, errors of each part added, cleanups.
+    """
+
+    def test_gathers(self):
+        """
+        Assert tests gathered only with concurrent_tests and asyncio.Runner .
+
+        Assertions:
+        ----------
+        assertTrue:
+            Assert testcase with concurrent_tests gathered.
+        assertFalse:
+            Assert other testcase not gathered, nor without asyncio.Runner .
+        """
+        self.assertFalse(SharedLoopSuite.gathers(SubclassTCloop))
+        if hasattr(asyncio, 'Runner'):
+            self.assertTrue(SharedLoopSuite.gathers(SubclassTCconcurrent))
+        with patch("testcases_executor.tc_async.asyncio", spec=[]):
+            self.assertFalse(SharedLoopSuite.gathers(SubclassTCconcurrent))
+
+    def test_share_runner(self):
+        """
+        Assert test use runner and not create or close its own one.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert test's runner.
+        assertIsNone:
+            Assert setup and teardown runner do nothing.
+        assertTrue:
+            Assert test marked on a shared loop, limited on it.
+        """
+        test = SubclassTCloop('test_one')
+        SharedLoopSuite.share_runner(test, 'runner')
+        self.assertEqual(test._asyncioRunner, 'runner')
+        self.assertIsNone(test._setupAsyncioRunner())
+        self.assertIsNone(test._tearDownAsyncioRunner())
+        self.assertTrue(test._sharedLoop)
+
+    def test_run(self):
+        """
+        Assert all tests runned on the same loop and result updated.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert number of loops and tests runned.
+        assertIs:
+            Assert loop is the same for the two tests.
+        assertTrue:
+            Assert loop closed after suite runned.
+        """
+        SubclassTCloop.loops = []
+        tests = [SubclassTCloop('test_one'), SubclassTCloop('test_two')]
+        result = TestCasesResult(Mock())
+        SharedLoopSuite(tests)(result)
+        self.assertEqual(result.testsRun, 2)
+        self.assertEqual(len(result.records), 2)
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(len(SubclassTCloop.loops), 2)
+        self.assertIs(SubclassTCloop.loops[0], SubclassTCloop.loops[1])
+        self.assertTrue(SubclassTCloop.loops[0].is_closed())
+
+    @patch("testcases_executor.tc_async.asyncio")
+    def test_run_without_runner(self, mock_asyncio):
+        """
+        Assert tests runned as TestSuite without asyncio.Runner .
+
+        Parameters:
+        ----------
+        mock_asyncio : Mock
+            Mock of asyncio without Runner.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert number of tests runned.
+        assertNotIn:
+            Assert tests's runner not shared.
+        """
+        del mock_asyncio.Runner
+        tests = [SubclassTCloop('test_one'), SubclassTCloop('test_two')]
+        result = TestCasesResult(Mock())
+        SharedLoopSuite(tests)(result)
+        self.assertEqual(result.testsRun, 2)
+        self.assertNotIn('_setupAsyncioRunner', vars(tests[0]))
+
+    def test_run_concurrently(self):
+        """
+        Assert concurrent tests gathered, each with its status and duration.
+
+        Assertions:
+        ----------
+        assertLess:
+            Assert suite duration less than sum of tests durations.
+        assertEqual:
+            Assert number of tests runned, skipped and expected failures.
+        assertGreaterEqual:
+            Assert each test duration.
+        assertTrue:
+            Assert async cleanup called.
+        assertIn, assertIsNone:
+            Assert test's parts timed, not its CPU time.
+        """
+        tests = [SubclassTCconcurrent(t_name) for t_name in [
+            'test_one', 'test_two', 'test_skip', 'test_exp_fail']]
+        result = TestCasesResult(Mock())
+        t_start = time.time()
+        SharedLoopSuite(tests)(result)
+        self.assertLess(time.time() - t_start, 0.35)
+        self.assertEqual(result.testsRun, 4)
+        self.assertEqual(len(result.skipped), 1)
+        self.assertEqual(len(result.expectedFailures), 1)
+        self.assertTrue(result.wasSuccessful())
+        for test in tests[:2]:
+            self.assertGreaterEqual(result.records[test].duration, 0.19)
+            self.assertEqual(test.cleaned, [True])
+            self.assertGreaterEqual(result.records[test].parts['test'], 0.19)
+            self.assertIn('cleanup', result.records[test].parts)
+            self.assertIsNone(result.records[test].cpu)  # tests interleaved
+        self.assertGreaterEqual(result.records[tests[3]].duration, 0.09)
+
+    def test_run_test(self):
+        """
+        Assert failures, errors and unexpected success added to result.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Concurrent testcase with a failed, an error and a success test.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests in errors lists.
+        assertNotIn:
+            Assert frames of tc_async hidden in tracebacks.
+        """
+        class FakeTestCase(IsolatedAsyncioTestCase):
+            concurrent_tests = True
+
+            async def test_fail(self):
+                self.assertTrue(False)
+
+            async def test_error(self):
+                raise ValueError('error')
+
+            @expectedFailure
+            async def test_unexp_suc(self):
+                pass
+
+        tests = [FakeTestCase(t_name) for t_name in [
+            'test_fail', 'test_error', 'test_unexp_suc']]
+        result = TestCasesResult(Mock())
+        SharedLoopSuite(tests)(result)
+        self.assertEqual(result.failures[0][0], tests[0])
+        self.assertIn('AssertionError', result.failures[0][1])
+        self.assertNotIn('run_part', result.failures[0][1])
+        self.assertEqual(result.errors[0][0], tests[1])
+        self.assertIn('ValueError: error', result.errors[0][1])
+        self.assertEqual(result.unexpectedSuccesses, [tests[2]])
+
+    def test_run_test_parts(self):
+        """
+        Assert tests started first, errors of each part added, cleanups.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Concurrent testcase failing in setUp, tearDown, cleanups or
+            with SystemExit.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests started before runned, cleanups runned for each
+            test, errors and failures added by test.
+        assertIn:
+            Assert errors of each part in result.
+        """
+        class FakeTestCase(IsolatedAsyncioTestCase):
+            concurrent_tests = True
+            cleaned, runned = [], []
+
+            async def asyncSetUp(self):
+                self.addCleanup(self.cleaned.append, self._testMethodName)
+                self.addCleanup(self.fail_cleanup)  # runned first
+                if self._testMethodName == 'test_setup':
+                    raise ValueError('setUp')
+
+            def fail_cleanup(self):
+                raise ValueError('cleanup')
+
+            async def asyncTearDown(self):
+                if self._testMethodName == 'test_teardown':
+                    raise ValueError('tearDown')
+
+            async def test_setup(self):
+                pass
+
+            async def test_teardown(self):
+                self.assertTrue(False)
+
+            async def test_exit(self):
+                self.runned.append(self._testMethodName)
+                await asyncio.sleep(0.05)
+                raise SystemExit
+
+            async def test_started(self):
+                self.runned.append(self._testMethodName)
+                await asyncio.sleep(0.1)
+
+        tests = [FakeTestCase(t_name) for t_name in [
+            'test_setup', 'test_teardown', 'test_exit', 'test_started']]
+        result = TestCasesResult(Mock())
+        started = []
+        result.startTest = Mock(side_effect=lambda test: started.append(
+            (test._testMethodName, list(FakeTestCase.runned))))
+        SharedLoopSuite(tests)(result)
+        self.assertEqual(started, [
+            ('test_setup', []), ('test_teardown', []), ('test_exit', []),
+            ('test_started', ['test_exit'])])
+        self.assertEqual(FakeTestCase.runned, ['test_exit', 'test_started'])
+        self.assertEqual(sorted(FakeTestCase.cleaned), sorted(
+            test._testMethodName for test in tests))
+        errors = {}
+        for test, err in result.errors:
+            errors.setdefault(test._testMethodName, []).append(err)
+        self.assertEqual(
+            [test._testMethodName for test, _ in result.failures],
+            ['test_teardown'])
+        self.assertIn('ValueError: setUp', errors['test_setup'][0])
+        self.assertIn('ValueError: cleanup', errors['test_setup'][1])
+        self.assertIn('ValueError: tearDown', errors['test_teardown'][0])
+        self.assertIn('ValueError: cleanup', errors['test_teardown'][1])
+        self.assertIn('SystemExit', errors['test_exit'][0])
+        self.assertEqual(len(errors['test_started']), 1)  # cleanup's one
+        self.assertIn(tests[3], result.records)
@@ -0,0 +1,214 @@
+"""
+Module testcases_executor.tests.test_tc_cache .
+
+Contain TestCase for testcases_executor.tc_cache .
+
+unittest.TestCase sublasses:
+    TestCacheFunctions
+
+Imports:
+    from os.path: join
+    from tempfile: TemporaryDirectory
+    from unittest: TestCase
+    from unittest.mock: patch, Mock
+    from testcases_executor.tc_cache: (
+        load_cache, save_cache, tc_id, load_durations, save_durations,
+        load_timings, expected_durations, load_failed, save_failed,
+        stall_path, load_stalls, clear_stalls)
+"""
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch, Mock
+from testcases_executor.tc_cache import (
+    load_cache, save_cache, tc_id, load_durations, save_durations,
+    load_timings, expected_durations, load_failed, save_failed, stall_path,
+    load_stalls, clear_stalls)
+
+
+class TestCacheFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_cache functions, in a temporary cache dir.
+
+    Methods
+    ----------
+    setUp():
+        Create a temporary dir and use it as cache dir.
+    tearDown():
+        Stop patch and remove temporary dir.
+    test_save_load_cache():
+        Assert datas saved are loaded, default returned without valid file.
+    test_tc_id():
+        Assert id maked with module and qualname.
+    test_save_load_durations():
+        Assert durations updated with result ones and loaded.
+    test_load_timings():
+        Assert tests's durations loaded from a given file.
+    test_expected_durations():
+        Assert tests never runned expected to last the mean of known ones.
+    test_save_load_failed():
+        Assert failed tests updated with result ones and loaded.
+    test_stalls():
+        Assert stacks dumped in stall files loaded by test id and cleared.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary dir and use it as cache dir.
+        """
+        self.tmp_dir = TemporaryDirectory()
+        self.cache_dir = join(self.tmp_dir.name, 'cache')
+        self.patcher = patch(
+            "testcases_executor.tc_cache.CACHE_DIR", self.cache_dir)
+        self.patcher.start()
+
+    def tearDown(self):
+        """
+        Stop patch and remove temporary dir.
+        """
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def test_save_load_cache(self):
+        """
+        Assert datas saved are loaded, default returned without valid file.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert loaded datas.
+        """
+        self.assertEqual(load_cache('foo.json', 'default'), 'default')
+        save_cache('foo.json', {'foo': [1, 2]})
+        self.assertEqual(load_cache('foo.json', 'default'), {'foo': [1, 2]})
+        with open(join(self.cache_dir, 'foo.json'), 'w') as cache_file:
+            cache_file.write('{not json')
+        self.assertEqual(load_cache('foo.json', 'default'), 'default')
+
+    def test_tc_id(self):
+        """
+        Assert id maked with module and qualname.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert returned id.
+        """
+        self.assertEqual(
+            tc_id(TestCacheFunctions),
+            'testcases_executor.tests.test_tc_cache.TestCacheFunctions')
+        self.assertEqual(
+            f"{tc_id(TestCacheFunctions)}.test_tc_id",
+            self.id())
+
+    def test_save_load_durations(self):
+        """
+        Assert durations updated with result ones and loaded.
+
+        Assertions:
+        ----------
+        assertDictEqual:
+            Assert loaded durations.
+        """
+        self.assertDictEqual(
+            load_durations(), {'tests': {}, 'testcases': {}})
+        save_cache('durations.json', {
+            'tests': {'old': 2, 'tc.test_one': 3}, 'testcases': {'tc': 3}})
+        test_one = Mock()
+        test_one.id.return_value = 'tc.test_one'
+        testcase = Mock(__module__='module', __qualname__='TC')
+        result = Mock(
+            records={test_one: Mock(duration=1)},
+            durations={'testcases': {testcase: 1}})
+        save_durations(result)
+        self.assertDictEqual(load_durations(), {
+            'tests': {'old': 2, 'tc.test_one': 1},
+            'testcases': {'tc': 3, 'module.TC': 1}})
+
+    def test_load_timings(self):
+        """
+        Assert tests's durations loaded from a given file.
+
+        Assertions:
+        ----------
+        assertDictEqual:
+            Assert loaded durations, empty without tests.
+        """
+        path = join(self.tmp_dir.name, 'timings.json')
+        with open(path, 'w') as timing_file:
+            timing_file.write(
+                '{"tests": {"tc.test_one": 2}, "testcases": {"tc": 2}}')
+        self.assertDictEqual(load_timings(path), {'tc.test_one': 2})
+        with open(path, 'w') as timing_file:
+            timing_file.write('{}')
+        self.assertDictEqual(load_timings(path), {})
+
+    def test_expected_durations(self):
+        """
+        Assert tests never runned expected to last the mean of known ones.
+
+        Assertions:
+        ----------
+        assertDictEqual:
+            Assert expected durations, 1 second without previous runs.
+        """
+        self.assertDictEqual(
+            expected_durations(['t1', 't3'], {'t1': 2, 't2': 4}),
+            {'t1': 2, 't3': 3})
+        self.assertDictEqual(
+            expected_durations(['t1', 't2'], {}), {'t1': 1, 't2': 1})
+
+    def test_save_load_failed(self):
+        """
+        Assert failed tests updated with result ones and loaded.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert loaded failed tests, not runned ones kept, testcases
+            whose fixture failed, not the others.
+        """
+        self.assertEqual(load_failed(), set())
+        save_cache('failed.json', ['old', 'tc.fixed', 'mod.TCfixed'])
+        records = {}
+        for t_id, status in [
+                ('tc.fixed', 'success'), ('tc.fail', 'failed'),
+                ('tc.error', 'errors'), ('tc.skip', 'skipped')]:
+            test = Mock()
+            test.id.return_value = t_id
+            records[test] = Mock(status=status)
+        tc_fixed = Mock(__module__='mod', __qualname__='TCfixed')
+        tc_class = Mock(__module__='mod', __qualname__='TCclass')
+        tc_sub = Mock(__module__='mod', __qualname__='TCsub')
+        save_failed(Mock(
+            records=records, test_methods=[('group', [
+                (tc_fixed, []), (tc_class, []), (tc_sub, [])])],
+            unrecorded={
+                tc_class: [('errors', 'setUpClass (mod.TCclass)', 'e', None)],
+                tc_sub: [('failed', 'test_a (mod.TCsub.test_a)', 'e', None)]}))
+        self.assertEqual(
+            load_failed(), {'old', 'tc.fail', 'tc.error', 'mod.TCclass'})
+
+    def test_stalls(self):
+        """
+        Assert stacks dumped in stall files loaded by test id and cleared.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert stall file's path.
+        assertDictEqual:
+            Assert loaded stacks.
+        """
+        self.assertDictEqual(load_stalls(), {})
+        path = stall_path('module.TC.test_one')
+        self.assertEqual(
+            path, join(self.cache_dir, 'stalls', 'module.TC.test_one.txt'))
+        with open(path, 'w') as stall_file:
+            stall_file.write('stacks')
+        self.assertDictEqual(load_stalls(), {'module.TC.test_one': 'stacks'})
+        clear_stalls()
+        self.assertDictEqual(load_stalls(), {})
+        clear_stalls()  # nothing to clear
@@ -10,15 +10,17 @@ unittest.TestCase sublasses:
     TestGroups
 
 Imports:
-    from unittest: TestCase
+    from unittest: TestCase, IsolatedAsyncioTestCase
     from unittest.mock: patch, Mock, call
     from testcases_executor.tc_groups: (
         import_groups, GroupTestLoader, TestCasesGroup, TestCasesGroups
+    from testcases_executor.tc_async: SharedLoopSuite
 """
-from unittest import TestCase
+from unittest import TestCase, IsolatedAsyncioTestCase
 from unittest.mock import patch, Mock, call
 from testcases_executor.tc_groups import (
     import_groups, GroupTestLoader, TestCasesGroup, TestCasesGroups)
+from testcases_executor.tc_async import SharedLoopSuite
 
 
 class TestGroupsFunctions(TestCase):
@@ -131,6 +133,17 @@ class SubclassTCtwo(TestCase):
         pass
 
 
+class SubclassTCasync(IsolatedAsyncioTestCase):
+    """
+    A subclass of unittest.IsolatedAsyncioTestCase .
+
+    Used to update suites with a shared loop suite.
+    """
+
+    async def test_foo(self):
+        pass
+
+
 class TestGroup(TestCase):
     """
     A subclass of unittest.TestCase .
@@ -190,11 +203,11 @@ class TestGroup(TestCase):
         arg_name_h = (  # group's argument name 'h', tup[1]
             ("group test", "h", 1), mock_error_two,
             ValueError,
-            "Group's argument name must not be 'h' or 'o': h.")
+            "Group's argument name must not be 'h' or 'o' or 'j' or 'q': h.")
         arg_name_o = (  # group's argument name 'o', tup[1]
             ("group test", "o", 1), mock_error_two,
             ValueError,
-            "Group's argument name must not be 'h' or 'o': o.")
+            "Group's argument name must not be 'h' or 'o' or 'j' or 'q': o.")
         tc_no_list_tup = (  # testcases not a list or tuple, tup[1]
             ("group test", "test", 2), mock_error_one,
             TypeError,
@@ -218,7 +231,7 @@ class TestGroup(TestCase):
         item_name_h = (  # testcase name 'h'
             ("group test", "test", [SubclassTCone, h]),
             mock_error_two, ValueError,
-            "TestCase's name must not be 'h' or 'o': h.")
+            "TestCase's name must not be 'h' or 'o' or 'j' or 'q': h.")
 
         class o(TestCase):
             pass
@@ -226,16 +239,42 @@ class TestGroup(TestCase):
         item_name_o = (  # testcase name 'o'
             ("group test", "test", [SubclassTCone, o]),
             mock_error_two, ValueError,
-            "TestCase's name must not be 'h' or 'o': o.")
+            "TestCase's name must not be 'h' or 'o' or 'j' or 'q': o.")
         item_no_used_once = (  # testcase not used once
             ("group test", "test", [SubclassTCone, SubclassTCone]),
             mock_error_two, ValueError,
             "Testcase's subclass must used once in group: 'SubclassTCone'.")
+        settings_no_dict = (  # settings not a dict, tup[3]
+            ("group test", "test", [SubclassTCone], 1), mock_error_one,
+            TypeError, "Group's settings must be 'dict', not 'int': 1")
+        setting_unknown = (  # unknown setting
+            ("group test", "test", [SubclassTCone], {'foo': 1}),
+            mock_error_two, ValueError,
+            "".join([
+                "Group's setting must be 'timeout' or 'testcase_timeout' ",
+                "or 'stall': foo."]))
+        setting_no_number = (  # timeout not a number
+            ("group test", "test", [SubclassTCone], {'timeout': "1"}),
+            mock_error_one, TypeError,
+            "Group's timeout must be 'int' or 'float', not 'str': 1")
+        setting_bool = (  # timeout a bool
+            ("group test", "test", [SubclassTCone], {'timeout': True}),
+            mock_error_two, TypeError,
+            "Group's timeout must be 'int' or 'float', not 'bool': True")
+        setting_no_positive = (  # timeout not positive
+            ("group test", "test", [SubclassTCone], {'testcase_timeout': 0}),
+            mock_error_two, ValueError,
+            "Group's testcase_timeout must be positive: 0.")
+        setting_nan = (  # timeout not a number
+            ("group test", "test", [SubclassTCone], {'stall': float('nan')}),
+            mock_error_two, ValueError, "Group's stall must be positive: nan.")
         for group_tup, mock_error, e_type, e_msg in [
                 name_no_str, name_empty, arg_name_no_str, arg_name_empty,
                 arg_name_space, arg_name_h, arg_name_o, tc_no_list_tup,
                 item_no_class, item_no_subclass, item_name_o, item_name_h,
-                item_no_used_once]:
+                item_no_used_once, settings_no_dict, setting_unknown,
+                setting_no_number, setting_bool, setting_no_positive,
+                setting_nan]:
             try:
                 TestCasesGroup(group_tup)
             except Exception:
@@ -250,6 +289,17 @@ class TestGroup(TestCase):
         self.assertEqual(obj.arg_name, "test")
         self.assertListEqual(obj.testcases, [SubclassTCone, SubclassTCtwo])
         self.assertListEqual(obj.suites, [])
+        self.assertDictEqual(obj.resumed, {})
+        self.assertFalse(obj.shared_loop)
+        self.assertIsNone(obj.timeout)
+        self.assertIsNone(obj.testcase_timeout)
+        self.assertIsNone(obj.stall)
+        obj = TestCasesGroup((  # init success with settings
+            "Group test", "test", [SubclassTCone], {'timeout': 0.5}))
+        mock_error_one.assert_not_called()
+        mock_error_two.assert_not_called()
+        self.assertEqual(obj.timeout, 0.5)
+        self.assertIsNone(obj.testcase_timeout)
 
     @patch("testcases_executor.tc_groups.TestSuite")
     @patch("testcases_executor.tc_groups.GroupTestLoader")
@@ -261,7 +311,7 @@ class TestGroup(TestCase):
         ----------
         mock_loader : Mock
             Mock of tc_groups.GroupTestLoader .
-        mock_error_two : Mock
+        mock_suite : Mock
             Mock of tc_groups.TestSuite (from unittest).
 
         Assertions:
@@ -292,6 +342,23 @@ class TestGroup(TestCase):
         mock_loader().loadTestsFromTestCase.assert_not_called()
         mock_suite.assert_called_once_with([SubclassTCone('test_foo')])
         self.assertTupleEqual(obj.suites[0], (SubclassTCone, ["test_foo"]))
+        obj.shared_loop = True  # with shared loop, not async testcase
+        mock_suite.reset_mock()
+        obj.update_suites(SubclassTCone, ["test_foo"])
+        mock_suite.assert_called_once_with([SubclassTCone('test_foo')])
+        mock_suite.reset_mock()
+        obj.update_suites(SubclassTCasync)  # async testcase
+        self.assertEqual(mock_loader().suiteClass, SharedLoopSuite)
+        obj.update_suites(SubclassTCasync, ["test_foo"])
+        mock_suite.assert_not_called()
+        self.assertIsInstance(obj.suites[-1][1], SharedLoopSuite)
+        obj.shared_loop = False  # without shared loop, async testcase
+        obj.update_suites(SubclassTCasync)
+        self.assertEqual(mock_loader().suiteClass, mock_suite)
+        SubclassTCasync.concurrent_tests = True  # concurrent async testcase
+        obj.update_suites(SubclassTCasync)
+        del SubclassTCasync.concurrent_tests
+        self.assertEqual(mock_loader().suiteClass, SharedLoopSuite)
 
 
 class TestGroups(TestCase):
@@ -306,6 +373,14 @@ class TestGroups(TestCase):
         Assert if TestCasesGroups's object initialized is the desired list.
     test_construct_suites():
         Assert group.update_suites called with good parameter depending args.
+    test_shard_suites():
+        Assert suites splitted in balanced shards, by durations or tests.
+    test_select_affected():
+        Assert only tests runned by changed files, or not recorded, kept.
+    test_select_failed():
+        Assert only failed tests kept, or runned first with their suites.
+    test_resume_suites():
+        Assert completed tests removed from suites, kept with outcomes.
     """
 
     @patch("testcases_executor.tc_groups.sys")
@@ -347,12 +422,13 @@ class TestGroups(TestCase):
             [2, ], mock_error_one,
             TypeError,
             "Item of groups must be 'tuple', not 'int': 2")
-        item_no_three_items = (  # groups's item not contain 3 items
-            [(1, 2, 3, 4), ], mock_error_two,
+        item_no_three_items = (  # groups's item not contain 3 or 4 items
+            [(1, 2, 3, 4, 5), ], mock_error_two,
             IndexError, "".join([
                 "Group tuple must contain 3 items (group's name, ",
                 "group's argument name to run all of his testcases, ",
-                "testcases list or tuple), not 4"]))
+                "testcases list or tuple) and optional settings dict, ",
+                "not 5"]))
         name_no_used_once = (  # group's name not used once
             (
                 ("group test", "test", [SubclassTCone, ]),
@@ -406,55 +482,48 @@ class TestGroups(TestCase):
 
     @patch("builtins.vars")
     @patch("testcases_executor.tc_groups.TestCasesGroup.update_suites")
-    @patch("testcases_executor.tc_groups.sys")
-    def test_construct_suites(
-            self, mock_sys, mock_update_suites, mock_vars):
+    def test_construct_suites(self, mock_update_suites, mock_vars):
         """
         Assert group.update_suites called with good parameter depending args.
 
         Parameters:
         ----------
-        mock_sys : Mock
-            Mock of sys to set value to sys.argv .
         mock_update_suites : Mock
             Mock of tc_groups.TestCasesGroup.update_suites .
         mock_vars : Mock
             Mock of vars to set return value for vars(args).
 
-        Classes:
-        ----------
-        FakeArgs:
-            A fake agrs with properties open and timestamp.
-
         Assertions:
         ----------
         assertEqual:
-            Assert group.update_suites call count.
+            Assert group.update_suites call count, group's timeouts.
         assert_has_calls:
             Assert group.update_suites calls parameters.
         assert_called_once_with:
-            Assert vars called once with 'args', groups.remove with group.
+            Assert vars called once with 'args', groups.remove with group,
+            shard_suites with shard, resume_suites with journal's outcomes.
+        assert_has_calls:
+            Assert select_failed called with --last-failed, --failed-first,
+            select_affected with files changed and index of files runned.
         """
-        class FakeArgs():
-
-            def __init__(self, a_open):
-                self.open = a_open
-
-        for argv, args in [  # all groups testcases
-                ([1], FakeArgs(False)),
-                ([1, 2], FakeArgs(True))]:
-            mock_sys.argv = argv
-            obj = TestCasesGroups([
-                ("group test", "g_test", [SubclassTCone, ]),
-                ('group test 2', "g_test2", (SubclassTCtwo, ))])
-            group_one, group_two = obj[0], obj[1]
-            obj.construct_suites(args)
-            self.assertEqual(mock_update_suites.call_count, 2)
-            mock_update_suites.assert_has_calls([
-                call(SubclassTCone), call(SubclassTCtwo)])
-            self.assertEqual(obj, [group_one, group_two])
-            mock_update_suites.reset_mock()
-        mock_sys.argv = [1, 2, 3]
+        mock_vars.return_value = {  # all groups testcases, no group arg
+            'g_test': False, 'g_test2': False, 'shared_loop': False,
+            'shard': None, 'timeout': None, 'testcase_timeout': None,
+            'stall': None, 'resume': None, 'failed': None, 'affected_by': None,
+            'SubclassTCone': None, 'SubclassTCtwo': None}
+        obj = TestCasesGroups([
+            ("group test", "g_test", [SubclassTCone, ]),
+            ('group test 2', "g_test2", (SubclassTCtwo, ))])
+        obj[0].suites, obj[1].suites = [1], [1]
+        group_one, group_two = obj[0], obj[1]
+        obj.construct_suites('args')
+        mock_vars.assert_called_once_with('args')
+        self.assertEqual(mock_update_suites.call_count, 2)
+        mock_update_suites.assert_has_calls([
+            call(SubclassTCone), call(SubclassTCtwo)])
+        self.assertEqual(obj, [group_one, group_two])
+        mock_vars.reset_mock()
+        mock_update_suites.reset_mock()
         for vars_val, count_val, call_vals, new_obj in [  # depending args
                 ((True, False, None, None), 1, (SubclassTCone, ), "one"),
                 ((False, False, None, []), 1, (SubclassTCtwo, ), "two"),
@@ -462,7 +531,10 @@ class TestGroups(TestCase):
                     SubclassTCone, (SubclassTCtwo, ['test_foo'])), "all")]:
             mock_vars.return_value = {
                 'g_test': vars_val[0], 'g_test2': vars_val[1],
-                'SubclassTCone': vars_val[2], 'SubclassTCtwo': vars_val[3]}
+                'SubclassTCone': vars_val[2], 'SubclassTCtwo': vars_val[3],
+                'shared_loop': True, 'shard': None, 'timeout': None,
+                'testcase_timeout': None, 'stall': None, 'resume': None,
+                'failed': None, 'affected_by': None}
             obj = TestCasesGroups([
                 ("group test", "g_test", [SubclassTCone, ]),
                 ('group test 2', "g_test2", (SubclassTCtwo, ))])
@@ -490,5 +562,233 @@ class TestGroups(TestCase):
                 self.assertEqual(obj, [group_two])
             else:
                 self.assertEqual(obj, [group_one, group_two])
+            for group in obj:
+                self.assertTrue(group.shared_loop)
             mock_vars.reset_mock()
             mock_update_suites.reset_mock()
+        mock_vars.return_value = {  # only a shard
+            'g_test': False, 'g_test2': False, 'shared_loop': False,
+            'shard': (2, 2), 'shard_durations': None, 'timeout': None,
+            'testcase_timeout': None, 'stall': None, 'resume': None,
+            'failed': None, 'affected_by': None,
+            'SubclassTCone': None, 'SubclassTCtwo': None}
+        obj = TestCasesGroups([
+            ("group test", "g_test", [SubclassTCone, ]),
+            ('group test 2', "g_test2", (SubclassTCtwo, ))])
+        obj.shard_suites = Mock()
+        obj.construct_suites('args')
+        obj.shard_suites.assert_called_once_with((2, 2), None)
+        mock_vars.return_value['shard_durations'] = 'timings.json'
+        with patch(
+                "testcases_executor.tc_groups.load_timings") as mock_timings:
+            obj.construct_suites('args')
+        mock_timings.assert_called_once_with('timings.json')
+        obj.shard_suites.assert_called_with(
+            (2, 2), mock_timings.return_value)
+        mock_vars.return_value['shard_durations'] = None
+        mock_vars.return_value['resume'] = 'journal.jsonl'  # resumed run
+        obj.resume_suites = Mock()
+        with patch("testcases_executor.tc_groups.load_outcomes") as mock_out:
+            obj.construct_suites('args')
+        mock_out.assert_called_once_with('journal.jsonl')
+        obj.resume_suites.assert_called_once_with(mock_out.return_value)
+        mock_vars.return_value['resume'] = None
+        mock_vars.return_value['failed'] = 'last'  # only failed tests
+        obj.select_failed = Mock()
+        with patch(
+                "testcases_executor.tc_groups.load_failed") as mock_failed:
+            obj.construct_suites('args')
+            mock_vars.return_value['failed'] = 'first'  # failed first
+            obj.construct_suites('args')
+        obj.select_failed.assert_has_calls([
+            call(mock_failed.return_value, True),
+            call(mock_failed.return_value, False)])
+        mock_vars.return_value['failed'] = None  # affected by changes
+        mock_vars.return_value['affected_by'] = ['git-diff']
+        obj.select_affected = Mock()
+        with patch(
+                "testcases_executor.tc_groups.changed_files") as mock_changed:
+            with patch(
+                    "testcases_executor.tc_groups.load_impact") as mock_impact:
+                obj.construct_suites('args')
+        mock_changed.assert_called_once_with(['git-diff'])
+        obj.select_affected.assert_called_once_with(
+            mock_changed.return_value, mock_impact.return_value)
+        mock_vars.return_value = {  # timeouts, group's settings first
+            'g_test': False, 'g_test2': False, 'shared_loop': False,
+            'shard': None, 'timeout': 2, 'testcase_timeout': 10, 'stall': 3,
+            'resume': None, 'failed': None, 'affected_by': None,
+            'SubclassTCone': None, 'SubclassTCtwo': None}
+        obj = TestCasesGroups([
+            ("group test", "g_test", [SubclassTCone, ], {'timeout': 1}),
+            ('group test 2', "g_test2", (SubclassTCtwo, ))])
+        obj[0].suites, obj[1].suites = [1], [1]
+        obj.construct_suites('args')
+        self.assertEqual(obj[0].timeout, 1)
+        self.assertEqual(obj[0].testcase_timeout, 10)
+        self.assertEqual(obj[1].timeout, 2)
+        self.assertEqual(obj[1].testcase_timeout, 10)
+        self.assertEqual(obj[1].stall, 3)
+
+    def test_shard_suites(self):
+        """
+        Assert suites splitted in balanced shards, by durations or tests.
+
+        Functions:
+        ----------
+        get_shards(n_shards):
+            Return testcases kept in each shard.
+
+        Assertions:
+        ----------
+        assertListEqual:
+            Assert testcases kept in each shard.
+        """
+        def get_shards(n_shards, t_durations=None):
+            shards = []
+            for k_shard in range(1, n_shards + 1):
+                obj = TestCasesGroups([
+                    ("group test", "g_test", [SubclassTCone, ]),
+                    ('group test 2', "g_test2", (
+                        SubclassTCtwo, SubclassTCasync))])
+                for group in obj:
+                    for testcase in group.testcases:
+                        group.update_suites(testcase)
+                obj.shard_suites((k_shard, n_shards), t_durations)
+                shards.append([
+                    testcase for group in obj
+                    for testcase, suite in group.suites])
+            return shards
+
+        self.assertListEqual(get_shards(1), [
+            [SubclassTCone, SubclassTCtwo, SubclassTCasync]])
+        self.assertListEqual(get_shards(2), [  # by number of tests
+            [SubclassTCone, SubclassTCasync], [SubclassTCtwo]])
+        self.assertListEqual(get_shards(2, {}), [  # empty timing file
+            [SubclassTCone, SubclassTCasync], [SubclassTCtwo]])
+        module = 'testcases_executor.tests.test_tc_groups'
+        t_durations = {
+            f'{module}.SubclassTCone.test_foo': 1,
+            f'{module}.SubclassTCone.test_bar': 1,
+            f'{module}.SubclassTCasync.test_foo': 5}
+        self.assertListEqual(get_shards(2, t_durations), [  # mean for 2
+            [SubclassTCasync], [SubclassTCone, SubclassTCtwo]])
+        self.assertListEqual(get_shards(4, t_durations), [
+            [SubclassTCasync], [SubclassTCtwo], [SubclassTCone], []])
+
+    def test_select_affected(self):
+        """
+        Assert only tests runned by changed files, or not recorded, kept.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests kept, suites without test removed.
+        """
+        module = 'testcases_executor.tests.test_tc_groups'
+        obj = TestCasesGroups([
+            ("group test", "g_test", [SubclassTCone, ]),
+            ('group test 2', "g_test2", (SubclassTCtwo, ))])
+        for group in obj:
+            for testcase in group.testcases:
+                group.update_suites(testcase)
+        obj.select_affected({'app/b.py', 'app/c.py'}, {
+            'app/a.py': [
+                f'{module}.SubclassTCone.test_foo',
+                f'{module}.SubclassTCone.test_bar',
+                f'{module}.SubclassTCtwo.test_bar_foo'],
+            'app/b.py': [f'{module}.SubclassTCtwo.test_bar_foo']})
+        self.assertEqual(obj[0].suites, [])
+        self.assertEqual(
+            [test._testMethodName for test in obj[1].suites[0][1]._tests],
+            ['test_bar_foo', 'test_foo_bar'])  # never recorded
+
+    def test_select_failed(self):
+        """
+        Assert only failed tests kept, or runned first with their suites.
+
+        Functions:
+        ----------
+        make_groups():
+            Return groups with suites of all their testcases.
+        names(groups):
+            Return groups's names and their tests's names, in run order.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests kept and their order, all if none of the selected
+            ones failed, all testcase's ones if its fixture failed.
+        """
+        module = 'testcases_executor.tests.test_tc_groups'
+
+        def make_groups():
+            groups = TestCasesGroups([
+                ("group test", "g_test", [SubclassTCone, ]),
+                ('group test 2', "g_test2", (SubclassTCasync, SubclassTCtwo))])
+            for group in groups:
+                for testcase in group.testcases:
+                    group.update_suites(testcase)
+            return groups
+
+        def names(groups):
+            return [(group.name, [
+                [test._testMethodName for test in suite._tests]
+                for _, suite in group.suites]) for group in groups]
+
+        obj = make_groups()
+        all_tests = names(obj)
+        obj.select_failed(set(), True)  # nothing failed, all tests
+        self.assertEqual(names(obj), all_tests)
+        failed = {
+            f'{module}.SubclassTCtwo.test_foo_bar', f'{module}.removed'}
+        obj.select_failed(failed, True)
+        self.assertEqual(names(obj), [  # removed by construct_suites
+            ('group test 2', [['test_foo_bar']]), ('group test', [])])
+        obj = make_groups()
+        obj.select_failed(failed, False)
+        self.assertEqual(names(obj), [
+            ('group test 2', [
+                ['test_foo_bar', 'test_bar_foo'], all_tests[1][1][0]]),
+            all_tests[0]])
+        obj = make_groups()  # failed only in a group not selected
+        obj.remove(obj[1])
+        obj.select_failed(failed, True)
+        self.assertEqual(names(obj), [all_tests[0]])
+        obj = make_groups()  # fixture of testcase failed, all its tests
+        obj.select_failed({f'{module}.SubclassTCtwo'}, True)
+        self.assertEqual(names(obj), [
+            ('group test 2', [all_tests[1][1][1]]), ('group test', [])])
+
+    def test_resume_suites(self):
+        """
+        Assert completed tests removed from suites, kept with outcomes.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert remaining tests in suites, resumed tests and outcomes.
+        """
+        obj = TestCasesGroups([
+            ("group test", "g_test", [SubclassTCone, ]),
+            ('group test 2', "g_test2", (SubclassTCtwo, ))])
+        for group in obj:
+            for testcase in group.testcases:
+                group.update_suites(testcase)
+        module = 'testcases_executor.tests.test_tc_groups'
+        obj.resume_suites({
+            f'{module}.SubclassTCone.test_foo': ['success', 1, None],
+            f'{module}.SubclassTCtwo.test_bar_foo': ['failed', 2, 'error'],
+            f'{module}.SubclassTCtwo.test_foo_bar': ['success', 3, None]})
+        testcase, suite = obj[0].suites[0]
+        self.assertEqual(
+            [test._testMethodName for test in suite._tests], ['test_bar'])
+        self.assertEqual(
+            [(test._testMethodName, outcome)
+             for test, outcome in obj[0].resumed[testcase]],
+            [('test_foo', ['success', 1, None])])
+        testcase, suite = obj[1].suites[0]  # all completed, suite kept
+        self.assertEqual(suite._tests, [])
+        self.assertEqual(
+            [outcome for test, outcome in obj[1].resumed[testcase]],
+            [['failed', 2, 'error'], ['success', 3, None]])
@@ -0,0 +1,121 @@
+"""
+Module testcases_executor.tests.test_tc_history .
+
+Contain TestCase for testcases_executor.tc_history .
+
+unittest.TestCase sublasses:
+    TestRunHistory
+
+Imports:
+    sqlite3
+    from datetime: datetime
+    from os.path: join
+    from tempfile: TemporaryDirectory
+    from unittest: TestCase
+    from unittest.mock: patch
+    from testcases_executor.tc_history: RunHistory
+"""
+import sqlite3
+from datetime import datetime
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from testcases_executor.tc_history import RunHistory
+
+
+class TestRunHistory(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_history.RunHistory .
+
+    Methods
+    ----------
+    setUp():
+        Make a temporary directory for history.
+    select(query):
+        Return rows selected in history.
+    test_init_history():
+        Assert thread started, run created, closed at exit.
+    test_write_test():
+        Assert tests's rows written by batches with their run.
+    test_two():
+        Recorded in history by other tests.
+    """
+
+    def setUp(self):
+        """
+        Make a temporary directory for history.
+        """
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = join(tmp_dir.name, 'cache', 'history.sqlite')
+
+    def select(self, query):
+        """
+        Return rows selected in history.
+        """
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(query).fetchall()
+        finally:
+            connection.close()
+
+    def test_init_history(self):
+        """
+        Assert thread started, run created, closed at exit.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert attributes and run saved.
+        assert_called_once_with:
+            Assert close registered at exit, unregistered when closed.
+        assertFalse:
+            Assert thread stopped.
+        """
+        with patch("testcases_executor.tc_history.atexit") as mock_atexit:
+            obj = RunHistory(datetime(2020, 3, 30, 12), self.path, 10)
+            mock_atexit.register.assert_called_once_with(obj.close)
+            self.assertEqual(
+                (obj.path, obj.batch_size), (self.path, 10))
+            obj.close()
+            mock_atexit.unregister.assert_called_once_with(obj.close)
+        self.assertFalse(obj.thread.is_alive())
+        self.assertEqual(
+            self.select("SELECT * FROM runs"), [(1, '2020-03-30T12:00:00')])
+
+    def test_write_test(self):
+        """
+        Assert tests's rows written by batches with their run.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert rows written, tests of a second run with its id.
+        """
+        obj = RunHistory(datetime(2020, 3, 30, 12), self.path, 2)
+        group = type('Group', (), {'name': 'group'})
+        with patch(
+                "testcases_executor.tc_history.time.time", return_value=12):
+            for _ in range(3):
+                obj.write_test(self, group, ('success', 0.5, None))
+            obj.write_test(
+                TestRunHistory('test_two'), None, ('failed', 1.5, 'error'))
+        obj.close()
+        tc_name = f"{__name__}.TestRunHistory"
+        self.assertEqual(self.select("SELECT * FROM tests"), [
+            (1, self.id(), 'group', tc_name, 'success', 0.5, 12)] * 3 + [
+            (1, f"{tc_name}.test_two", None, tc_name, 'failed', 1.5, 12)])
+        obj = RunHistory(datetime(2020, 3, 31, 12), self.path)
+        obj.write_test(self, None, ('errors', 0.1, 'error'))
+        obj.close()
+        self.assertEqual(self.select(
+            "SELECT run_id, status FROM tests WHERE run_id = 2"),
+            [(2, 'errors')])
+
+    def test_two(self):
+        """
+        Recorded in history by other tests.
+        """
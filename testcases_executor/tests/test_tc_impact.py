@@ -0,0 +1,222 @@
+"""
+Module testcases_executor.tests.test_tc_impact .
+
+Contain TestCase for testcases_executor.tc_impact .
+
+unittest.TestCase sublasses:
+    TestImpactFunctions
+    TestImpactTracer
+
+Imports:
+    subprocess
+    sys
+    from os import getcwd
+    from os.path: join
+    from tempfile: TemporaryDirectory
+    from unittest: TestCase, skipUnless
+    from unittest.mock: patch, Mock
+    from testcases_executor.tc_impact: (
+        ImpactTracer, project_files, load_impact, save_impact,
+        changed_files, MONITORING, PACKAGE_DIR)
+"""
+import subprocess
+import sys
+from os import getcwd
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+from unittest.mock import patch, Mock
+from testcases_executor.tc_impact import (
+    ImpactTracer, project_files, load_impact, save_impact, changed_files,
+    MONITORING, PACKAGE_DIR)
+
+
+def runned_by_test():
+    """
+    Function called by a recorded test, in this file.
+    """
+    return 'runned'
+
+
+class TestImpactFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_impact functions.
+
+    Methods
+    ----------
+    setUp():
+        Create a temporary dir and use it as cache dir.
+    test_project_files():
+        Assert only project's files kept, relative to current directory.
+    test_save_load_impact():
+        Assert index of tests by file updated with tests recorded.
+    test_changed_files():
+        Assert files given or changed in git, normalized.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary dir and use it as cache dir.
+        """
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patcher = patch(
+            "testcases_executor.tc_cache.CACHE_DIR", join(tmp_dir.name, 'c'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_project_files(self):
+        """
+        Assert only project's files kept, relative to current directory.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert files kept.
+        """
+        root = getcwd()
+        self.assertEqual(project_files({
+            join(root, 'app', 'models.py'), 'tests.py', '<frozen os>',
+            join(PACKAGE_DIR, 'tc_result.py'), subprocess.__file__}), {
+                join('app', 'models.py'), 'tests.py'})
+
+    @patch("testcases_executor.tc_impact.project_files", new=set)
+    def test_save_load_impact(self):
+        """
+        Assert index of tests by file updated with tests recorded.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert index loaded, empty without previous run.
+        """
+        self.assertEqual(load_impact(), {})
+        save_impact({'t1': {'a.py', 'b.py'}, 't2': {'b.py'}})
+        self.assertEqual(
+            load_impact(), {'a.py': ['t1'], 'b.py': ['t1', 't2']})
+        save_impact({'t1': {'c.py'}})  # t1 files replaced, t2 kept
+        self.assertEqual(load_impact(), {'b.py': ['t2'], 'c.py': ['t1']})
+
+    @patch("testcases_executor.tc_impact.subprocess.run")
+    def test_changed_files(self, mock_run):
+        """
+        Assert files given or changed in git, normalized.
+
+        Parameters:
+        ----------
+        mock_run : Mock
+            Mock of subprocess.run .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert changed files.
+        assert_called_once_with:
+            Assert git diff runned.
+        assertRaises:
+            Assert ValueError when git diff failed.
+        """
+        self.assertEqual(
+            changed_files(['./app/models.py', 'app/views.py']),
+            {join('app', 'models.py'), join('app', 'views.py')})
+        mock_run.assert_not_called()
+        mock_run.return_value = Mock(stdout="app/models.py\nREADME.md\n")
+        self.assertEqual(
+            changed_files(['git-diff']),
+            {join('app', 'models.py'), 'README.md'})
+        mock_run.assert_called_once_with(
+            ['git', 'diff', '--name-only', '--relative', 'HEAD'],
+            capture_output=True, text=True, check=True)
+        mock_run.side_effect = subprocess.CalledProcessError(128, 'git')
+        with patch("builtins.print"):
+            with self.assertRaises(ValueError):
+                changed_files(['git-diff'])
+
+
+class TestImpactTracer(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_impact.ImpactTracer .
+
+    Methods
+    ----------
+    record(tracer):
+        Record files runned by this test with tracer.
+    test_init_tracer():
+        Assert tracer initialized without test recorded.
+    test_settrace():
+        Assert files recorded with sys.settrace, previous trace restored.
+    test_monitoring():
+        Assert files recorded with sys.monitoring, tool freed after test.
+    """
+
+    def record(self, tracer):
+        """
+        Record files runned by this test with tracer.
+        """
+        tracer.start_test()
+        runned_by_test()
+        tracer.stop_test(self)
+
+    def test_init_tracer(self):
+        """
+        Assert tracer initialized without test recorded.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert attributes.
+        """
+        obj = ImpactTracer()
+        self.assertEqual(
+            (obj.files, obj.tests, obj.monitored, obj.previous),
+            (None, {}, False, None))
+        obj.stop_test(self)  # not started
+        self.assertEqual(obj.tests, {})
+
+    @patch("testcases_executor.tc_impact.MONITORING", new=None)
+    def test_settrace(self):
+        """
+        Assert files recorded with sys.settrace, previous trace restored.
+
+        Assertions:
+        ----------
+        assertIn:
+            Assert this file recorded for test.
+        assertIs:
+            Assert previous trace function restored.
+        assertIsNone:
+            Assert no current test.
+        """
+        previous = sys.gettrace()
+        obj = ImpactTracer()
+        self.record(obj)
+        self.assertIn(__file__, obj.tests[self.id()])
+        self.assertIs(sys.gettrace(), previous)
+        self.assertIsNone(obj.files)
+
+    @skipUnless(MONITORING is not None, "sys.monitoring needs python 3.12")
+    def test_monitoring(self):
+        """
+        Assert files recorded with sys.monitoring, tool freed after test.
+
+        Assertions:
+        ----------
+        assertTrue:
+            Assert test recorded with sys.monitoring .
+        assertIn:
+            Assert this file recorded for each test, even if code runned.
+        assertIsNone:
+            Assert coverage tool freed.
+        """
+        obj = ImpactTracer()
+        self.record(obj)
+        self.assertTrue(obj.monitored)
+        self.assertIn(__file__, obj.tests[self.id()])
+        del obj.tests[self.id()]
+        self.record(obj)  # events restarted for next test
+        self.assertIn(__file__, obj.tests[self.id()])
+        self.assertIsNone(MONITORING.get_tool(MONITORING.COVERAGE_ID))
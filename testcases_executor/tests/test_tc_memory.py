@@ -0,0 +1,141 @@
+"""
+Module testcases_executor.tests.test_tc_memory .
+
+Contain TestCase for testcases_executor.tc_memory .
+
+unittest.TestCase sublasses:
+    TestMemoryFunctions
+    TestMemoryTracer
+
+Imports:
+    tracemalloc
+    from unittest: TestCase
+    from unittest.mock: patch, mock_open
+    from testcases_executor.tc_memory: current_rss, MemoryTracer
+"""
+import tracemalloc
+from unittest import TestCase
+from unittest.mock import patch, mock_open
+from testcases_executor.tc_memory import current_rss, MemoryTracer
+
+
+class TestMemoryFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_memory functions.
+
+    Methods
+    ----------
+    test_current_rss():
+        Assert RSS read in /proc in bytes, None if not readable.
+    """
+
+    @patch("testcases_executor.tc_memory.PAGESIZE", 4096)
+    def test_current_rss(self):
+        """
+        Assert RSS read in /proc in bytes, None if not readable.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert RSS with pages size.
+        assertIsNone:
+            Assert None without /proc (not Linux).
+        """
+        with patch("builtins.open", mock_open(read_data="300 20 10 1 0 5 0")):
+            self.assertEqual(current_rss(), 20 * 4096)
+        with patch("builtins.open", side_effect=FileNotFoundError):
+            self.assertIsNone(current_rss())
+
+
+class TestMemoryTracer(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_memory.MemoryTracer .
+
+    Methods
+    ----------
+    test_init_tracer():
+        Assert tracer attributes.
+    test_enter_exit():
+        Assert tracemalloc started and stopped only by an active tracer.
+    test_measure():
+        Assert peak allocated and RSS growth since test started.
+    """
+
+    def test_init_tracer(self):
+        """
+        Assert tracer attributes.
+
+        Assertions:
+        ----------
+        assertFalse:
+            Assert not active by default, not started.
+        assertTrue:
+            Assert active.
+        assertEqual, assertIsNone:
+            Assert start values.
+        """
+        obj = MemoryTracer()
+        self.assertFalse(obj.active)
+        self.assertFalse(obj.started)
+        self.assertEqual(obj.t_traced, 0)
+        self.assertIsNone(obj.t_rss)
+        self.assertTrue(MemoryTracer(True).active)
+
+    def test_enter_exit(self):
+        """
+        Assert tracemalloc started and stopped only by an active tracer.
+
+        Assertions:
+        ----------
+        assertTrue, assertFalse:
+            Assert tracemalloc tracing or not.
+        """
+        with MemoryTracer():
+            self.assertFalse(tracemalloc.is_tracing())
+        with MemoryTracer(True) as obj:
+            self.assertTrue(obj.started)
+            self.assertTrue(tracemalloc.is_tracing())
+        self.assertFalse(obj.started)
+        self.assertFalse(tracemalloc.is_tracing())
+        tracemalloc.start()  # already tracing, not stopped by tracer
+        self.addCleanup(tracemalloc.stop)
+        with MemoryTracer(True) as obj:
+            self.assertFalse(obj.started)
+        self.assertTrue(tracemalloc.is_tracing())
+
+    @patch("testcases_executor.tc_memory.current_rss")
+    def test_measure(self, mock_rss):
+        """
+        Assert peak allocated and RSS growth since test started.
+
+        Parameters:
+        ----------
+        mock_rss : Mock
+            Mock of tc_memory.current_rss .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert RSS growth and values without active tracer.
+        assertGreaterEqual, assertLess:
+            Assert peak of memory allocated.
+        assertIsNone:
+            Assert RSS growth unknown.
+        """
+        obj = MemoryTracer()
+        obj.start_test()
+        self.assertEqual(obj.measure(), (None, None))
+        mock_rss.side_effect = [1000, 5000, None]
+        with MemoryTracer(True) as obj:
+            obj.start_test()
+            datas = bytearray(2 ** 20)
+            del datas  # peak kept
+            peak, rss = obj.measure()
+            self.assertGreaterEqual(peak, 2 ** 20)
+            self.assertLess(peak, 2 ** 21)
+            self.assertEqual(rss, 4000)
+            self.assertIsNone(obj.measure()[1])
@@ -0,0 +1,522 @@
+"""
+Module testcases_executor.tests.test_tc_merge .
+
+Contain TestCase for testcases_executor.tc_merge .
+
+unittest.TestCase sublasses:
+    TestMergeFunctions
+    TestJournal
+    TestRecordedTestCase
+    TestRecordedSuite
+    TestRecordedGroups
+
+Imports:
+    json
+    time
+    from datetime: datetime
+    from os.path: join
+    from tempfile: TemporaryDirectory
+    from unittest: TestCase
+    from unittest.mock: Mock, call, patch
+    from testcases_executor.tc_merge: (
+        save_result, load_journal, load_outcomes, Journal, RecordedTestCase,
+        RecordedSuite, RecordedGroups)
+"""
+import json
+import time
+from datetime import datetime
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+from testcases_executor.tc_merge import (
+    save_result, load_journal, load_outcomes, Journal, RecordedTestCase,
+    RecordedSuite, RecordedGroups)
+
+
+class SubclassTCsaved(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Used to be saved in json file.
+    """
+
+    def test_one(self):
+        """Doc one."""
+        pass
+
+    def test_two(self):
+        pass
+
+
+class TestMergeFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_merge functions.
+
+    Methods
+    ----------
+    test_save_result():
+        Assert runned tests saved with their outcomes in json file.
+    test_load_journal():
+        Assert journal's lines loaded like a saved result, truncated ignored.
+    test_load_outcomes():
+        Assert outcomes of completed tests loaded by test id.
+    """
+
+    def test_save_result(self):
+        """
+        Assert runned tests saved with their outcomes in json file.
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert get_outcomes called once with all tests.
+        assertDictEqual:
+            Assert json file content, errors without record with testcase.
+        """
+        test_one = SubclassTCsaved('test_one')
+        test_two = SubclassTCsaved('test_two')
+        group = Mock()
+        group.name = 'group one'
+        result = Mock(
+            start_time=datetime(2020, 3, 30, 12),
+            test_methods=[(group, [(SubclassTCsaved, [test_one, test_two])])],
+            unrecorded={SubclassTCsaved: [
+                ('errors', 'tearDownClass (mod.TC)', 'class error', None),
+                ('failed', 'test_one (i=1)', 'error', 0)]})
+        result.get_outcomes.return_value = [('failed', 0.5, 'error'), None]
+        with TemporaryDirectory() as tmp_dir:
+            path = join(tmp_dir, 'result.json')
+            save_result(result, path)
+            with open(path, 'r') as json_file:
+                datas = json.load(json_file)
+        result.get_outcomes.assert_called_once_with([test_one, test_two])
+        self.assertDictEqual(datas, {
+            'start_time': '2020-03-30T12:00:00', 'groups': [['group one', [[
+                'SubclassTCsaved', 'testcases_executor.tests.test_tc_merge',
+                [['test_one', 'Doc one.', 'failed', 0.5, 'error']], [
+                    ['errors', 'tearDownClass (mod.TC)', 'class error', None],
+                    ['failed', 'test_one (i=1)', 'error', 'test_one']]]]]]})
+
+    def test_load_journal(self):
+        """
+        Assert journal's lines loaded like a saved result, truncated ignored.
+
+        Assertions:
+        ----------
+        assertDictEqual:
+            Assert datas grouped by group and testcase, errors without
+            record too.
+        assertIsNone:
+            Assert no start time if its line lost.
+        """
+        def line(group, testcase, name, status):
+            return json.dumps({
+                'id': f'mod.{testcase}.{name}', 'group': group,
+                'module': 'mod', 'testcase': testcase, 'name': name,
+                'doc': None, 'status': status, 'duration': 1.0, 'err': None,
+                'cpu': 0.5}) + '\n'
+
+        with TemporaryDirectory() as tmp_dir:
+            path = join(tmp_dir, 'journal.jsonl')
+            with open(path, 'w') as journal_file:
+                journal_file.write(''.join([
+                    '{"start_time":"2020-03-30T12:00:00"}\n',
+                    line('group one', 'TC1', 'test_a', 'success'),
+                    line('group two', 'TC2', 'test_b', 'failed'),
+                    line('group one', 'TC1', 'test_c', 'success'),
+                    json.dumps({
+                        'group': 'group one', 'module': 'mod',
+                        'testcase': 'TC3', 'description': 'setUpClass',
+                        'status': 'errors', 'err': 'error', 'parent': None}),
+                    '\n{"id":"mod.TC2.te']))  # killed while writing
+            datas = load_journal(path)
+            with open(path, 'w') as journal_file:  # start time lost
+                journal_file.write(line('group one', 'TC1', 'test_a', 'ok'))
+            self.assertIsNone(load_journal(path)['start_time'])
+        self.assertDictEqual(datas, {
+            'start_time': '2020-03-30T12:00:00', 'groups': [
+                ['group one', [['TC1', 'mod', [
+                    ['test_a', None, 'success', 1.0, None, 0.5, None, None,
+                     None],
+                    ['test_c', None, 'success', 1.0, None, 0.5, None, None,
+                     None]], []], ['TC3', 'mod', [], [
+                        ['errors', 'setUpClass', 'error', None]]]]],
+                ['group two', [['TC2', 'mod', [
+                    ['test_b', None, 'failed', 1.0, None, 0.5, None, None,
+                     None]], []]]]]})
+
+    def test_load_outcomes(self):
+        """
+        Assert outcomes of completed tests loaded by test id.
+
+        Assertions:
+        ----------
+        assertDictEqual:
+            Assert outcomes by test id, truncated line ignored.
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = join(tmp_dir, 'journal.jsonl')
+            with open(path, 'w') as journal_file:
+                journal_file.write(''.join([
+                    '{"start_time":"2020-03-30T12:00:00"}\n',
+                    '{"id":"mod.TC1.test_a","status":"failed",',
+                    '"duration":1.0,"err":"error","mem_peak":8}\n',
+                    '{"id":"mod.TC1.test_b","sta']))  # killed while writing
+            outcomes = load_outcomes(path)
+        self.assertDictEqual(outcomes, {'mod.TC1.test_a': [
+            'failed', 1.0, 'error', None, None, 8, None]})
+
+
+class TestJournal(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_merge.Journal .
+
+    Methods
+    ----------
+    setUp():
+        Make a temporary directory for journal.
+    read():
+        Return lines written in journal.
+    test_init_journal():
+        Assert start time written at once, closed at exit.
+    test_write():
+        Assert lines kept in buffer, written when big enough.
+    test_write_interval():
+        Assert lines written by timer after flush interval.
+    test_write_test():
+        Assert test's line with id, group, testcase and outcome.
+    test_write_error():
+        Assert error's line with group, testcase, description and error.
+    test_close():
+        Assert buffer written, file closed and no more closed at exit.
+    """
+
+    def setUp(self):
+        """
+        Make a temporary directory for journal.
+        """
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = join(tmp_dir.name, 'journal.jsonl')
+
+    def read(self):
+        """
+        Return lines written in journal.
+        """
+        with open(self.path, 'r') as journal_file:
+            return [json.loads(line) for line in journal_file]
+
+    def test_init_journal(self):
+        """
+        Assert start time written at once, closed at exit.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert attributes and first line.
+        assert_called_once_with:
+            Assert close registered at exit.
+        """
+        with patch("testcases_executor.tc_merge.atexit") as mock_atexit:
+            obj = Journal(self.path, datetime(2020, 3, 30, 12), 100, 5)
+        self.addCleanup(obj.close)
+        mock_atexit.register.assert_called_once_with(obj.close)
+        self.assertEqual(obj.flush_size, 100)
+        self.assertEqual(obj.flush_interval, 5)
+        self.assertEqual((obj.buffer, obj.size, obj.timer), ([], 0, None))
+        self.assertEqual(self.read(), [{'start_time': '2020-03-30T12:00:00'}])
+
+    def test_write(self):
+        """
+        Assert lines kept in buffer, written when big enough.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert buffer, size and lines written.
+        assertIsNotNone:
+            Assert timer started with first line kept.
+        """
+        obj = Journal(self.path, datetime(2020, 3, 30, 12), 20, 60)
+        self.addCleanup(obj.close)
+        obj.write({'a': 1})
+        self.assertEqual((obj.buffer, obj.size), (['{"a":1}\n'], 8))
+        self.assertIsNotNone(obj.timer)
+        self.assertEqual(len(self.read()), 1)
+        obj.write({'b': 22})  # 17 characters
+        self.assertEqual(len(self.read()), 1)
+        obj.write({'c': 3})  # bigger than flush size
+        self.assertEqual((obj.buffer, obj.size, obj.timer), ([], 0, None))
+        self.assertEqual(self.read()[1:], [{'a': 1}, {'b': 22}, {'c': 3}])
+
+    def test_write_interval(self):
+        """
+        Assert lines written by timer after flush interval.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert line written.
+        """
+        obj = Journal(self.path, datetime(2020, 3, 30, 12), 65536, 0.05)
+        self.addCleanup(obj.close)
+        obj.write({'a': 1})
+        time.sleep(0.5)
+        self.assertEqual(self.read()[1:], [{'a': 1}])
+        self.assertIsNone(obj.timer)
+
+    def test_write_test(self):
+        """
+        Assert test's line with id, group, testcase and outcome.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert test's line.
+        """
+        obj = Journal(self.path, datetime(2020, 3, 30, 12))
+        group = Mock()
+        group.name = 'group one'
+        test = SubclassTCsaved('test_one')
+        obj.write_test(test, group, ('failed', 0.5, 'error', 0.25, {
+            'test': 0.5}, 1024, None))
+        obj.write_test(SubclassTCsaved('test_two'), None, (
+            'success', 1.0, None))  # merged without group, old outcome
+        obj.close()
+        self.assertEqual(self.read()[1:], [{
+            'id': test.id(), 'group': 'group one',
+            'module': 'testcases_executor.tests.test_tc_merge',
+            'testcase': 'SubclassTCsaved', 'name': 'test_one',
+            'doc': 'Doc one.', 'status': 'failed', 'duration': 0.5,
+            'err': 'error', 'cpu': 0.25, 'parts': {'test': 0.5},
+            'mem_peak': 1024, 'mem_rss': None}, {
+            'id': SubclassTCsaved('test_two').id(), 'group': None,
+            'module': 'testcases_executor.tests.test_tc_merge',
+            'testcase': 'SubclassTCsaved', 'name': 'test_two', 'doc': None,
+            'status': 'success', 'duration': 1.0, 'err': None}])
+
+    def test_write_error(self):
+        """
+        Assert error's line with group, testcase, description and error.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert error's line.
+        """
+        obj = Journal(self.path, datetime(2020, 3, 30, 12))
+        group = Mock()
+        group.name = 'group one'
+        obj.write_error(SubclassTCsaved, group, (
+            'failed', 'test_one (i=1)', 'error'), 'test_one')
+        obj.close()
+        self.assertEqual(self.read()[1:], [{
+            'group': 'group one',
+            'module': 'testcases_executor.tests.test_tc_merge',
+            'testcase': 'SubclassTCsaved', 'description': 'test_one (i=1)',
+            'status': 'failed', 'err': 'error', 'parent': 'test_one'}])
+
+    def test_close(self):
+        """
+        Assert buffer written, file closed and no more closed at exit.
+
+        Assertions:
+        ----------
+        assertTrue:
+            Assert file closed.
+        assertEqual:
+            Assert line in buffer written.
+        assert_called_once_with:
+            Assert close unregistered at exit.
+        """
+        obj = Journal(self.path, datetime(2020, 3, 30, 12))
+        obj.write({'a': 1})
+        with patch("testcases_executor.tc_merge.atexit") as mock_atexit:
+            obj.close()
+        mock_atexit.unregister.assert_called_once_with(obj.close)
+        self.assertTrue(obj.file.closed)
+        self.assertIsNone(obj.timer)
+        self.assertEqual(self.read()[1:], [{'a': 1}])
+
+
+class TestRecordedTestCase(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_merge.RecordedTestCase .
+
+    Methods
+    ----------
+    test_recorded_testcase():
+        Assert test's attributes and id.
+    """
+
+    def test_recorded_testcase(self):
+        """
+        Assert test's attributes and id.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert attributes and returned id.
+        assertIsNone:
+            Assert doc.
+        """
+        testcase = type('TC', (RecordedTestCase, ), {
+            '__module__': 'module', '__qualname__': 'Parent.TC',
+            '__slots__': ()})
+        test = testcase('test_one', None)
+        self.assertEqual(test._testMethodName, 'test_one')
+        self.assertIsNone(test._testMethodDoc)
+        self.assertEqual(test.__class__.__name__, 'TC')
+        self.assertEqual(test.id(), 'module.Parent.TC.test_one')
+
+
+class TestRecordedSuite(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_merge.RecordedSuite .
+
+    Methods
+    ----------
+    test_call_suite():
+        Assert outcomes and errors without record added to result.
+    """
+
+    def test_call_suite(self):
+        """
+        Assert outcomes and errors without record added to result.
+
+        Assertions:
+        ----------
+        assert_has_calls:
+            Assert result.add_outcome calls parameters, test failed by its
+            subtests counted with them, add_unrecorded_error with parent.
+        """
+        suite, result = RecordedSuite(), Mock()
+        self.assertEqual(suite.errors, [])
+        suite._tests = ['test1', 'test2']
+        suite.outcomes = [['success', 1, None], ['failed', 0, 'sub fail']]
+        suite.errors = [
+            ('errors', 'tearDownClass (mod.TC)', 'error', None),
+            ('failed', 'test2 (i=1)', 'sub fail', 1)]
+        suite(result)
+        self.assertEqual(result.add_outcome.call_count, 2)
+        result.add_outcome.assert_has_calls([
+            call('test1', 'success', 1, None, subtests=False),
+            call('test2', 'failed', 0, 'sub fail', subtests=True)])
+        result.add_unrecorded_error.assert_has_calls([
+            call('errors', 'tearDownClass (mod.TC)', 'error', None),
+            call('failed', 'test2 (i=1)', 'sub fail', 'test2')])
+
+
+class TestRecordedGroups(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_merge.RecordedGroups .
+
+    Methods
+    ----------
+    test_init_groups():
+        Assert groups, testcases and tests merged by names in order.
+    test_init_groups_journal():
+        Assert journal merged with a saved result.
+    """
+
+    def test_init_groups(self):
+        """
+        Assert groups, testcases and tests merged by names in order.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert start time, groups, testcases, tests, outcomes and
+            errors without record.
+        """
+        datas_a = {'start_time': '2020-03-30T12:00:00', 'groups': [
+            ['group one', [['TC1', 'mod', [
+                ['test_a', 'doc a', 'success', 1, None],
+                ['test_b', None, 'failed', 2, 'sub']], [
+                    ['failed', 'test_b (i=1)', 'sub', 'test_b']]]]]]}
+        datas_b = {'start_time': '2020-03-30T11:00:00', 'groups': [
+            ['group two', [['TC2', 'mod', [
+                ['test_c', None, 'errors', 3, 'error']]]]],
+            ['group one', [
+                ['TC1', 'mod', [['test_b', None, 'success', 4, None]]],
+                ['TC3', 'mod', [['test_d', None, 'skipped', 0, 'r']]]]]]}
+        with TemporaryDirectory() as tmp_dir:
+            paths = [join(tmp_dir, 'a.json'), join(tmp_dir, 'b.json')]
+            for path, datas in zip(paths, [datas_a, datas_b]):
+                with open(path, 'w') as json_file:
+                    json.dump(datas, json_file)
+            obj = RecordedGroups(paths)
+        self.assertEqual(obj.start_time, datetime(2020, 3, 30, 11))
+        self.assertEqual([g.name for g in obj], ['group one', 'group two'])
+        self.assertEqual(
+            [tc.__name__ for tc, suite in obj[0].suites], ['TC1', 'TC3'])
+        testcase, suite = obj[0].suites[0]
+        self.assertEqual(testcase.__module__, 'mod')
+        self.assertEqual(
+            [(t.__class__, t._testMethodName, t._testMethodDoc)
+             for t in suite._tests],
+            [(testcase, 'test_a', 'doc a'), (testcase, 'test_b', None)])
+        self.assertEqual(  # last saved outcome kept
+            suite.outcomes, [['success', 1, None], ['success', 4, None]])
+        self.assertEqual(
+            obj[1].suites[0][1].outcomes, [['errors', 3, 'error']])
+        self.assertEqual(suite.errors, [  # of file a
+            ('failed', 'test_b (i=1)', 'sub', 1)])
+        self.assertEqual(obj[1].suites[0][1].errors, [])  # old version
+
+    def test_init_groups_journal(self):
+        """
+        Assert journal merged with a saved result.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert start time, groups, tests and outcomes, start time of
+            a journal without it, errors without record.
+        """
+        datas = {'start_time': '2020-03-30T12:00:00', 'groups': [
+            ['group one', [['TC1', 'mod', [
+                ['test_a', 'doc a', 'failed', 1, 'error']]]]]]}
+        with TemporaryDirectory() as tmp_dir:
+            paths = [join(tmp_dir, 'a.json'), join(tmp_dir, 'b.jsonl')]
+            with open(paths[0], 'w') as json_file:
+                json.dump(datas, json_file)
+            with open(paths[1], 'w') as journal_file:
+                journal_file.write(''.join([
+                    '{"start_time":"2020-03-30T11:00:00"}\n', json.dumps({
+                        'id': 'mod.TC1.test_a', 'group': 'group two',
+                        'module': 'mod', 'testcase': 'TC1', 'name': 'test_a',
+                        'doc': 'doc a', 'status': 'success', 'duration': 2,
+                        'err': None}), '\n']))
+            obj = RecordedGroups(paths)
+        self.assertEqual(obj.start_time, datetime(2020, 3, 30, 11))
+        self.assertEqual(len(obj), 2)
+        self.assertEqual(obj[0].suites[0][1].outcomes, [
+            ['failed', 1, 'error']])
+        self.assertEqual(obj[1].suites[0][1].outcomes, [
+            ['success', 2, None, None, None, None, None]])
+        with TemporaryDirectory() as tmp_dir:  # start time line lost
+            path = join(tmp_dir, 'c.jsonl')
+            with open(path, 'w') as journal_file:
+                journal_file.write(json.dumps({
+                    'group': 'group one', 'module': 'mod', 'testcase': 'TC1',
+                    'description': 'setUpClass (mod.TC1)', 'status': 'errors',
+                    'err': 'error', 'parent': None}) + '\n')
+            with patch(
+                    "testcases_executor.tc_merge.getmtime",
+                    return_value=datetime(2020, 3, 30, 10).timestamp()):
+                obj = RecordedGroups([path])
+        self.assertEqual(obj.start_time, datetime(2020, 3, 30, 10))
+        self.assertEqual(obj[0].suites[0][1].errors, [
+            ('errors', 'setUpClass (mod.TC1)', 'error', None)])
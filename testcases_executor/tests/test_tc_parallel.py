@@ -0,0 +1,601 @@
+"""
+Module testcases_executor.tests.test_tc_parallel .
+
+Contain TestCase for testcases_executor.tc_parallel .
+
+unittest.TestCase sublasses:
+    TestParallelFunctions
+    TestSharedStopResult
+    TestTestCasesOutcomes
+
+Variables:
+    NO_SETTINGS: tuple
+        group's settings of a task, without timeouts and stall.
+
+Imports:
+    time
+    from io: StringIO
+    from threading: Event
+    from unittest: TestCase, TestSuite, expectedFailure
+    from unittest.mock: patch, Mock
+    from unittest.runner: _WritelnDecorator
+    from testcases_executor.tc_parallel: (
+        make_tasks, schedule_tasks, init_worker, run_task,
+        run_indexed_task, warm_context, SharedStopResult, TestCasesOutcomes)
+    from testcases_executor.tc_async: SharedLoopSuite
+    from testcases_executor.tc_cache: tc_id
+    from testcases_executor.tc_result: TestCasesResult
+    from testcases_executor.tc_runner: TestCasesRunner
+"""
+import time
+from io import StringIO
+from threading import Event
+from unittest import TestCase, TestSuite, expectedFailure
+from unittest.mock import patch, Mock
+from unittest.runner import _WritelnDecorator
+from testcases_executor.tc_parallel import (
+    make_tasks, schedule_tasks, init_worker, run_task, run_indexed_task,
+    warm_context, SharedStopResult, TestCasesOutcomes)
+from testcases_executor.tc_async import SharedLoopSuite
+from testcases_executor.tc_cache import tc_id
+from testcases_executor.tc_result import TestCasesResult
+from testcases_executor.tc_runner import TestCasesRunner
+
+NO_SETTINGS = (None, None, None)
+
+
+class SubclassTCworker(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Used to be runned in worker.
+    """
+
+    def test_ok(self):
+        pass
+
+    def test_skip(self):
+        self.skipTest('reason')
+
+    @expectedFailure
+    def test_exp_fail(self):
+        self.assertTrue(False)
+
+
+class TestParallelFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_parallel functions.
+
+    Methods
+    ----------
+    test_make_tasks():
+        Assert a task is maked for each suite or group, ordered by declaration.
+    test_schedule_tasks():
+        Assert tasks indexed and sorted longest first.
+    test_run_task():
+        Assert suite runned with output written in buffer and outcomes.
+    test_run_task_failfast():
+        Assert testcases interrupted and cancelled after a failure.
+    test_run_task_timeout():
+        Assert a test running longer than task's timeout is an error.
+    test_run_task_mem():
+        Assert memory used by each test measured with --mem.
+    test_run_task_display():
+        Assert tests displayed in output with worker's display.
+    test_run_task_unrecorded():
+        Assert setUpClass errors and failed subtests sent, added as serial.
+    test_run_indexed_task():
+        Assert run_task called with task and returned with index.
+    test_warm_context():
+        Assert forkserver preloading testcases's modules, or default context.
+    """
+
+    def test_make_tasks(self):
+        """
+        Assert a task is maked for each suite or group, ordered by declaration.
+
+        Assertions:
+        ----------
+        assertListEqual:
+            Assert returned tasks.
+        """
+        group_one, group_two = Mock(), Mock()
+        group_one.suites = [
+            ('tc1', TestSuite([SubclassTCworker('test_ok')])),
+            ('tc2', TestSuite([
+                SubclassTCworker('test_skip'), SubclassTCworker('test_ok')]))]
+        group_one.timeout, group_one.testcase_timeout = None, None
+        group_one.stall = None
+        group_two.suites = [('tc3', SharedLoopSuite([]))]
+        group_two.timeout, group_two.testcase_timeout = 1, 5
+        group_two.stall = 2
+        self.assertListEqual(make_tasks([group_one, group_two]), [
+            [('tc1', ['test_ok'], TestSuite, NO_SETTINGS)],
+            [('tc2', ['test_skip', 'test_ok'], TestSuite, NO_SETTINGS)],
+            [('tc3', [], SharedLoopSuite, (1, 5, 2))]])
+        self.assertListEqual(make_tasks([group_one, group_two], True), [
+            [('tc1', ['test_ok'], TestSuite, NO_SETTINGS),
+             ('tc2', ['test_skip', 'test_ok'], TestSuite, NO_SETTINGS)],
+            [('tc3', [], SharedLoopSuite, (1, 5, 2))]])
+
+    def test_schedule_tasks(self):
+        """
+        Assert tasks indexed and sorted longest first.
+
+        Assertions:
+        ----------
+        assertListEqual:
+            Assert returned indexed tasks.
+        """
+        tc_prefix = f"{SubclassTCworker.__module__}.SubclassTCworker"
+        task_one = [(SubclassTCworker, ['test_ok'], TestSuite, NO_SETTINGS)]
+        task_two = [(
+            SubclassTCworker, ['test_skip', 'test_ok'], TestSuite,
+            NO_SETTINGS)]
+        task_three = [(
+            SubclassTCworker, ['test_exp_fail'], TestSuite, NO_SETTINGS)]
+        tasks = [task_one, task_two, task_three]
+        self.assertListEqual(  # no previous durations, declaration order
+            schedule_tasks(tasks, {'tests': {}, 'testcases': {}}),
+            [(0, task_one), (1, task_two), (2, task_three)])
+        durations = {'tests': {
+            f"{tc_prefix}.test_ok": 1, f"{tc_prefix}.test_skip": 0.5}}
+        self.assertListEqual(  # test_exp_fail -> mean 0.75
+            schedule_tasks(tasks, durations),
+            [(1, task_two), (0, task_one), (2, task_three)])
+        durations['tests'][f"{tc_prefix}.test_exp_fail"] = 3
+        self.assertListEqual(
+            schedule_tasks(tasks, durations),
+            [(2, task_three), (1, task_two), (0, task_one)])
+
+    def test_run_task(self):
+        """
+        Assert suite runned with output written in buffer and outcomes.
+
+        Assertions:
+        ----------
+        assertIn:
+            Assert tests names in output.
+        assertEqual:
+            Assert outcomes status and error.
+        assertIsNone:
+            Assert memory not measured without --mem.
+        """
+        t_outcomes = run_task([
+            (SubclassTCworker, [
+                'test_ok', 'test_skip', 'test_exp_fail'], TestSuite,
+             NO_SETTINGS),
+            (SubclassTCworker, ['test_ok'], TestSuite, NO_SETTINGS)])
+        self.assertEqual(len(t_outcomes), 2)
+        self.assertEqual(t_outcomes[1][1][0][0], 'success')
+        output, outcomes, errors = t_outcomes[0]
+        self.assertEqual(errors, [])
+        for t_name in ['test_ok', 'test_skip', 'test_exp_fail']:
+            self.assertIn(f"{t_name} ... ", output)
+        self.assertEqual(len(outcomes), 3)
+        self.assertEqual(outcomes[0][0], 'success')
+        self.assertEqual(outcomes[1][0], 'skipped')
+        self.assertEqual(outcomes[1][2], 'reason')
+        self.assertEqual(outcomes[2][0], 'expectedFails')
+        self.assertIn('AssertionError', outcomes[2][2])
+        self.assertIsNone(outcomes[0][5])  # memory not measured
+
+    def test_run_task_failfast(self):
+        """
+        Assert testcases interrupted and cancelled after a failure.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with a failed test.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert outcomes status, None for not runned tests.
+        assertTrue:
+            Assert stop event set.
+        """
+        class FakeTestCase(TestCase):
+
+            def test_fail(self):
+                self.assertTrue(False)
+
+            def test_ok(self):
+                pass
+
+        event = Event()
+        init_worker(event, False)
+        self.addCleanup(init_worker, None, False)
+        t_outcomes = run_task([
+            (FakeTestCase, ['test_fail', 'test_ok'], TestSuite, NO_SETTINGS),
+            (FakeTestCase, ['test_ok'], TestSuite, NO_SETTINGS)])
+        self.assertTrue(event.is_set())
+        self.assertEqual(t_outcomes[0][1][0][0], 'failed')
+        self.assertEqual(t_outcomes[0][1][1], None)
+        self.assertEqual(t_outcomes[1], ('', [None], []))
+
+    def test_run_task_timeout(self):
+        """
+        Assert a test running longer than task's timeout is an error.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with a too long test.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert outcomes status.
+        assertIn:
+            Assert timeout in error.
+        """
+        class FakeTestCase(TestCase):
+
+            def test_long(self):
+                time.sleep(5)
+
+            def test_ok(self):
+                pass
+
+        t_outcomes = run_task([(
+            FakeTestCase, ['test_long', 'test_ok'], TestSuite,
+            (0.1, None, None))])
+        outcomes = t_outcomes[0][1]
+        self.assertEqual(outcomes[0][0], 'errors')
+        self.assertIn("TestTimeout: Test timeout of", outcomes[0][2])
+        self.assertEqual(outcomes[1][0], 'success')
+
+    def test_run_task_mem(self):
+        """
+        Assert memory used by each test measured with --mem.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with a test allocating 1 MiB.
+
+        Assertions:
+        ----------
+        assertGreaterEqual:
+            Assert peak of test allocating.
+        assertLess:
+            Assert peak of test not allocating.
+        """
+        class FakeTestCase(TestCase):
+
+            def test_alloc(self):
+                self.datas = bytearray(2 ** 20)
+
+            def test_ok(self):
+                pass
+
+        init_worker(None, True)
+        self.addCleanup(init_worker, None, False)
+        outcomes = run_task([(
+            FakeTestCase, ['test_alloc', 'test_ok'], TestSuite,
+            NO_SETTINGS)])[0][1]
+        self.assertGreaterEqual(outcomes[0][5], 2 ** 20)
+        self.assertLess(outcomes[1][5], 2 ** 20)
+
+    def test_run_task_display(self):
+        """
+        Assert tests displayed in output with worker's display.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with a failed test.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert a character by test with -q, nothing with --progress.
+        """
+        class FakeTestCase(TestCase):
+
+            def test_fail(self):
+                self.fail()
+
+            def test_ok(self):
+                pass
+
+        task = [(FakeTestCase, ['test_fail', 'test_ok'], TestSuite,
+                 NO_SETTINGS)]
+        self.addCleanup(init_worker, None, False)
+        init_worker(None, False, 'dots')
+        self.assertEqual(run_task(task)[0][0], 'F.')
+        init_worker(None, False, 'progress')  # updated by main process
+        output, outcomes, _ = run_task(task)[0]
+        self.assertEqual(output, '')
+        self.assertEqual(outcomes[0][0], 'failed')
+
+    def test_run_task_unrecorded(self):
+        """
+        Assert setUpClass errors and failed subtests sent, added as serial.
+
+        Classes:
+        ----------
+        FailingClass:
+            Testcase with a failing setUpClass.
+        FailingSubtests:
+            Testcase with failed subtests and a test succeeding.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert errors sent without record, index of test failed by
+            subtests, result in main process same as serial one.
+        """
+        class FailingClass(TestCase):
+            @classmethod
+            def setUpClass(cls):
+                raise RuntimeError('class setup')
+
+            def test_one(self):
+                pass
+
+        class FailingSubtests(TestCase):
+            def test_ok(self):
+                pass
+
+            def test_sub(self):
+                for i in range(3):
+                    with self.subTest(i=i):
+                        self.assertLess(i, 1)
+
+        tasks = [
+            (FailingClass, ['test_one'], TestSuite, NO_SETTINGS),
+            (FailingSubtests, ['test_ok', 'test_sub'], TestSuite,
+             NO_SETTINGS)]
+        t_outcomes = run_task(tasks)
+        self.assertEqual(t_outcomes[0][1], [None])  # class not set up
+        self.assertEqual(
+            [error[:2] for error in t_outcomes[0][2]],
+            [('errors', f"setUpClass ({tc_id(FailingClass)})")])
+        self.assertEqual(t_outcomes[1][1][1][0], 'failed')
+        self.assertEqual(
+            [(error[0], error[3]) for error in t_outcomes[1][2]],
+            [('failed', 1), ('failed', None)])  # i=1 in test's record
+        results = []
+        for outcomes in [None, iter(t_outcomes)]:  # serial, then workers
+            runner = TestCasesRunner()
+            runner.stream, runner.outcomes = Mock(), outcomes
+            result = TestCasesResult(_WritelnDecorator(StringIO()))
+            for testcase, t_names, suite_class, _ in tasks:
+                runner.run_suite(result, suite_class(
+                    [testcase(t_name) for t_name in t_names]))
+            results.append(result)
+        for result in results:
+            self.assertEqual(
+                [(str(test), err.splitlines()[-1])
+                 for test, err in result.errors + result.failures], [
+                    (f"setUpClass ({tc_id(FailingClass)})",
+                     'RuntimeError: class setup'),
+                    (f"{FailingSubtests('test_sub')} (i=1)",
+                     'AssertionError: 1 not less than 1'),
+                    (f"{FailingSubtests('test_sub')} (i=2)",
+                     'AssertionError: 2 not less than 1')])
+            self.assertEqual(result.get_n_tests(None), {
+                'failed': 2, 'errors': 1, 'skipped': 0, 'expectedFails': 0,
+                'unexpectedSuccesses': 0})
+            self.assertEqual(
+                [record.status for record in result.records.values()],
+                ['success', 'failed'])
+
+    @patch("testcases_executor.tc_parallel.run_task")
+    def test_run_indexed_task(self, mock_run_task):
+        """
+        Assert run_task called with task and returned with index.
+
+        Parameters:
+        ----------
+        mock_run_task : Mock
+            Mock of tc_parallel.run_task .
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert run_task called with task.
+        assertTupleEqual:
+            Assert returned tuple.
+        """
+        mock_run_task.return_value = 'outcomes'
+        self.assertTupleEqual(
+            run_indexed_task((3, 'task')), (3, 'outcomes'))
+        mock_run_task.assert_called_once_with('task')
+
+    @patch("testcases_executor.tc_parallel.get_context")
+    @patch("testcases_executor.tc_parallel.get_all_start_methods")
+    def test_warm_context(self, mock_methods, mock_get_context):
+        """
+        Assert forkserver preloading testcases's modules, or default context.
+
+        Parameters:
+        ----------
+        mock_methods : Mock
+            Mock of multiprocessing.get_all_start_methods .
+        mock_get_context : Mock
+            Mock of multiprocessing.get_context .
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert get_context called with method, preload with modules.
+        assertEqual:
+            Assert returned context.
+        """
+        class FakeTestCase():
+            pass
+
+        FakeTestCase.__module__ = 'app.tests'
+        tasks = [
+            [(SubclassTCworker, ['test_ok'], TestSuite, NO_SETTINGS)],
+            [(FakeTestCase, [], TestSuite, NO_SETTINGS),
+             (SubclassTCworker, ['test_skip'], TestSuite, NO_SETTINGS)]]
+        mock_methods.return_value = ['fork', 'spawn', 'forkserver']
+        context = warm_context(tasks)
+        mock_get_context.assert_called_once_with('forkserver')
+        self.assertEqual(context, mock_get_context())
+        context.set_forkserver_preload.assert_called_once_with([
+            'testcases', 'testcases_executor.tc_parallel',
+            'testcases_executor.tests.test_tc_parallel', 'app.tests'])
+        mock_get_context.reset_mock()
+        mock_methods.return_value = ['spawn']  # windows
+        context = warm_context(tasks)
+        mock_get_context.assert_called_once_with()
+        self.assertEqual(context, mock_get_context())
+
+
+class TestSharedStopResult(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_parallel.SharedStopResult .
+
+    Methods
+    ----------
+    test_should_stop():
+        Assert stopped by itself or by stop event, and set it.
+    """
+
+    def test_should_stop(self):
+        """
+        Assert stopped by itself or by stop event, and set it.
+
+        Assertions:
+        ----------
+        assertFalse, assertTrue:
+            Assert shouldStop and event values.
+        """
+        obj = SharedStopResult(Mock())  # without failfast
+        self.assertFalse(obj.shouldStop)
+        obj.stop()
+        self.assertTrue(obj.shouldStop)
+        event = Event()
+        init_worker(event, False)
+        self.addCleanup(init_worker, None, False)
+        obj = SharedStopResult(Mock())  # stopped by another worker
+        self.assertFalse(obj.shouldStop)
+        event.set()
+        self.assertTrue(obj.shouldStop)
+        event.clear()
+        obj = SharedStopResult(Mock())  # stop others
+        obj.stop()
+        self.assertTrue(event.is_set())
+
+
+class TestTestCasesOutcomes(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_parallel.TestCasesOutcomes .
+
+    Methods
+    ----------
+    test_init_outcomes():
+        Assert pool created and tasks submitted scheduled with their index.
+    test_next():
+        Assert outcomes returned in declaration order, whatever completion.
+    test_run_in_pool():
+        Assert tasks runned in a real pool and outcomes ordered.
+    """
+
+    @patch("testcases_executor.tc_parallel.schedule_tasks")
+    @patch("testcases_executor.tc_parallel.warm_context")
+    def test_init_outcomes(self, mock_context, mock_schedule):
+        """
+        Assert pool created and tasks submitted scheduled with their index.
+
+        Parameters:
+        ----------
+        mock_context : Mock
+            Mock of tc_parallel.warm_context .
+        mock_schedule : Mock
+            Mock of tc_parallel.schedule_tasks .
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert context maked with tasks, Pool called with jobs and
+            stop event, imap_unordered with indexed tasks.
+        assertEqual:
+            Assert attributes values.
+        """
+        mock_schedule.return_value = [(1, 'task 2'), (0, 'task 1')]
+        obj = TestCasesOutcomes(['task 1', 'task 2'], 3, 'durations')
+        mock_context.assert_called_once_with(['task 1', 'task 2'])
+        mock_pool = mock_context().Pool
+        mock_pool.assert_called_once_with(
+            3, initializer=init_worker, initargs=(None, False, 'tests'))
+        self.assertIsNone(obj.stop_event)
+        mock_schedule.assert_called_once_with(
+            ['task 1', 'task 2'], 'durations')
+        mock_pool().imap_unordered.assert_called_once_with(
+            run_indexed_task, [(1, 'task 2'), (0, 'task 1')])
+        self.assertEqual(obj.unordered, mock_pool().imap_unordered())
+        self.assertEqual(obj.completed, {})
+        self.assertEqual(obj.index, 0)
+        self.assertEqual(obj.current, [])
+        obj.close()
+        mock_pool().close.assert_called_once_with()
+        mock_pool().join.assert_called_once_with()
+        mock_pool.reset_mock()
+        obj = TestCasesOutcomes(
+            ['task 1', 'task 2'], 3, 'durations', True, True, 'dots')
+        self.assertEqual(obj.stop_event, mock_context().Event())
+        mock_pool.assert_called_once_with(
+            3, initializer=init_worker,
+            initargs=(obj.stop_event, True, 'dots'))
+
+    @patch("testcases_executor.tc_parallel.warm_context")
+    def test_next(self, mock_context):
+        """
+        Assert outcomes returned in declaration order, whatever completion.
+
+        Parameters:
+        ----------
+        mock_context : Mock
+            Mock of tc_parallel.warm_context .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert returned outcomes and completed kept.
+        assertRaises:
+            Assert StopIteration when all outcomes returned.
+        """
+        obj = TestCasesOutcomes([], 2, {'tests': {}})
+        obj.unordered = iter([
+            (2, ['out 3']), (0, ['out 0']), (1, ['out 1', 'out 2'])])
+        self.assertEqual(next(obj), 'out 0')
+        self.assertEqual(obj.completed, {2: ['out 3']})
+        self.assertEqual(next(obj), 'out 1')
+        self.assertEqual(next(obj), 'out 2')
+        self.assertEqual(next(obj), 'out 3')
+        self.assertEqual(obj.completed, {})
+        self.assertRaises(StopIteration, next, obj)
+
+    def test_run_in_pool(self):
+        """
+        Assert tasks runned in a real pool and outcomes ordered.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert status of outcomes.
+        """
+        obj = TestCasesOutcomes([
+            [(SubclassTCworker, ['test_skip'], TestSuite, NO_SETTINGS)],
+            [(SubclassTCworker, ['test_ok'], TestSuite, NO_SETTINGS),
+             (SubclassTCworker, ['test_skip'], TestSuite, NO_SETTINGS)]],
+            2, {'tests': {}})
+        outcomes = list(obj)
+        obj.close()
+        self.assertEqual(len(outcomes), 3)
+        self.assertEqual(outcomes[0][1][0][0], 'skipped')
+        self.assertEqual(outcomes[1][1][0][0], 'success')
+        self.assertEqual(outcomes[2][1][0][0], 'skipped')
@@ -4,20 +4,112 @@ Module testcases_executor.tests.test_tc_parser .
 Contain TestCase for testcases_executor.tc_parser .
 
 Classes:
+    TestParserFunctions(TestCase)
     TestHelpFormatter(TestCase)
     TestParser(TestCase)
+    TestMergeParser(TestCase)
 
 Imports:
     from unittest: TestCase
     from unittest.mock: patch
-    from argparse: HelpFormatter
-    from testcases_executor.tc_parser: TestCasesHelpFormatter, TestCasesParser
+    from argparse: HelpFormatter, ArgumentTypeError
+    from testcases_executor.tc_parser: (
+        shard_type, positive_float, positive_int, non_negative_int,
+        TestCasesHelpFormatter, TestCasesParser, TestCasesMergeParser)
 """
 from unittest import TestCase
 from unittest.mock import patch, call
-from argparse import HelpFormatter, ArgumentParser
+from argparse import HelpFormatter, ArgumentParser, ArgumentTypeError
 from testcases_executor.tc_parser import (
-    TestCasesHelpFormatter, TestCasesParser)
+    shard_type, positive_float, positive_int, non_negative_int,
+    TestCasesHelpFormatter, TestCasesParser, TestCasesMergeParser)
+
+
+class TestParserFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_parser functions.
+
+    Methods
+    ----------
+    test_shard_type():
+        Assert K/N converted to tuple, error raised if not valid.
+    test_positive_float():
+        Assert number converted to float, error raised if not positive.
+    test_positive_int():
+        Assert number converted to int, error raised if not positive.
+    test_non_negative_int():
+        Assert number converted to int, error raised if negative.
+    """
+
+    def test_shard_type(self):
+        """
+        Assert K/N converted to tuple, error raised if not valid.
+
+        Assertions:
+        ----------
+        assertTupleEqual:
+            Assert returned tuple.
+        assertRaises:
+            Assert ArgumentTypeError raised.
+        """
+        self.assertTupleEqual(shard_type('2/8'), (2, 8))
+        self.assertTupleEqual(shard_type('1/1'), (1, 1))
+        for value in ['2', '2/a', '1/2/3', '0/2', '3/2']:
+            with self.assertRaises(ArgumentTypeError):
+                shard_type(value)
+
+    def test_positive_float(self):
+        """
+        Assert number converted to float, error raised if not positive.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert returned float.
+        assertRaises:
+            Assert ArgumentTypeError raised.
+        """
+        self.assertEqual(positive_float('2.5'), 2.5)
+        self.assertEqual(positive_float('3'), 3.0)
+        for value in ['a', '0', '-1', 'nan']:
+            with self.assertRaises(ArgumentTypeError):
+                positive_float(value)
+
+    def test_positive_int(self):
+        """
+        Assert number converted to int, error raised if not positive.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert returned int.
+        assertRaises:
+            Assert ArgumentTypeError raised.
+        """
+        self.assertEqual(positive_int('1'), 1)
+        self.assertEqual(positive_int('8'), 8)
+        for value in ['a', '1.5', '0', '-3']:
+            with self.assertRaises(ArgumentTypeError):
+                positive_int(value)
+
+    def test_non_negative_int(self):
+        """
+        Assert number converted to int, error raised if negative.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert returned int.
+        assertRaises:
+            Assert ArgumentTypeError raised.
+        """
+        self.assertEqual(non_negative_int('0'), 0)
+        self.assertEqual(non_negative_int('10'), 10)
+        for value in ['a', '1.5', '-1']:
+            with self.assertRaises(ArgumentTypeError):
+                non_negative_int(value)
 
 
 class TestHelpFormatter(TestCase):
@@ -127,6 +219,8 @@ class TestParser(TestCase):
         Assert if options arguments are added to parser.
     test_add_args_groups():
         Assert groups and testcases arguments are added to parser.
+    test_parse_args():
+        Assert incompatible options refused, others parsed.
     """
 
     @patch("testcases_executor.tc_parser.TestCasesParser.add_args_groups")
@@ -180,21 +274,99 @@ class TestParser(TestCase):
         Assertions:
         ----------
         assertEqual:
-            Assert add_argument called 2 times, optionnals title > Options
+            Assert add_argument called 11 times, optionnals title > Options
         assert_has_calls:
             Assert if add_argument called with good kwargs.
         assertIsInstance:
             Assert if obj is instance ArgumentParser.
         """
         obj = TestCasesParser('tc_groups')
-        self.assertEqual(mock_add_argument.call_count, 2)
+        self.assertEqual(mock_add_argument.call_count, 23)
         mock_add_argument.assert_has_calls([
             call(
                 '-h', '--help', action='help', default='==SUPPRESS==',
                 help='show this help message and exit'),
             call(
                 "-o", "--open", action='store_true',
-                help="Open html report in browser after tests.")])
+                help="Open html report in browser after tests."),
+            call(
+                "-j", "--jobs", type=positive_int, default=1,
+                help="Run testcases in N worker processes."),
+            call(
+                "--by-group", action='store_true',
+                help=(
+                    "Run each group's testcases serially in the same "
+                    "worker.")),
+            call(
+                "--shared-loop", action='store_true',
+                help=(
+                    "Run IsolatedAsyncioTestCase's tests on one event "
+                    "loop.")),
+            call(
+                "--shard", type=shard_type, default=None,
+                help="Run only testcases of shard K/N (e.g. 2/8)."),
+            call(
+                "--shard-durations", metavar="PATH", default=None,
+                help="Balance shards with tests's durations of a json file."),
+            call(
+                "--json", metavar="PATH", default=None,
+                help="Save result in a json file, to merge it later."),
+            call(
+                "--failfast", action='store_true',
+                help="Stop on first failure or error."),
+            call(
+                "--timeout", metavar="SECONDS", type=positive_float,
+                default=None,
+                help="Interrupt a test running longer, recorded as error."),
+            call(
+                "--testcase-timeout", metavar="SECONDS", type=positive_float,
+                default=None,
+                help="Interrupt testcase's tests running longer, as errors."),
+            call(
+                "--stall", metavar="SECONDS", type=positive_float,
+                default=None,
+                help="Dump stacks of a test running longer, every SECONDS."),
+            call(
+                "--mem", action='store_true',
+                help="Measure memory peak and RSS growth of each test."),
+            call(
+                "--journal", metavar="PATH", default=None,
+                help="Write a json line by test completed, during the run."),
+            call(
+                "--resume", metavar="PATH", default=None,
+                help="Run only tests not completed in a run's journal."),
+            call(
+                "--history", action='store_true',
+                help="Record run and its tests in a sqlite history of runs."),
+            call(
+                "--durations", metavar="N", type=non_negative_int, default=0,
+                help="Display the N slowest tests and testcases."),
+            call(
+                "--last-failed", action='store_const', dest='failed',
+                const='last', default=None,
+                help="Run only tests failed in previous runs, all if none."),
+            call(
+                "--failed-first", action='store_const', dest='failed',
+                const='first',
+                help="Run tests failed in previous runs first, then others."),
+            call(
+                "--record-impact", action='store_true',
+                help=(
+                    "Record source files runned by each test, in main "
+                    "process (not gathered async tests).")),
+            call(
+                "--affected-by", metavar="FILE", nargs='+', default=None,
+                help=(
+                    "Run only tests runned files changed, "
+                    "git-diff for git's.")),
+            call(
+                "-q", "--quiet", action='store_const', dest='display',
+                const='dots', default='tests',
+                help="Display a character by test, not its line."),
+            call(
+                "--progress", action='store_const', dest='display',
+                const='progress',
+                help="Display a progress line updated, not tests's lines.")])
         self.assertEqual(obj._optionals.title, 'Options')
 
     @patch("testcases_executor.tc_parser.TestCasesParser.add_args_options")
@@ -271,3 +443,62 @@ class TestParser(TestCase):
             call(
                 '-FakeTest3', choices=['test_1', 'test_2', 'test_a'],
                 help='test_1 test_2 test_a', nargs='*')])
+
+    def test_parse_args(self):
+        """
+        Assert incompatible options refused, others parsed.
+
+        Assertions:
+        ----------
+        assertRaises:
+            Assert exit for --by-group without jobs, --record-impact with.
+        assert_called_once_with:
+            Assert error's message.
+        assertTrue:
+            Assert options parsed.
+        """
+        obj = TestCasesParser([])
+        for args, message in [
+                (['--by-group'], "argument --by-group: needs -j N with N > 1"),
+                (['--by-group', '-j', '1'],
+                 "argument --by-group: needs -j N with N > 1"),
+                (['--record-impact', '-j', '2'], "".join([
+                    "argument --record-impact: not allowed with -j N, tests ",
+                    "are runned in main process"]))]:
+            with patch.object(obj, 'error', side_effect=SystemExit(2)) as err:
+                self.assertRaises(SystemExit, obj.parse_args, args)
+            err.assert_called_once_with(message)
+        self.assertTrue(obj.parse_args(['--by-group', '-j', '2']).by_group)
+        self.assertTrue(obj.parse_args(['--record-impact']).record_impact)
+
+
+class TestMergeParser(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_parser.TestCasesMergeParser .
+
+    Methods
+    ----------
+    test_parse_args():
+        Assert files and open arguments parsed.
+    """
+
+    def test_parse_args(self):
+        """
+        Assert files and open arguments parsed.
+
+        Assertions:
+        ----------
+        assertIsInstance:
+            Assert if obj is instance ArgumentParser.
+        assertListEqual:
+            Assert files parsed.
+        assertTrue:
+            Assert open parsed.
+        """
+        obj = TestCasesMergeParser()
+        self.assertIsInstance(obj, ArgumentParser)
+        args = obj.parse_args(['a.json', 'b.jsonl', '-o'])
+        self.assertListEqual(args.files, ['a.json', 'b.jsonl'])
+        self.assertTrue(args.open)
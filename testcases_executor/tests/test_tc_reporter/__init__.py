@@ -2,9 +2,9 @@ from testcases_executor.tests.test_tc_reporter.test_html_report import (
     TestTestCasesHtmlReport)
 from testcases_executor.tests.test_tc_reporter.test_contexts import (
     TestContextInfos, TestContextHeader, TestContextGroup, TestContextTestCase,
-    TestContextMethod, TestContextsFunctions, TestContextReport)
+    TestContextMethod, TestContextError, TestContextReport)
 
 __all__ = [
     'TestTestCasesHtmlReport', 'TestContextInfos', 'TestContextHeader',
     'TestContextGroup', 'TestContextTestCase', 'TestContextMethod',
-    'TestContextsFunctions', 'TestContextReport']
+    'TestContextError', 'TestContextReport']
@@ -9,21 +9,23 @@ unittest.TestCase sublasses:
     TestContextGroup
     TestContextTestCase
     TestContextMethod
-    TestContextsFunctions
+    TestContextError
     TestContextReport
 
 Imports:
     from unittest: TestCase
     from unittest.mock: patch, Mock, call
+    from testcases_executor.tc_result: TestRecord
     from testcases_executor.tc_reporter.contexts: (
         ContextInfos, ContextHeader, ContextGroup, ContextTestCase,
-        ContextMethod, make_errors_dict, ContextReport)
+        ContextMethod, ContextError, ContextReport)
 """
 from unittest import TestCase
 from unittest.mock import patch, Mock, call
+from testcases_executor.tc_result import TestRecord
 from testcases_executor.tc_reporter.contexts import (
     ContextInfos, ContextHeader, ContextGroup, ContextTestCase, ContextMethod,
-    make_errors_dict, ContextReport)
+    ContextError, ContextReport)
 
 
 class TestContextInfos(TestCase):
@@ -141,8 +143,12 @@ class TestContextGroup(TestCase):
             'group name', 'status', 'n_tests', 'duration', 'TestCases')
         mock_context_infos.assert_called_once_with(
             'status', 'n_tests', 'duration')
-        self.assertDictEqual(
-            obj, {'name': 'group name', 'testcases': 'TestCases'})
+        self.assertDictEqual(obj, {
+            'name': 'group name', 'testcases': 'TestCases', 'stats': {}})
+        obj = ContextGroup(  # with percentiles of durations
+            'group name', 'status', 'n_tests', 'duration', 'TestCases',
+            {'p50': 0.002, 'max': 1.5})
+        self.assertDictEqual(obj['stats'], {'p50': '2.0 ms', 'max': '1.5 s'})
 
 
 class TestContextTestCase(TestCase):
@@ -172,14 +178,18 @@ class TestContextTestCase(TestCase):
         assert_called_once_with:
             Assert format_duration called once with 'duration'.
         assertDictEqual:
-            Assert if obj is the desired dict.
+            Assert if obj is the desired dict, with errors without record.
         """
         mock_format_duration.return_value = 'duration formated'
         obj = ContextTestCase('TestCase name', 'module', 'duration', 'methods')
         mock_format_duration.assert_called_once_with('duration')
         self.assertDictEqual(obj, {
             'name': 'TestCase name', 'module': 'module',
-            't_methods': 'methods', 'duration': 'duration formated'})
+            't_methods': 'methods', 'duration': 'duration formated',
+            'errors': []})
+        obj = ContextTestCase(
+            'TestCase name', 'module', 'duration', 'methods', ['error'])
+        self.assertListEqual(obj['errors'], ['error'])
 
 
 class TestContextMethod(TestCase):
@@ -215,6 +225,8 @@ class TestContextMethod(TestCase):
             Assert format_duration called once with 'duration'.
         assertDictEqual:
             Assert if obj is the desired dict depending of test.
+        assertEqual:
+            Assert stall, timing and memory values.
         """
         class FakeTestMethod():
 
@@ -225,77 +237,105 @@ class TestContextMethod(TestCase):
         t1, t2 = FakeTestMethod('t1'), FakeTestMethod('t2'),
         t3, t4 = FakeTestMethod('t3'), FakeTestMethod('t4')
         t5, t6 = FakeTestMethod('t5'), FakeTestMethod('t6')
-        t_errors = {
-            'failures': [t2], 'errors': [t4],
-            'skipped': [t1], 'exp_fails': [t6], 'unex_suc': [t3],
-            t1: 'error t1', t2: 'error t2', t6: 'error t6', t4: 'error t4'}
         mock_format_duration.return_value = 'duration formated'
-        obj = ContextMethod(t2, 'duration', t_errors)  # failures
+        obj = ContextMethod(  # failures
+            t2, TestRecord('duration', 'failed', 'error t2'))
         mock_format_duration.assert_called_once_with('duration')
         self.assertDictEqual(obj, {
             'status_name': "FAIL", 'status_icon': "thumbs-o-down",
             'status_color': "warning", 'error': 'error t2',
-            'name': 't2', 'doc': 't2 doc', 'duration': 'duration formated'})
-        obj = ContextMethod(t4, 'duration', t_errors)  # error
+            'name': 't2', 'doc': 't2 doc', 'duration': 'duration formated',
+            'timing': '', 'memory': '', 'mem_peak': None, 'stall': None,
+            'same_error': None})
+        obj = ContextMethod(  # error
+            t4, TestRecord('duration', 'errors', 'error t4'))
         self.assertDictEqual(obj, {
             'status_name': "ERROR", 'status_icon': "times-circle",
             'status_color': "danger", 'error': 'error t4',
-            'name': 't4', 'doc': 't4 doc', 'duration': 'duration formated'})
-        obj = ContextMethod(t1, 'duration', t_errors)  # skip
+            'name': 't4', 'doc': 't4 doc', 'duration': 'duration formated',
+            'timing': '', 'memory': '', 'mem_peak': None, 'stall': None,
+            'same_error': None})
+        obj = ContextMethod(  # skip
+            t1, TestRecord('duration', 'skipped', 'error t1'))
         self.assertDictEqual(obj, {
             'status_name': "SKIP", 'status_icon': "cut",
             'status_color': "info", 'error': 'error t1',
-            'name': 't1', 'doc': 't1 doc', 'duration': 'duration formated'})
-        obj = ContextMethod(t6, 'duration', t_errors)  # Expected Fail
+            'name': 't1', 'doc': 't1 doc', 'duration': 'duration formated',
+            'timing': '', 'memory': '', 'mem_peak': None, 'stall': None,
+            'same_error': None})
+        obj = ContextMethod(  # Expected Fail
+            t6, TestRecord('duration', 'expectedFails', 'error t6'))
         self.assertDictEqual(obj, {
             'status_name': "Expected Fail", 'status_icon': "stop-circle-o",
             'status_color': "danger", 'error': 'error t6',
-            'name': 't6', 'doc': 't6 doc', 'duration': 'duration formated'})
-        obj = ContextMethod(t3, 'duration', t_errors)  # Unexpected Success"
+            'name': 't6', 'doc': 't6 doc', 'duration': 'duration formated',
+            'timing': '', 'memory': '', 'mem_peak': None, 'stall': None,
+            'same_error': None})
+        obj = ContextMethod(  # Unexpected Success
+            t3, TestRecord('duration', 'unexpectedSuccesses'))
         self.assertDictEqual(obj, {
             'status_name': "Unexpected Success", 'status_color': 'success',
             'status_icon': 'hand-stop-o', 'error': None,
-            'name': 't3', 'doc': 't3 doc', 'duration': 'duration formated'})
-        obj = ContextMethod(t5, 'duration', t_errors)  # Success
+            'name': 't3', 'doc': 't3 doc', 'duration': 'duration formated',
+            'timing': '', 'memory': '', 'mem_peak': None, 'stall': None,
+            'same_error': None})
+        obj = ContextMethod(t5, TestRecord('duration'))  # Success
         self.assertDictEqual(obj, {
             'status_name': "SUCCESS", 'status_color': 'success',
             'status_icon': 'thumbs-o-up', 'error': None,
-            'name': 't5', 'doc': 't5 doc', 'duration': 'duration formated'})
-
-
-class TestContextsFunctions(TestCase):
+            'name': 't5', 'doc': 't5 doc', 'duration': 'duration formated',
+            'timing': '', 'memory': '', 'mem_peak': None, 'stall': None,
+            'same_error': None})
+        obj = ContextMethod(t5, TestRecord('duration'), 'stacks')  # stalled
+        self.assertEqual(obj['stall'], 'stacks')
+        obj = ContextMethod(t5, TestRecord(  # with timing
+            'duration', cpu=0.002, parts={'test': 0.003, 'setUp': 0.001}))
+        self.assertEqual(
+            obj['timing'], "setUp 1.0 ms, test 3.0 ms, CPU 2.0 ms")
+        obj = ContextMethod(t5, TestRecord(  # with --mem
+            'duration', mem_peak=2048, mem_rss=-1024))
+        self.assertEqual(obj['memory'], "peak 2.0 KiB, RSS -1.0 KiB")
+        self.assertEqual(obj['mem_peak'], 2048)
+        obj = ContextMethod(  # same traceback as a test displayed before
+            t4, TestRecord('duration', 'errors', 'error t2'), None,
+            'FakeTestCase.t2')
+        self.assertEqual(obj['same_error'], 'FakeTestCase.t2')
+
+
+class TestContextError(TestCase):
     """
     A subclass of unittest.TestCase .
 
-    Tests for tc_reporter.contexts function make_errors_dict.
+    Tests for tc_reporter.contexts.ContextError .
 
     Methods
     ----------
-    test_make_errors_dict():
-        Assert if make_errors_dict return desired dict.
+    test_init_context_error():
+        Assert ContextError (dict) is initialized with good keys / values.
     """
 
-    def test_make_errors_dict(self):
+    def test_init_context_error(self):
         """
-        Assert if make_errors_dict return desired dict.
+        Assert ContextError (dict) is initialized with good keys / values.
 
         Assertions:
         ----------
         assertDictEqual:
-            Assert if t_errors is the desired dict.
+            Assert if obj is the desired dict depending of status.
         """
-        failures = [('t1', 'fail t1')]
-        errors = [('t3', 'error t3')]
-        skipped = [('t2', 'skip t2')]
-        expFails = [('t6', 'fail t6')]
-        unexpSucc = [('t7', 'fail t7')]
-        t_errors = make_errors_dict(
-            failures, errors, skipped, expFails, unexpSucc)
-        self.assertDictEqual(t_errors, {  # make_errors_dict
-            't1': 'fail t1', 'failures': ['t1'], 't3': 'error t3',
-            'errors': ['t3'], 't2': 'skip t2', 'skipped': ['t2'],
-            't6': 'fail t6', 'exp_fails': ['t6'],
-            'unex_suc': [('t7', 'fail t7')]})
+        obj = ContextError(
+            'setUpClass (module.TC)', 'errors', 'class error', 'error0')
+        self.assertDictEqual(obj, {
+            'status_name': "ERROR", 'status_icon': "times-circle",
+            'status_color': "danger", 'name': 'setUpClass (module.TC)',
+            'anchor': 'error0', 'error': 'class error', 'same_error': None})
+        obj = ContextError(
+            'test_one (i=1)', 'failed', 'sub fail', 'error1', 'TC.test_two')
+        self.assertDictEqual(obj, {
+            'status_name': "FAIL", 'status_icon': "thumbs-o-down",
+            'status_color': "warning", 'name': 'test_one (i=1)',
+            'anchor': 'error1', 'error': 'sub fail',
+            'same_error': 'TC.test_two'})
 
 
 class TestContextReport(TestCase):
@@ -310,14 +350,14 @@ class TestContextReport(TestCase):
         Assert ContextReport object is initialized with good attributes.
     """
 
+    @patch("testcases_executor.tc_reporter.contexts.load_stalls")
     @patch("testcases_executor.tc_reporter.contexts.ContextHeader")
-    @patch("testcases_executor.tc_reporter.contexts.make_errors_dict")
     @patch("testcases_executor.tc_reporter.contexts.ContextMethod")
     @patch("testcases_executor.tc_reporter.contexts.ContextTestCase")
     @patch("testcases_executor.tc_reporter.contexts.ContextGroup")
     def test_init_context_report(
-            self, mock_group, mock_tc, mock_method, mock_errors_dict,
-            mock_header):
+            self, mock_group, mock_tc, mock_method, mock_header,
+            mock_stalls):
         """
         Assert ContextReport object is initialized with good attributes.
 
@@ -329,10 +369,10 @@ class TestContextReport(TestCase):
             Mock of ContextTestCase .
         mock_method : Mock
             Mock of ContextMethod .
-        mock_errors_dict : Mock
-            Mock of make_errors_dict .
         mock_header : Mock
             Mock of ContextHeader .
+        mock_stalls : Mock
+            Mock of tc_cache.load_stalls .
 
         Classes:
         ----------
@@ -348,11 +388,15 @@ class TestContextReport(TestCase):
         assertEqual:
             Assert title header content, mocks group tc method call count.
         assert_called_once_with:
-            Assert ContextHeader make_errors_dict called once with parameter.
+            Assert ContextHeader called once with parameter.
         assert_has_calls:
             Assert mocks group tc method calls parameters.
         assertListEqual:
-            Assert groups attribute value ( obj.groups).
+            Assert groups attribute value ( obj.groups), same traceback
+            displayed once, not for a skip reason, testcase's errors without
+            record, not the ones displayed with their test.
+        assert_not_called:
+            Assert stacks dumped not loaded for merged results.
         """
         class FakeGroup():
 
@@ -385,9 +429,6 @@ class TestContextReport(TestCase):
                     'testcases': {
                         FakeTestCase1: 3, FakeTestCase2: 2,
                         FakeTestCase3: 2, FakeTestCase4: 8},
-                    'tests': {
-                        't1': 5, 't2': 12, 't3': 1, 't4': 3, 't5': 2,
-                        't6': 0, 't7': 4},
                     'groups': {
                         group_one: 'duration group 1',
                         group_two: 'duration group 2'},
@@ -401,56 +442,95 @@ class TestContextReport(TestCase):
                 self.n_tests = {'groups': {
                     group_one: 'n_tests group 1',
                     group_two: 'n_tests group 2'}, 'total': 'n_tests total'}
-                self.failures = 'failures'
-                self.errors = 'errors'
-                self.skipped = 'skipped'
-                self.expectedFailures = 'expFails'
-                self.unexpectedSuccesses = 'unexpSucc'
+                self.stats = {'groups': {group_one: 'stats group 1'}}
+                self.records = {
+                    t_name: TestRecord(1) for t_name in [
+                        't1', 't2', 't3', 't4', 't5', 't6', 't7']}
+                self.unrecorded = {}
 
         result = FakeResult()
+        mock_stalls.return_value = {}  # no stalled test
         mock_header.return_value = 'Context Header'
-        mock_errors_dict.return_value = 'Errors dict'
         mock_method.return_value = 'Context Method'
         mock_tc.return_value = 'Context TestCase'
         mock_group.return_value = 'Context Group'
         obj = ContextReport('project name', result)
         self.assertEqual(obj.title, 'project name Tests Results')
-        mock_errors_dict.assert_called_once_with(
-            'failures', 'errors', 'skipped', 'expFails', 'unexpSucc')
         mock_header.assert_called_once_with(
             'status total', 'start time', 'n_tests total', 'duration total')
         self.assertEqual(obj.header, 'Context Header')
         self.assertEqual(mock_method.call_count, 7)
         mock_method.assert_has_calls([
-            call('t1', 5, 'Errors dict'), call('t4', 3, 'Errors dict'),
-            call('t3', 1, 'Errors dict'), call('t7', 4, 'Errors dict'),
-            call('t5', 2, 'Errors dict'), call('t6', 0, 'Errors dict'),
-            call('t2', 12, 'Errors dict')])
+            call(t_name, result.records[t_name], None, None)
+            for t_name in ['t1', 't4', 't3', 't7', 't5', 't6', 't2']])
         self.assertEqual(mock_tc.call_count, 4)
         mock_tc.assert_has_calls([
             call(
                 'FakeTestCase1',
                 'testcases_executor.tests.test_tc_reporter.test_contexts',
-                3, ['Context Method', 'Context Method', 'Context Method']),
+                3, ['Context Method', 'Context Method', 'Context Method'],
+                []),
             call(
                 'FakeTestCase2',
                 'testcases_executor.tests.test_tc_reporter.test_contexts',
-                2, ['Context Method']),
+                2, ['Context Method'], []),
             call(
                 'FakeTestCase3',
                 'testcases_executor.tests.test_tc_reporter.test_contexts',
-                2, ['Context Method']),
+                2, ['Context Method'], []),
             call(
                 'FakeTestCase4',
                 'testcases_executor.tests.test_tc_reporter.test_contexts',
-                8, ['Context Method', 'Context Method'])])
+                8, ['Context Method', 'Context Method'], [])])
         self.assertEqual(mock_group.call_count, 2)
         mock_group.assert_has_calls([
             call(
                 'group one', 'status group 1', 'n_tests group 1',
                 'duration group 1',
-                ['Context TestCase', 'Context TestCase', 'Context TestCase']),
+                ['Context TestCase', 'Context TestCase', 'Context TestCase'],
+                'stats group 1'),
             call(
                 'group two', 'status group 2', 'n_tests group 2',
-                'duration group 2', ['Context TestCase'])])
+                'duration group 2', ['Context TestCase'], None)])
         self.assertListEqual(obj.groups, ['Context Group', 'Context Group'])
+        mock_stalls.return_value = {'t8 id': 'stacks'}  # a stalled test
+        t8 = Mock()
+        t8.id.return_value = 't8 id'
+        result.test_methods = [(group_one, [(FakeTestCase1, [t8])])]
+        result.records[t8] = TestRecord(1)
+        ContextReport('project name', result)
+        mock_method.assert_called_with(t8, result.records[t8], 'stacks', None)
+        mock_stalls.reset_mock()  # merged results, stacks of a local run
+        ContextReport('project name', result, False)
+        mock_stalls.assert_not_called()
+        mock_method.assert_called_with(t8, result.records[t8], None, None)
+        mock_stalls.return_value = {}  # same traceback displayed once
+        t9, t10, t11 = Mock(), Mock(), Mock()
+        t9._testMethodName, t10._testMethodName = 't9', 't10'
+        result.test_methods = [
+            (group_one, [(FakeTestCase1, [t9])]),
+            (group_two, [(FakeTestCase4, [t10, t11])])]
+        result.records[t9] = TestRecord(1, 'errors', 'trace')
+        result.records[t10] = TestRecord(1, 'failed', 'trace')
+        result.records[t11] = TestRecord(1, 'skipped', 'trace')
+        mock_method.reset_mock()
+        ContextReport('project name', result)
+        mock_method.assert_has_calls([
+            call(t9, result.records[t9], None, None),
+            call(t10, result.records[t10], None, 'FakeTestCase1.t9'),
+            call(t11, result.records[t11], None, None)])
+        result.unrecorded = {  # errors without record, not a subtest's one
+            FakeTestCase1: [  # displayed with its test
+                ('errors', 'setUpClass (module.TC)', 'trace', None),
+                ('failed', 't9 (i=1)', 'trace', 0)],
+            FakeTestCase4: [('errors', 'tearDownClass (module.TC)', 'other',
+                             None)]}
+        mock_tc.reset_mock()
+        obj = ContextReport('project name', result)
+        tc_errors = [tc_call.args[4] for tc_call in mock_tc.call_args_list]
+        self.assertListEqual(tc_errors, [
+            [ContextError(
+                'setUpClass (module.TC)', 'errors', 'trace', 'error0',
+                'FakeTestCase1.t9')],
+            [ContextError(
+                'tearDownClass (module.TC)', 'errors', 'other', 'error0')]])
@@ -86,7 +86,7 @@ class TestTestCasesHtmlReport(TestCase):
                 'testcases_executor.tc_reporter')
             obj_env.get_template.assert_called_once_with(
                 'report_template.html')
-            mock_context.assert_called_once_with('basename', result)
+            mock_context.assert_called_once_with('basename', result, True)
             mock_basename.assert_called_once_with('getcwd')
             mock_getcwd.assert_called_once_with()
             m.assert_called_once_with('./tc_executor_report.html', 'w')
@@ -96,3 +96,5 @@ class TestTestCasesHtmlReport(TestCase):
                 groups=mock_context().groups)
             TestCasesHtmlReport(result, True)
             mock_browser.assert_called_once_with('./tc_executor_report.html')
+            TestCasesHtmlReport(result, False, False)  # merged results
+            mock_context.assert_called_with('basename', result, False)
@@ -4,16 +4,102 @@ Module testcases_executor.tests.test_tc_result .
 Contain TestCase for testcases_executor.tc_result .
 
 Classes:
+    TestTestRecord(TestCase)
+    TestTestDurations(TestCase)
     TestTestCasesResult(TestCase)
 
 Imports:
-    from unittest: TestCase, TestResult
+    from datetime: datetime
+    from io: StringIO
+    from unittest: TestCase, TestResult, TestSuite
     from unittest.mock: patch, call, Mock
-    from testcases_executor.tc_result: TestCasesResult
+    from unittest.runner: _WritelnDecorator
+    from unittest.suite: _ErrorHolder
+    from testcases_executor.tc_result: (
+        TestRecord, TestDurations, TestCasesResult)
+    from testcases_executor.tc_traces: TracebackStore
 """
-from unittest import TestCase, TestResult
+from datetime import datetime
+from io import StringIO
+from unittest import TestCase, TestResult, TestSuite
 from unittest.mock import patch, call, Mock
-from testcases_executor.tc_result import TestCasesResult
+from unittest.runner import _WritelnDecorator
+from unittest.suite import _ErrorHolder
+from testcases_executor.tc_result import (
+    TestRecord, TestDurations, TestCasesResult)
+from testcases_executor.tc_traces import TracebackStore
+
+
+class TestTestRecord(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_result.TestRecord .
+
+    Methods
+    ----------
+    test_init_record():
+        Assert record's attributes, defaults and no instance's dict.
+    """
+
+    def test_init_record(self):
+        """
+        Assert record's attributes, defaults and no instance's dict.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert attributes values.
+        assertIsNone:
+            Assert no error by default.
+        assertFalse:
+            Assert no __dict__ with slots.
+        assertRaises:
+            Assert AttributeError for an attribute not in slots.
+        """
+        obj = TestRecord(0.5)
+        self.assertEqual(obj.duration, 0.5)
+        self.assertEqual(obj.status, 'success')
+        self.assertIsNone(obj.err)
+        obj = TestRecord(1, 'errors', 'error')
+        self.assertEqual((obj.status, obj.err), ('errors', 'error'))
+        self.assertFalse(hasattr(obj, '__dict__'))
+        with self.assertRaises(AttributeError):
+            obj.other = 1
+
+
+class TestTestDurations(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_result.TestDurations .
+
+    Methods
+    ----------
+    test_durations():
+        Assert tests's durations read from result's records, read-only.
+    """
+
+    def test_durations(self):
+        """
+        Assert tests's durations read from result's records, read-only.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert durations, number of tests, records replaced too.
+        assertRaises:
+            Assert TypeError when set.
+        """
+        result = Mock(records={'t1': TestRecord(0.5), 't2': TestRecord(1)})
+        obj = TestDurations(result)
+        self.assertEqual(obj['t1'], 0.5)
+        self.assertEqual(dict(obj), {'t1': 0.5, 't2': 1})
+        self.assertEqual(len(obj), 2)
+        result.records = {'t3': TestRecord(2)}
+        self.assertEqual(dict(obj), {'t3': 2})
+        with self.assertRaises(TypeError):
+            obj['t4'] = 1
 
 
 class TestTestCasesResult(TestCase):
@@ -28,6 +114,30 @@ class TestTestCasesResult(TestCase):
         Assert if TestCasesResult is initialized with good attributes.
     test_startTest():
         Assert if TestCasesResult.startTest write good things in stream.
+    test_end_concurrent_test():
+        Assert gathered test's name displayed and its start times set.
+    test_stopTest():
+        Assert if TestCasesResult.stopTest stop watchdog's timer and timing.
+    test_timed():
+        Assert timed call's duration added to current test's part.
+    test_complete_record():
+        Assert test's record completed with duration, CPU time and memory.
+    test_exc_info_to_string():
+        Assert same tracebacks of different tests shared once formatted.
+    test_write_journal():
+        Assert runned test's outcome written in journal with its group.
+    test_set_status():
+        Assert test's status saved in its record and counted.
+    test_set_status_dots():
+        Assert a character written by test's status with -q .
+    test_update_progress():
+        Assert progress line updated with tests, failed, errors and ETA.
+    test_addSubTest():
+        Assert failed subtests counted, super's addSubTest called.
+    test_add_holder_error():
+        Assert setUpClass's error listed, counted and displayed.
+    test_fixture_and_subtests():
+        Assert setUpClass errors and failed subtests of a suite runned.
     test_addFoo():
         Assert if TestCasesResult.addFoo save duration write it with status.
     test_addSuccess():
@@ -42,16 +152,34 @@ class TestTestCasesResult(TestCase):
         Assert TestCasesResult.addExpectedFailure call addFoo, same on super.
     test_addUnexpectedSuccess():
         Assert TestCasesResult.addUnexpectedSuccess call addFoo, same on super.
+    test_get_outcomes():
+        Assert get_outcomes return status, duration, error, timing, memory.
+    test_get_unrecorded_errors():
+        Assert errors and failures without record got, not tests's ones.
+    test_keep_unrecorded():
+        Assert testcase's errors without record kept and journaled.
+    test_add_outcome():
+        Assert add_outcome update tests run, records and errors lists.
+    test_add_unrecorded_error():
+        Assert error without record listed, counted, stops with failfast.
     test_printErrors():
         Assert stream.writeln called once, printErrorList 2 with parameters.
     test_printErrorList():
         Assert stream.writeln calls and parameters.
     test_printTotal():
         Assert stream.writeln called once with good parameter.
+    test_printStats():
+        Assert percentiles of group's or all tests's durations saved, shown.
+    test_printSlowest():
+        Assert slowest tests and testcases displayed, slowest first.
     test_get_n_tests():
         Assert get_n_tests return good value depending of tests's lists.
     test_printInfos():
         Assert stream.writeln called once or two with parameters.
+    test_one():
+        Used as a test runned by other tests.
+    test_two():
+        Used as a test runned by other tests.
     """
 
     @patch("testcases_executor.tc_result.TestResult.__init__")
@@ -83,10 +211,34 @@ class TestTestCasesResult(TestCase):
         self.assertEqual(obj.test_methods, [])
         self.assertEqual(
             obj.durations, {'groups': {}, 'testcases': {}, 'tests': {}})
+        self.assertIsInstance(obj.durations['tests'], TestDurations)
+        self.assertEqual(obj.records, {})
         self.assertEqual(obj.n_tests, {'groups': {}})
+        self.assertEqual(obj.stats, {'groups': {}})
         self.assertEqual(obj.status, {'groups': {}})
+        self.assertIsNone(obj.watchdog)
+        self.assertIsNone(obj.memory)
+        self.assertIsNone(obj.journal)
+        self.assertIsNone(obj.history)
+        self.assertIsNone(obj.impact)
+        self.assertEqual(obj.display, 'tests')
+        self.assertIsNone(obj.planned)
+        self.assertEqual(obj.expected, {})
+        self.assertEqual((obj.expected_done, obj.expected_left), (0, 0))
+        self.assertIsInstance(obj.traces, TracebackStore)
+        self.assertEqual(obj.counts, {'total': {
+            'success': 0, 'failed': 0, 'errors': 0, 'skipped': 0,
+            'expectedFails': 0, 'unexpectedSuccesses': 0}, 'groups': {}})
+        self.assertIsNone(obj.group)
+        self.assertEqual(obj.test_t_start, 0)
+        self.assertIsNone(obj.test_cpu_start)
+        self.assertEqual(obj.test_parts, {})
+        self.assertFalse(obj.concurrent)
+        self.assertDictEqual(obj.unrecorded, {})
+        self.assertIsNone(obj.subtests_status)
+        self.assertIsNone(obj.subtests_err)
 
-    @patch("testcases_executor.tc_result.time.time")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     @patch("testcases_executor.tc_result.TestResult.startTest")
     def test_startTest(self, mock_start_test, mock_time):
         """
@@ -97,28 +249,44 @@ class TestTestCasesResult(TestCase):
         mock_start_test : Mock
             Mock of unittest.TestResult.startTest .
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Classes:
         ----------
         FakeTest:
-            A fake test with property _testMethodName.
+            A fake test with property _testMethodName and parts's methods.
 
         Assertions:
         ----------
         assert_called_once_with:
             Assert if TestResult.startTest is called with test in parameter,
-            stream.flush without parameter.
+            stream.flush without parameter, watchdog.start_test with test,
+            memory.start_test without parameter.
         assertEqual:
-            Assert if stream.write called 2 and value of test_t_start property.
+            Assert if stream.write called 2, value of test_t_start property,
+            parts timed in test_parts, gathered test only counted.
         assert_has_calls:
             Assert stream.write calls parameters.
+        assertIsInstance:
+            Assert CPU start time.
         """
         class FakeTest():
 
             def __init__(self):
                 self._testMethodName = 'test'
 
+            def _callSetUp(self):
+                pass
+
+            def _callTestMethod(self, method):
+                return method
+
+            def _callTearDown(self):
+                pass
+
+            def _callCleanup(self, function):
+                pass
+
         test = FakeTest()
         obj = TestCasesResult(stream=Mock())
         mock_time.return_value = 103
@@ -128,6 +296,226 @@ class TestTestCasesResult(TestCase):
         obj.stream.write.assert_has_calls([call('test'), call(" ... ")])
         obj.stream.flush.assert_called_once_with()
         self.assertEqual(obj.test_t_start, 103)
+        self.assertIsInstance(obj.test_cpu_start, int)
+        mock_time.side_effect = [200, 250]
+        self.assertEqual(test._callTestMethod('method'), 'method')
+        self.assertEqual(obj.test_parts, {'test': 5e-08})
+        mock_time.side_effect = None
+        obj.watchdog = Mock()  # with timeouts
+        obj.memory = Mock()  # with --mem
+        obj.startTest(test)
+        obj.watchdog.start_test.assert_called_once_with(test)
+        obj.memory.start_test.assert_called_once_with()
+        obj.concurrent = True  # gathered test, only counted
+        obj.startTest(test)
+        self.assertEqual(mock_start_test.call_count, 3)
+        obj.watchdog.start_test.assert_called_once_with(test)
+        self.assertEqual(4, obj.stream.write.call_count)
+
+    def test_end_concurrent_test(self):
+        """
+        Assert gathered test's name displayed and its start times set.
+
+        Assertions:
+        ----------
+        assert_has_calls:
+            Assert stream.write calls parameters.
+        assertEqual:
+            Assert test_t_start and test_parts set, stream.write not called
+            without tests display.
+        assertIsNone:
+            Assert CPU time and subtests's status not measured or reset.
+        """
+        obj = TestCasesResult(stream=Mock())
+        obj.test_cpu_start, obj.subtests_status = 10, 'failed'
+        test, parts = Mock(_testMethodName='test_one'), {'test': 0.1}
+        obj.end_concurrent_test(test, 103, parts)
+        obj.stream.write.assert_has_calls([call('test_one'), call(" ... ")])
+        self.assertEqual(obj.test_t_start, 103)
+        self.assertIs(obj.test_parts, parts)
+        self.assertIsNone(obj.test_cpu_start)
+        self.assertIsNone(obj.subtests_status)
+        obj.display = 'dots'
+        obj.end_concurrent_test(test, 104, parts)
+        self.assertEqual(obj.stream.write.call_count, 2)
+
+    @patch("testcases_executor.tc_result.TestResult.stopTest")
+    def test_stopTest(self, mock_stop_test):
+        """
+        Assert if TestCasesResult.stopTest stop watchdog's timer and timing.
+
+        Parameters:
+        ----------
+        mock_stop_test : Mock
+            Mock of unittest.TestResult.stopTest .
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert if TestResult.stopTest is called with test in parameter,
+            watchdog.stop_test without parameter, complete_record and
+            write_journal with test.
+        assertEqual:
+            Assert test failed by subtests recorded, not counted again.
+        """
+        obj = TestCasesResult(stream=Mock())
+        obj.complete_record = Mock()
+        obj.write_journal = Mock()
+        obj.stopTest('test')
+        mock_stop_test.assert_called_once_with('test')
+        obj.complete_record.assert_called_once_with('test')
+        obj.write_journal.assert_called_once_with('test')
+        obj.watchdog = Mock()  # with timeouts
+        obj.stopTest('test')
+        obj.watchdog.stop_test.assert_called_once_with()
+        obj.subtests_status = 'errors'  # failed only by its subtests
+        obj.subtests_err = 'sub error'
+        obj.stopTest('test')
+        record = obj.records['test']
+        self.assertEqual((record.status, record.err), ('errors', 'sub error'))
+        self.assertEqual(obj.counts['total']['errors'], 0)
+        obj.stream.writeln.assert_called_once()
+        self.assertIn('ERROR', obj.stream.writeln.call_args[0][0])
+
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
+    def test_timed(self, mock_time):
+        """
+        Assert timed call's duration added to current test's part.
+
+        Parameters:
+        ----------
+        mock_time : Mock
+            Mock of time.perf_counter_ns used by timed_part.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert returned value, wrapped name and part's duration.
+        assertRaises:
+            Assert error raised by call, its duration added.
+        """
+        def method():
+            return 'value'
+
+        def error():
+            raise ValueError
+
+        obj = TestCasesResult(stream='stream')
+        timed = obj.timed(method, 'cleanup')
+        self.assertEqual(timed.__name__, 'method')
+        with patch("testcases_executor.tc_utils.time.perf_counter_ns") as m:
+            m.side_effect = [1000, 3000, 5000, 6000]
+            self.assertEqual(timed(), 'value')
+            self.assertRaises(ValueError, obj.timed(error, 'cleanup'))
+        self.assertEqual(obj.test_parts, {'cleanup': 3e-06})
+
+    @patch("testcases_executor.tc_result.time.process_time_ns")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
+    def test_complete_record(self, mock_time, mock_cpu):
+        """
+        Assert test's record completed with duration, CPU time and memory.
+
+        Parameters:
+        ----------
+        mock_time : Mock
+            Mock of time.perf_counter_ns .
+        mock_cpu : Mock
+            Mock of time.process_time_ns .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert record's duration, CPU time and memory.
+        assertIsNone:
+            Assert CPU time not measured without start, memory without
+            active tracer or for a gathered test.
+        """
+        mock_time.return_value, mock_cpu.return_value = 4000000, 3000000
+        obj = TestCasesResult(stream='stream')
+        obj.complete_record('test')  # no record
+        obj.test_t_start, obj.test_cpu_start = 1000000, 2000000
+        obj.records['test'] = TestRecord(0.001, parts=obj.test_parts)
+        obj.records['other'] = TestRecord(0.001, parts={})
+        obj.complete_record('test')
+        obj.complete_record('other')  # record not from this result's test
+        self.assertEqual(obj.records['test'].duration, 0.003)
+        self.assertEqual(obj.records['test'].cpu, 0.001)
+        self.assertEqual(obj.records['other'].duration, 0.001)
+        self.assertIsNone(obj.records['test'].mem_peak)
+        obj.test_cpu_start = None
+        obj.memory = Mock(active=True)  # with --mem
+        obj.memory.measure.return_value = (1024, 4096)
+        obj.records['test'] = TestRecord(0.001, parts=obj.test_parts)
+        obj.complete_record('test')
+        self.assertIsNone(obj.records['test'].cpu)
+        self.assertEqual(obj.records['test'].mem_peak, 1024)
+        self.assertEqual(obj.records['test'].mem_rss, 4096)
+        obj.concurrent = True  # gathered test
+        obj.records['test'] = TestRecord(0.001, parts=obj.test_parts)
+        obj.complete_record('test')
+        self.assertIsNone(obj.records['test'].mem_peak)
+
+    def test_exc_info_to_string(self):
+        """
+        Assert same tracebacks of different tests shared once formatted.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with tests failing in a shared fixture.
+
+        Assertions:
+        ----------
+        assertIs:
+            Assert errors and records share one traceback.
+        assertEqual:
+            Assert number of tests with traceback.
+        assertNotIn:
+            Assert timed call's frame hidden.
+        """
+        class FakeTestCase(TestCase):
+
+            def setUp(self):
+                raise ValueError(f"broken fixture {object()}")
+
+            def test_one(self):
+                pass
+
+            def test_two(self):
+                pass
+
+        result = TestCasesResult(stream=Mock())
+        tests = [FakeTestCase('test_one'), FakeTestCase('test_two')]
+        for test in tests:
+            test(result)
+        self.assertIs(result.errors[0][1], result.errors[1][1])
+        self.assertIs(result.records[tests[1]].err, result.errors[0][1])
+        self.assertEqual(result.traces.count(result.errors[0][1]), 2)
+        self.assertNotIn('timed_call', result.errors[0][1])
+
+    def test_write_journal(self):
+        """
+        Assert runned test's outcome written in journal with its group.
+
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert journal.write_test called with test, group and outcome,
+            history.write_test too.
+        """
+        obj = TestCasesResult(stream='stream')
+        obj.write_journal('test')  # without --journal
+        obj.journal, obj.group = Mock(), 'group'
+        obj.write_journal('test')  # not runned
+        obj.journal.write_test.assert_not_called()
+        obj.records['test'] = TestRecord(0.5, 'failed', 'error')
+        obj.write_journal('test')
+        obj.journal.write_test.assert_called_once_with(
+            'test', 'group', ('failed', 0.5, 'error', None, None, None, None))
+        obj.journal, obj.history = None, Mock()  # with --history
+        obj.write_journal('test')
+        obj.history.write_test.assert_called_once_with(
+            'test', 'group', ('failed', 0.5, 'error', None, None, None, None))
 
     def test_addFoo(self):
         """
@@ -139,17 +527,275 @@ class TestTestCasesResult(TestCase):
             Assert if stream.write called with good parameter,
             stream.flush without.
         assertEqual:
-            Assert if value with key test in durations property with key tests.
+            Assert record's duration, default status, CPU time, parts, memory.
+        assertIs:
+            Assert record's parts are current test's parts.
+        assertIsNone:
+            Assert CPU time and memory not measured, memory of gathered test.
         """
         obj = TestCasesResult(stream=Mock())
-        obj.test_t_start = 1000.00234862
-        obj.addFoo(1000.00523, 'test', 'OK')
+        obj.test_t_start = 1000002348620
+        obj.addFoo(1000005230000, 'test', 'OK')
         obj.stream.writeln.assert_called_once_with(
             "OK ... \x1b[35m2.881 ms\x1b[39m")
         obj.stream.flush.assert_called_once_with()
-        self.assertEqual(obj.durations['tests']['test'], 0.002881)
+        self.assertEqual(obj.records['test'].duration, 0.002881)
+        self.assertEqual(obj.records['test'].status, 'success')
+        self.assertIsNone(obj.records['test'].cpu)
+        obj.stream = Mock()  # with parts and CPU time
+        obj.test_parts = {'setUp': 0.001, 'test': 0.0015}
+        with patch(
+                "testcases_executor.tc_result.time.process_time_ns",
+                return_value=2500000):
+            obj.test_cpu_start = 500000
+            obj.addFoo(1000005230000, 'test', 'OK')
+        obj.stream.writeln.assert_called_once_with("".join([
+            "OK ... \x1b[35m2.881 ms\x1b[39m \x1b[2m(setUp 1.0 ms, ",
+            "test 1.5 ms, CPU 2.0 ms)\x1b[0m"]))
+        self.assertEqual(obj.records['test'].cpu, 0.002)
+        self.assertIs(obj.records['test'].parts, obj.test_parts)
+        obj.stream, obj.test_parts = Mock(), {}  # with --mem
+        obj.memory = Mock()
+        obj.memory.measure.return_value = (1536, 2 ** 20)
+        obj.test_cpu_start = None
+        obj.addFoo(1000005230000, 'test', 'OK')
+        obj.stream.writeln.assert_called_once_with("".join([
+            "OK ... \x1b[35m2.881 ms\x1b[39m \x1b[36mpeak 1.5 KiB, ",
+            "RSS +1.0 MiB\x1b[39m"]))
+        self.assertEqual(obj.records['test'].mem_peak, 1536)
+        self.assertEqual(obj.records['test'].mem_rss, 2 ** 20)
+        obj.stream, obj.concurrent = Mock(), True  # gathered test
+        obj.addFoo(1000005230000, 'test', 'OK')
+        obj.stream.writeln.assert_called_once_with(
+            "OK ... \x1b[35m2.881 ms\x1b[39m")
+        self.assertIsNone(obj.records['test'].mem_peak)
+        self.assertIsNone(obj.records['test'].mem_rss)
+        obj.concurrent = False
+        obj.stream, obj.memory = Mock(), None  # displayed by set_status
+        obj.display = 'dots'
+        obj.addFoo(1000005230000, 'test', 'OK')
+        obj.stream.writeln.assert_not_called()
+        self.assertEqual(obj.records['test'].duration, 0.002881)
+
+    def test_set_status(self):
+        """
+        Assert test's status saved in its record and counted.
 
-    @patch("testcases_executor.tc_result.time.time")
+        Assertions:
+        ----------
+        assertEqual:
+            Assert records, counters and current group.
+        """
+        obj = TestCasesResult(stream='stream')
+        for test in ['t1', 't2', 't3']:
+            obj.records[test] = TestRecord(1)
+        obj.set_status('t1', 'failed')  # without group
+        obj.start_group('group')
+        self.assertEqual(obj.group, 'group')
+        obj.set_status('t2', 'failed', 'fail')
+        obj.set_status('t3', 'success')
+        self.assertEqual(
+            [obj.records[test].status for test in ['t1', 't2', 't3']],
+            ['failed', 'failed', 'success'])
+        self.assertEqual(obj.records['t2'].err, 'fail')
+        self.assertEqual(obj.counts['total']['failed'], 2)
+        self.assertEqual(obj.counts['total']['success'], 1)
+        self.assertEqual(obj.counts['groups']['group']['failed'], 1)
+        self.assertEqual(obj.counts['groups']['group']['success'], 1)
+
+    def test_set_status_dots(self):
+        """
+        Assert a character written by test's status with -q .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert characters written.
+        assert_not_called:
+            Assert nothing written with default display.
+        """
+        obj = TestCasesResult(stream=Mock())
+        obj.update_progress = Mock()
+        for test in ['t1', 't2', 't3']:
+            obj.records[test] = TestRecord(1)
+        obj.set_status('t1', 'success')
+        obj.stream.write.assert_not_called()
+        obj.display = 'dots'
+        obj.set_status('t2', 'failed', 'fail')
+        obj.set_status('t3', 'skipped', 'reason')
+        self.assertEqual(
+            obj.stream.write.call_args_list, [call('F'), call('s')])
+        self.assertEqual(obj.stream.flush.call_count, 2)
+        self.assertEqual(obj.update_progress.call_count, 3)
+
+    @patch("testcases_executor.tc_result.datetime")
+    def test_update_progress(self, mock_datetime):
+        """
+        Assert progress line updated with tests, failed, errors and ETA.
+
+        Parameters:
+        ----------
+        mock_datetime : Mock
+            Mock of datetime.
+
+        Assertions:
+        ----------
+        assert_not_called:
+            Assert line not updated without --progress or in a worker.
+        assert_called_once_with:
+            Assert line updated and flushed.
+        assertEqual:
+            Assert expected durations of tests completed and left.
+        """
+        mock_datetime.now.return_value = datetime(2024, 1, 1, 0, 1, 30)
+        test, resumed, other = Mock(), Mock(), Mock()
+        test.id.return_value = 'test'
+        resumed.id.return_value = 'resumed'
+        other.id.return_value = 'other'
+        obj = TestCasesResult(stream=Mock())
+        obj.start_time = datetime(2024, 1, 1)
+        obj.planned = 8
+        obj.update_progress(test)
+        obj.display = 'progress'
+        obj.planned = None  # in a worker
+        obj.update_progress(test)
+        obj.stream.update_line.assert_not_called()
+        obj.planned, obj.testsRun = 8, 1
+        obj.expected = {'test': 2, 'other': 6}
+        obj.expected_left = 8
+        obj.update_progress(resumed)  # no ETA before a test runned
+        obj.stream.update_line.assert_called_once_with(
+            " 1/8 tests (12%) \x1b[2m1:30 elapsed\x1b[0m")
+        obj.stream.flush.assert_called_once_with()
+        obj.stream = Mock()
+        obj.testsRun = 3
+        obj.counts['total']['failed'] = 1
+        obj.counts['total']['errors'] = 2
+        obj.update_progress(test)
+        self.assertEqual((obj.expected_done, obj.expected_left), (2, 6))
+        self.assertEqual(obj.expected, {'other': 6})
+        obj.stream.update_line.assert_called_once_with("".join([
+            " 3/8 tests (37%), \x1b[33m1 failed\x1b[39m, ",
+            "\x1b[31m2 errors\x1b[39m \x1b[2m1:30 elapsed, ETA 4:30",
+            "\x1b[0m"]))
+
+    @patch("testcases_executor.tc_result.TestResult.addSubTest")
+    def test_addSubTest(self, mock_add_sub_test):
+        """
+        Assert failed subtests counted, super's addSubTest called.
+
+        Parameters:
+        ----------
+        mock_add_sub_test : Mock
+            Mock of unittest.TestResult.addSubTest .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert counters, worst status, first error and super calls.
+        """
+        obj = TestCasesResult(stream='stream')
+        mock_add_sub_test.side_effect = lambda test, sub, err: err and (
+            obj.failures if err[0] is AssertionError else obj.errors
+        ).append((sub, f"{sub} error"))
+        test = Mock(failureException=AssertionError)
+        obj.addSubTest(test, 'sub1', None)
+        obj.addSubTest(test, 'sub2', (AssertionError, None, None))
+        obj.addSubTest(test, 'sub3', (ValueError, None, None))
+        self.assertEqual(obj.records, {})  # test's record by stopTest
+        self.assertEqual(obj.counts['total']['success'], 0)
+        self.assertEqual(obj.counts['total']['failed'], 1)
+        self.assertEqual(obj.counts['total']['errors'], 1)
+        self.assertEqual(obj.subtests_status, 'errors')  # worst status
+        self.assertEqual(obj.subtests_err, 'sub2 error')  # first one
+        self.assertEqual(mock_add_sub_test.call_count, 3)
+        obj.addSubTest(test, 'sub4', (AssertionError, None, None))
+        self.assertEqual(obj.subtests_status, 'errors')
+
+    def test_add_holder_error(self):
+        """
+        Assert setUpClass's error listed, counted and displayed.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert error listed and counted without record, line written.
+        """
+        obj = TestCasesResult(stream=Mock())
+        obj.addFoo = Mock()
+        holder = _ErrorHolder('setUpClass (module.TC)')
+        try:
+            raise ValueError('class setup')
+        except ValueError as error:
+            err = (ValueError, error, error.__traceback__)
+        obj.addError(holder, err)
+        obj.addFoo.assert_not_called()  # no duration
+        self.assertEqual(obj.records, {})
+        self.assertEqual(len(obj.errors), 1)
+        self.assertIs(obj.errors[0][0], holder)
+        self.assertIn('ValueError: class setup', obj.errors[0][1])
+        self.assertEqual(obj.counts['total']['errors'], 1)
+        obj.stream.writeln.assert_called_once_with(
+            'setUpClass (module.TC) ... \x1b[31mERROR\x1b[39m')
+        obj.display = 'dots'
+        obj.addError(holder, err)
+        obj.stream.write.assert_called_once_with('E')
+
+    def test_fixture_and_subtests(self):
+        """
+        Assert setUpClass errors and failed subtests of a suite runned.
+
+        Classes:
+        ----------
+        FailingClass:
+            TestCase with a failing setUpClass.
+        FailingSubtests:
+            TestCase with failed subtests and a test succeeding.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert errors and failures listed, counted, records of tests.
+        assertIn:
+            Assert names of setUpClass and subtests in errors displayed.
+        """
+        class FailingClass(TestCase):
+            @classmethod
+            def setUpClass(cls):
+                raise RuntimeError('class setup')
+
+            def test_one(self):
+                pass
+
+        class FailingSubtests(TestCase):
+            def test_sub(self):
+                for i in range(3):
+                    with self.subTest(i=i):
+                        self.assertLess(i, 1)
+
+            def test_ok(self):
+                pass
+
+        obj = TestCasesResult(_WritelnDecorator(StringIO()))
+        TestSuite([FailingClass('test_one')])(obj)
+        sub_test, ok_test = FailingSubtests('test_sub'), FailingSubtests(
+            'test_ok')
+        TestSuite([sub_test, ok_test])(obj)
+        self.assertEqual(len(obj.errors), 1)  # setUpClass
+        self.assertEqual(len(obj.failures), 2)  # subtests i=1, i=2
+        self.assertEqual(obj.counts['total']['errors'], 1)
+        self.assertEqual(obj.counts['total']['failed'], 2)
+        self.assertEqual(obj.counts['total']['success'], 1)
+        self.assertEqual(list(obj.records), [sub_test, ok_test])
+        self.assertEqual(obj.records[sub_test].status, 'failed')
+        self.assertIs(obj.records[sub_test].err, obj.failures[0][1])
+        obj.printErrors()
+        output = obj.stream.getvalue()
+        self.assertIn('setUpClass (', output)
+        self.assertIn('FailingSubtests.test_sub) (i=2)', output)
+        self.assertEqual(obj.get_n_tests(None)['failed'], 2)
+
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     def test_addSuccess(self, mock_time):
         """
         Assert if TestCasesResult.addSuccess call addFoo with good parameters.
@@ -157,23 +803,25 @@ class TestTestCasesResult(TestCase):
         Parameters:
         ----------
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Assertions:
         ----------
         assertEqual:
-            Assert if obj.addFoo call one.
+            Assert if obj.addFoo call one, test's status and error in record.
         assert_has_calls:
             Assert obj.addFoo call parameters.
         """
         mock_time.return_value = 103
         obj = TestCasesResult(stream='stream')
-        obj.addFoo = Mock()
+        obj.addFoo = Mock(side_effect=lambda t_stop, test, status: (
+            obj.records.__setitem__(test, TestRecord(1))))
         obj.addSuccess('test')
         self.assertEqual(1, obj.addFoo.call_count)
         obj.addFoo.assert_has_calls([call(103, 'test', '\x1b[32mOK\x1b[39m')])
+        self.assertEqual(obj.records['test'].status, 'success')
 
-    @patch("testcases_executor.tc_result.time.time")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     @patch("testcases_executor.tc_result.TestResult.addError")
     def test_addError(self, mock_add_error, mock_time):
         """
@@ -184,25 +832,35 @@ class TestTestCasesResult(TestCase):
         mock_add_error : Mock
             Mock of TestResult.addError .
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Assertions:
         ----------
         assertEqual:
-            Assert if obj.addFoo call one.
+            Assert if obj.addFoo call one, test's status and error in record.
         assert_has_calls:
             Assert obj.addFoo call parameters.
         """
         mock_time.return_value = 103
         obj = TestCasesResult(stream='stream')
-        obj.addFoo = Mock()
+        obj.addFoo = Mock(side_effect=lambda t_stop, test, status: (
+            obj.records.__setitem__(test, TestRecord(1))))
+        mock_add_error.side_effect = lambda test, err: (
+            obj.errors.append((test, 'formatted')))
         obj.addError('test', 'error')
         self.assertEqual(1, obj.addFoo.call_count)
         obj.addFoo.assert_has_calls(
             [call(103, 'test', '\x1b[31mERROR\x1b[39m')])
         mock_add_error.assert_called_once_with('test', 'error')
+        self.assertEqual(obj.records['test'].status, 'errors')
+        self.assertEqual(obj.records['test'].err, 'formatted')
+        obj.add_holder_error = Mock()  # setUpClass's error, not a test
+        holder = _ErrorHolder('setUpClass (module.TC)')
+        obj.addError(holder, 'error')
+        obj.add_holder_error.assert_called_once_with(holder, 'error')
+        self.assertEqual(1, obj.addFoo.call_count)
 
-    @patch("testcases_executor.tc_result.time.time")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     @patch("testcases_executor.tc_result.TestResult.addFailure")
     def test_addFailure(self, mock_add_fail, mock_time):
         """
@@ -213,25 +871,30 @@ class TestTestCasesResult(TestCase):
         mock_add_fail : Mock
             Mock of TestResult.addFailure .
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Assertions:
         ----------
         assertEqual:
-            Assert if obj.addFoo call one.
+            Assert if obj.addFoo call one, test's status and error in record.
         assert_has_calls:
             Assert obj.addFoo call parameters.
         """
         mock_time.return_value = 103
         obj = TestCasesResult(stream='stream')
-        obj.addFoo = Mock()
+        obj.addFoo = Mock(side_effect=lambda t_stop, test, status: (
+            obj.records.__setitem__(test, TestRecord(1))))
+        mock_add_fail.side_effect = lambda test, err: (
+            obj.failures.append((test, 'formatted')))
         obj.addFailure('test', 'error')
         self.assertEqual(1, obj.addFoo.call_count)
         obj.addFoo.assert_has_calls(
             [call(103, 'test', '\x1b[33mFAIL\x1b[39m')])
         mock_add_fail.assert_called_once_with('test', 'error')
+        self.assertEqual(obj.records['test'].status, 'failed')
+        self.assertEqual(obj.records['test'].err, 'formatted')
 
-    @patch("testcases_executor.tc_result.time.time")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     @patch("testcases_executor.tc_result.TestResult.addSkip")
     def test_addSkip(self, mock_add_skip, mock_time):
         """
@@ -242,25 +905,28 @@ class TestTestCasesResult(TestCase):
         mock_add_skip : Mock
             Mock of TestResult.addSkip .
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Assertions:
         ----------
         assertEqual:
-            Assert if obj.addFoo call one.
+            Assert if obj.addFoo call one, test's status and error in record.
         assert_has_calls:
             Assert obj.addFoo call parameters.
         """
         mock_time.return_value = 103
         obj = TestCasesResult(stream='stream')
-        obj.addFoo = Mock()
+        obj.addFoo = Mock(side_effect=lambda t_stop, test, status: (
+            obj.records.__setitem__(test, TestRecord(1))))
         obj.addSkip('test', 'reason')
         self.assertEqual(1, obj.addFoo.call_count)
         obj.addFoo.assert_has_calls(
             [call(103, 'test', '\x1b[36mSKIP\x1b[39m')])
         mock_add_skip.assert_called_once_with('test', 'reason')
+        self.assertEqual(obj.records['test'].status, 'skipped')
+        self.assertEqual(obj.records['test'].err, 'reason')
 
-    @patch("testcases_executor.tc_result.time.time")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     @patch("testcases_executor.tc_result.TestResult.addExpectedFailure")
     def test_addExpectedFailure(self, mock_add_ex_fail, mock_time):
         """
@@ -271,25 +937,30 @@ class TestTestCasesResult(TestCase):
         mock_add_ex_fail : Mock
             Mock of TestResult.addExpectedFailure .
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Assertions:
         ----------
         assertEqual:
-            Assert if obj.addFoo call one.
+            Assert if obj.addFoo call one, test's status and error in record.
         assert_has_calls:
             Assert obj.addFoo call parameters.
         """
         mock_time.return_value = 103
         obj = TestCasesResult(stream='stream')
-        obj.addFoo = Mock()
+        obj.addFoo = Mock(side_effect=lambda t_stop, test, status: (
+            obj.records.__setitem__(test, TestRecord(1))))
+        mock_add_ex_fail.side_effect = lambda test, err: (
+            obj.expectedFailures.append((test, 'formatted')))
         obj.addExpectedFailure('test', 'error')
         self.assertEqual(1, obj.addFoo.call_count)
         obj.addFoo.assert_has_calls(
             [call(103, 'test', '\x1b[31mexpected failure\x1b[39m')])
         mock_add_ex_fail.assert_called_once_with('test', 'error')
+        self.assertEqual(obj.records['test'].status, 'expectedFails')
+        self.assertEqual(obj.records['test'].err, 'formatted')
 
-    @patch("testcases_executor.tc_result.time.time")
+    @patch("testcases_executor.tc_result.time.perf_counter_ns")
     @patch("testcases_executor.tc_result.TestResult.addUnexpectedSuccess")
     def test_addUnexpectedSuccess(self, mock_add_unex_suc, mock_time):
         """
@@ -300,23 +971,215 @@ class TestTestCasesResult(TestCase):
         mock_add_unex_suc : Mock
             Mock of TestResult.addUnexpectedSuccess .
         mock_time : Mock
-            Mock of time.
+            Mock of time.perf_counter_ns .
 
         Assertions:
         ----------
         assertEqual:
-            Assert if obj.addFoo call one.
+            Assert if obj.addFoo call one, test's status and error in record.
         assert_has_calls:
             Assert obj.addFoo call parameters.
         """
         mock_time.return_value = 103
         obj = TestCasesResult(stream='stream')
-        obj.addFoo = Mock()
+        obj.addFoo = Mock(side_effect=lambda t_stop, test, status: (
+            obj.records.__setitem__(test, TestRecord(1))))
         obj.addUnexpectedSuccess('test')
         self.assertEqual(1, obj.addFoo.call_count)
         obj.addFoo.assert_has_calls(
             [call(103, 'test', '\x1b[32munexpected success\x1b[39m')])
         mock_add_unex_suc.assert_called_once_with('test')
+        self.assertEqual(obj.records['test'].status, 'unexpectedSuccesses')
+
+    def test_get_outcomes(self):
+        """
+        Assert get_outcomes return status, duration, error, timing, memory.
+
+        Assertions:
+        ----------
+        assertListEqual:
+            Assert returned list.
+        """
+        obj = TestCasesResult(stream='stream')
+        obj.records = {
+            't1': TestRecord(
+                1, 'failed', 'fail', 0.5, {'test': 0.8}, 1024, 0),
+            't2': TestRecord(2, 'errors', 'error'),
+            't3': TestRecord(3, 'skipped', 'reason'),
+            't4': TestRecord(4, 'expectedFails', 'e'),
+            't5': TestRecord(5, 'unexpectedSuccesses'), 't6': TestRecord(6)}
+        self.assertListEqual(
+            obj.get_outcomes(['t1', 't2', 't3', 't4', 't5', 't6', 't7']), [
+                ('failed', 1, 'fail', 0.5, {'test': 0.8}, 1024, 0),
+                ('errors', 2, 'error', None, None, None, None),
+                ('skipped', 3, 'reason', None, None, None, None),
+                ('expectedFails', 4, 'e', None, None, None, None),
+                ('unexpectedSuccesses', 5, None, None, None, None, None),
+                ('success', 6, None, None, None, None, None), None])
+
+    def test_add_outcome(self):
+        """
+        Assert add_outcome update tests run, records and errors lists.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert testsRun and records values.
+        assertListEqual:
+            Assert errors lists values.
+        assertFalse, assertTrue:
+            Assert result stopped by failure or error with failfast.
+        assert_called_with:
+            Assert outcome written in journal.
+        """
+        obj = TestCasesResult(stream=Mock())
+        obj.write_journal = Mock()
+        for test, status, err in [
+                ('t1', 'failed', 'fail'), ('t2', 'errors', 'error'),
+                ('t3', 'skipped', 'reason'), ('t4', 'expectedFails', 'e'),
+                ('t5', 'unexpectedSuccesses', None), ('t6', 'success', None)]:
+            obj.add_outcome(test, status, 0.5, err)
+        self.assertEqual(obj.testsRun, 6)
+        self.assertEqual(obj.write_journal.call_count, 6)
+        obj.write_journal.assert_called_with('t6')
+        self.assertEqual(obj.records['t6'].duration, 0.5)
+        self.assertListEqual(obj.failures, [('t1', 'fail')])
+        self.assertListEqual(obj.errors, [('t2', 'error')])
+        self.assertListEqual(obj.skipped, [('t3', 'reason')])
+        self.assertListEqual(obj.expectedFailures, [('t4', 'e')])
+        self.assertListEqual(obj.unexpectedSuccesses, ['t5'])
+        self.assertEqual(obj.records['t6'].status, 'success')
+        self.assertIs(obj.records['t1'].err, obj.failures[0][1])
+        obj.add_outcome(
+            't9', 'success', 0.5, None, 0.4, {'test': 0.45}, 2048, 4096)
+        self.assertEqual(obj.records['t9'].cpu, 0.4)
+        self.assertEqual(obj.records['t9'].parts, {'test': 0.45})
+        self.assertEqual(obj.records['t9'].mem_peak, 2048)
+        self.assertEqual(obj.records['t9'].mem_rss, 4096)
+        obj.failfast = False
+        self.assertEqual(obj.counts['total']['failed'], 1)
+        obj.stream.writeln.assert_not_called()
+        self.assertFalse(obj.shouldStop)
+        obj.add_outcome('t10', 'failed', 0.5, ''.join(['fa', 'il']))
+        self.assertIs(obj.records['t10'].err, obj.failures[0][1])  # shared
+        obj.failfast = True  # stopped by failure or error
+        obj.add_outcome('t7', 'skipped', 0.5, 'reason')
+        self.assertFalse(obj.shouldStop)
+        obj.add_outcome('t8', 'errors', 0.5, 'error')
+        self.assertTrue(obj.shouldStop)
+        n_failures = len(obj.failures)  # failed by subtests, counted by them
+        obj.add_outcome('t11', 'failed', 0.5, 'sub fail', subtests=True)
+        self.assertEqual(obj.records['t11'].status, 'failed')
+        self.assertEqual(obj.records['t11'].err, 'sub fail')
+        self.assertEqual(len(obj.failures), n_failures)
+        self.assertEqual(obj.counts['total']['failed'], 2)
+
+    def test_get_unrecorded_errors(self):
+        """
+        Assert errors and failures without record got, not tests's ones.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert status, description, error and index of test failed by
+            the subtest, not the ones listed before.
+        """
+        obj = TestCasesResult(stream='stream')
+        tests = [TestTestCasesResult('test_one'), TestTestCasesResult(
+            'test_two')]
+        sub_one = Mock(test_case=tests[1])
+        sub_one.__str__ = Mock(return_value='test_two (i=1)')
+        sub_two = Mock(test_case=tests[1])
+        sub_two.__str__ = Mock(return_value='test_two (i=2)')
+        holder = _ErrorHolder('setUpClass (module.TC)')
+        obj.records[tests[0]] = TestRecord(1, 'errors', 'own error')
+        obj.records[tests[1]] = TestRecord(1, 'failed', 'sub fail 1')
+        obj.errors = [(holder, 'class error'), (tests[0], 'own error')]
+        obj.failures = [(sub_one, 'sub fail 1'), (sub_two, 'sub fail 2')]
+        obj.records[tests[1]].err = obj.failures[0][1]
+        self.assertEqual(obj.get_unrecorded_errors(tests), [
+            ('errors', 'setUpClass (module.TC)', 'class error', None),
+            ('failed', 'test_two (i=1)', 'sub fail 1', 1),
+            ('failed', 'test_two (i=2)', 'sub fail 2', None)])
+        self.assertEqual(obj.get_unrecorded_errors(tests, (1, 1)), [
+            ('failed', 'test_two (i=2)', 'sub fail 2', None)])
+
+    def test_keep_unrecorded(self):
+        """
+        Assert testcase's errors without record kept and journaled.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert errors kept by testcase, none if no error.
+        assert_has_calls:
+            Assert journal.write_error calls with name of parent test.
+        """
+        obj = TestCasesResult(stream='stream')
+        tests = [TestTestCasesResult('test_one')]
+        obj.records[tests[0]] = TestRecord(1, 'failed', 'sub fail')
+        sub = Mock(test_case=tests[0])
+        sub.__str__ = Mock(return_value='test_one (i=1)')
+        holder = _ErrorHolder('setUpClass (module.TC)')
+        obj.errors = [(holder, 'class error')]
+        obj.failures = [(sub, 'sub fail')]
+        obj.keep_unrecorded(TestTestCasesResult, tests, (1, 1))
+        self.assertEqual(obj.unrecorded, {})
+        obj.journal, obj.group = Mock(), 'group'
+        obj.keep_unrecorded(TestTestCasesResult, tests, (0, 0))
+        self.assertEqual(obj.unrecorded, {TestTestCasesResult: [
+            ('errors', 'setUpClass (module.TC)', 'class error', None),
+            ('failed', 'test_one (i=1)', 'sub fail', 0)]})
+        obj.journal.write_error.assert_has_calls([
+            call(TestTestCasesResult, 'group', (
+                'errors', 'setUpClass (module.TC)', 'class error'), None),
+            call(TestTestCasesResult, 'group', (
+                'failed', 'test_one (i=1)', 'sub fail'), 'test_one')])
+
+    def test_add_unrecorded_error(self):
+        """
+        Assert error without record listed, counted, stops with failfast.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert errors lists, counters, description and parent test of
+            holder.
+        assertIsNone:
+            Assert no parent test for a testcase's error.
+        assertTrue:
+            Assert stopped with failfast.
+        """
+        obj = TestCasesResult(stream='stream')
+        obj.add_unrecorded_error(
+            'errors', 'setUpClass (module.TC)', 'class error')
+        obj.add_unrecorded_error(
+            'failed', 'test_two (i=1)', 'sub fail', 'test_two')
+        self.assertIsNone(obj.errors[0][0].test_case)
+        self.assertEqual(obj.failures[0][0].test_case, 'test_two')
+        self.assertEqual(
+            [(str(test), err) for test, err in obj.errors],
+            [('setUpClass (module.TC)', 'class error')])
+        self.assertEqual(
+            [(str(test), err) for test, err in obj.failures],
+            [('test_two (i=1)', 'sub fail')])
+        self.assertEqual(obj.records, {})
+        self.assertEqual(obj.counts['total']['errors'], 1)
+        self.assertEqual(obj.counts['total']['failed'], 1)
+        self.assertFalse(obj.shouldStop)
+        obj.failfast = True
+        obj.add_unrecorded_error('errors', 'tearDownClass (TC)', 'error')
+        self.assertTrue(obj.shouldStop)
+
+    def test_one(self):
+        """
+        Used as a test runned by other tests.
+        """
+
+    def test_two(self):
+        """
+        Used as a test runned by other tests.
+        """
 
     def test_printErrors(self):
         """
@@ -335,8 +1198,11 @@ class TestTestCasesResult(TestCase):
         obj.stream.writeln.assert_called_once_with()
         self.assertEqual(2, obj.printErrorList.call_count)
         obj.printErrorList.assert_has_calls([
-            call('ERROR', obj.errors, '\x1b[31m'),
-            call('FAIL', obj.failures, '\x1b[33m')])
+            call('ERROR', obj.errors, '\x1b[31m', {}),
+            call('FAIL', obj.failures, '\x1b[33m', {})])
+        self.assertIs(  # tracebacks seen shared by errors and failures
+            obj.printErrorList.call_args_list[0][0][3],
+            obj.printErrorList.call_args_list[1][0][3])
 
     def test_printErrorList(self):
         """
@@ -352,7 +1218,8 @@ class TestTestCasesResult(TestCase):
         assertEqual:
             Assert if stream.write called 12 times.
         assert_has_calls:
-            Assert stream.write calls parameters.
+            Assert stream.write calls parameters, a same traceback displayed
+            once with number of tests.
         """
         class FakeTestOne():
             def __init__(self):
@@ -382,6 +1249,27 @@ class TestTestCasesResult(TestCase):
             call('\x1b[31mline 2\x1b[39m'),
             call(obj.separator2),
             call('\x1b[2merror two\nline 2\x1b[0m')])
+        obj.stream.reset_mock()  # same traceback, interned
+        trace = obj.traces.intern("error one\nline 2")
+        obj.traces.intern("error one\nline 2")
+        obj.printErrorList('flavour', [
+            (FakeTestOne(), trace), (FakeTestTwo(), trace)], '\x1b[31m')
+        self.assertEqual(13, obj.stream.writeln.call_count)
+        obj.stream.writeln.assert_has_calls([
+            call('\x1b[2merror one\nline 2\x1b[0m'),
+            call('\x1b[2mSame traceback for 2 tests\x1b[0m\n'),
+            call(obj.separator1),
+            call('\x1b[31mflavour\x1b[0m: \x1b[1mFakeTestTwo\x1b[0m.test_two'),
+            call(obj.separator2),
+            call('\x1b[31mline 2\x1b[39m'),
+            call(obj.separator2),
+            call('\x1b[2mSame traceback as FakeTestOne.test_one\x1b[0m\n')])
+        obj.stream.reset_mock()  # setUpClass's error, without test method
+        obj.printErrorList('flavour', [
+            (_ErrorHolder('setUpClass (module.TC)'), "error\nline 2")],
+            '\x1b[31m')
+        obj.stream.writeln.assert_any_call(
+            '\x1b[31mflavour\x1b[0m: setUpClass (module.TC)')
 
     def test_printTotal(self):
         """
@@ -402,33 +1290,102 @@ class TestTestCasesResult(TestCase):
             call('Ran 3 tests\x1b[0m in \x1b[35m1.587 s\x1b[39m'),
             call('Ran 1 test\x1b[0m in \x1b[35m86.322 ms\x1b[39m')])
 
+    def test_printStats(self):
+        """
+        Assert percentiles of group's or all tests's durations saved, shown.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert percentiles saved for group and total.
+        assert_called_once_with:
+            Assert stream.writeln called with percentiles.
+        assert_not_called:
+            Assert nothing displayed without test runned.
+        """
+        obj = TestCasesResult(stream=Mock())
+        obj.records = {'t1': TestRecord(0.1), 't2': TestRecord(2)}
+        obj.printStats(('group', ['t1', 't3']))  # t3 not runned
+        self.assertEqual(obj.stats['groups']['group'], {
+            'p50': 0.1, 'p90': 0.1, 'p99': 0.1, 'max': 0.1})
+        obj.stream.writeln.assert_called_once_with("".join([
+            "\x1b[2mp50 100.0 ms, p90 100.0 ms, p99 100.0 ms, ",
+            "max 100.0 ms\x1b[0m"]))
+        obj.stream = Mock()
+        obj.printStats()
+        self.assertEqual(obj.stats['total'], {
+            'p50': 0.1, 'p90': 2, 'p99': 2, 'max': 2})
+        obj.stream = Mock()
+        obj.printStats(('other', []))
+        self.assertEqual(obj.stats['groups']['other'], {})
+        obj.stream.writeln.assert_not_called()
+
+    def test_printSlowest(self):
+        """
+        Assert slowest tests and testcases displayed, slowest first.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert stream.writeln calls.
+        """
+        tests = {}
+        for t_name, duration in [('t1', 0.1), ('t2', 2), ('t3', 0.5)]:
+            tests[t_name] = Mock()
+            tests[t_name].id.return_value = f"module.TC.{t_name}"
+        obj = TestCasesResult(stream=Mock())
+        obj.records = {
+            tests['t1']: TestRecord(0.1), tests['t2']: TestRecord(2),
+            tests['t3']: TestRecord(0.5)}
+        obj.durations['testcases'] = {
+            TestTestRecord: 0.2, TestTestCasesResult: 2.6}
+        obj.printSlowest(2)
+        tc_name = f"{__name__}.TestTestCasesResult"
+        self.assertEqual(obj.stream.writeln.call_args_list, [
+            call('\x1b[1mSlowest 2 tests\x1b[0m'),
+            call(' \x1b[35m         2 s\x1b[39m module.TC.t2'),
+            call(' \x1b[35m    500.0 ms\x1b[39m module.TC.t3'),
+            call('\n\x1b[1mSlowest 2 testcases\x1b[0m'),
+            call(f' \x1b[35m       2.6 s\x1b[39m {tc_name}'),
+            call(f' \x1b[35m    200.0 ms\x1b[39m {__name__}.TestTestRecord')])
+
     def test_get_n_tests(self):
         """
-        Assert get_n_tests return the desired dict.
+        Assert get_n_tests return the desired dict, from counters.
 
         Assertions:
         ----------
         assertDictEqual:
             Assert returned dict.
         """
-        # group_tests -> None
         obj = TestCasesResult(stream='stream')
-        obj.failures, obj.errors, obj.skipped = [], [1, 2], []
-        obj.unexpectedSuccesses, obj.expectedFailures = [], [1, 2, 3]
+        for test in ['t1', 't2', 't3', 't4', 't5', 't6', 't7', 't8']:
+            obj.records[test] = TestRecord(1)
+        obj.start_group('group one')
+        for test, status in [
+                ('t1', 'failed'), ('t2', 'expectedFails'), ('t3', 'success'),
+                ('t4', 'skipped'), ('t5', 'success'), ('t6', 'failed')]:
+            obj.set_status(test, status)
+        obj.start_group('group two')
+        for test, status in [('t7', 'errors'), ('t8', 'errors')]:
+            obj.set_status(test, status)
+        # group_tests -> None
         dict_returned = obj.get_n_tests(None)
         self.assertDictEqual(dict_returned, {
-            'failed': 0, 'errors': 2, 'skipped': 0,
-            'expectedFails': 3, 'unexpectedSuccesses': 0})
+            'failed': 2, 'errors': 2, 'skipped': 1,
+            'expectedFails': 1, 'unexpectedSuccesses': 0})
         # group_tests -> not None
-        obj = TestCasesResult(stream='stream')
-        group_tests = ('group test', ['t1', 't2', 't3', 't4', 't5', 't6'])
-        obj.failures, obj.errors = [('t1', ), ('t6', )], []
-        obj.skipped = [('t4', )]
-        obj.unexpectedSuccesses, obj.expectedFailures = [], [('t2', )]
+        group_tests = ('group one', ['t1', 't2', 't3', 't4', 't5', 't6'])
         dict_returned = obj.get_n_tests(group_tests)
         self.assertDictEqual(dict_returned, {
             'failed': 2, 'errors': 0, 'skipped': 1,
             'expectedFails': 1, 'unexpectedSuccesses': 0})
+        # group_tests -> not counted group, with index
+        group_tests = ('group three', ['t1', 't7', 't9'])
+        dict_returned = obj.get_n_tests(group_tests)
+        self.assertDictEqual(dict_returned, {
+            'failed': 1, 'errors': 1, 'skipped': 0,
+            'expectedFails': 0, 'unexpectedSuccesses': 0})
 
     def test_printInfos(self):
         """
@@ -7,15 +7,19 @@ Classes:
     TestTestRunner(TestCase)
 
 Imports:
+    sys
     from unittest: TestCase, TextTestRunner
-    from unittest.mock: patch, call, Mock
+    from unittest.mock: patch, call, Mock, ANY
     from testcases_executor.tc_runner: TestCasesRunner
-    from testcases_executor.tc_result: TestCasesResult
+    from testcases_executor.tc_result: TestRecord, TestCasesResult
+    from testcases_executor.tc_stream: BatchedStream
 """
+import sys
 from unittest import TestCase, TextTestRunner
-from unittest.mock import patch, call, Mock
+from unittest.mock import patch, call, Mock, ANY
 from testcases_executor.tc_runner import TestCasesRunner
-from testcases_executor.tc_result import TestCasesResult
+from testcases_executor.tc_result import TestRecord, TestCasesResult
+from testcases_executor.tc_stream import BatchedStream
 
 
 class TestTestRunner(TestCase):
@@ -28,8 +32,12 @@ class TestTestRunner(TestCase):
     ----------
     test_init_runner():
         Assert if TestCasesRunner is initialized with good attributes.
+    test_run_suite():
+        Assert suite runned, or outcomes from workers displayed and saved.
     test_run_group_suites():
         Assert stream.writeln calls, if suites runned, properties updated.
+    test_plan_progress():
+        Assert tests planned, resumed ones too, and expected durations.
     test_run():
         Assert stream.writeln calls, if groups suites runned, result updated.
     """
@@ -52,13 +60,94 @@ class TestTestRunner(TestCase):
             Assert if obj is instance TextTestRunner.
         """
         obj = TestCasesRunner()
-        mock_runner_init.assert_called_once_with(resultclass=TestCasesResult)
+        mock_runner_init.assert_called_once_with(
+            stream=ANY, resultclass=TestCasesResult, failfast=False)
+        self.assertIs(  # written line by line
+            mock_runner_init.call_args[1]['stream'], sys.stderr)
         self.assertIsInstance(obj, TextTestRunner)
+        self.assertEqual(obj.jobs, 1)
+        self.assertFalse(obj.by_group)
+        self.assertFalse(obj.mem)
+        self.assertIsNone(obj.journal_path)
+        self.assertEqual(obj.display, 'tests')
+        self.assertFalse(obj.history)
+        self.assertEqual(obj.slowest, 0)
+        self.assertFalse(obj.impact)
+        self.assertFalse(obj.recorded)
+        self.assertIsNone(obj.outcomes)
+        mock_runner_init.reset_mock()
+        obj = TestCasesRunner(
+            4, True, True, True, 'journal.jsonl', 'dots', True, 10, True,
+            True)
+        self.assertEqual(obj.jobs, 4)
+        self.assertTrue(obj.by_group)
+        self.assertTrue(obj.mem)
+        self.assertEqual(obj.journal_path, 'journal.jsonl')
+        self.assertEqual(obj.display, 'dots')
+        self.assertTrue(obj.history)
+        self.assertEqual(obj.slowest, 10)
+        self.assertTrue(obj.impact)
+        self.assertTrue(obj.recorded)
+        mock_runner_init.assert_called_once_with(
+            stream=ANY, resultclass=TestCasesResult, failfast=True)
+        self.assertIsInstance(  # characters written by batches
+            mock_runner_init.call_args[1]['stream'], BatchedStream)
+
+    def test_run_suite(self):
+        """
+        Assert suite runned, or outcomes from workers displayed and saved.
+
+        Classes:
+        ----------
+        FakeSuite:
+            Fake suite with property _tests.
 
-    def test_run_group_suites(self):
+        Assertions:
+        ----------
+        assert_called_once_with:
+            Assert suite called with result, stream.write with output.
+        assert_has_calls:
+            Assert result.add_outcome calls parameters, errors without
+            record added with the test carrying them.
+        """
+        class FakeSuite(Mock):
+            _tests = ['test1', 'test2', 'test3']
+
+        obj, result, suite = TestCasesRunner(), Mock(), FakeSuite()
+        obj.stream = Mock()
+        obj.run_suite(result, suite)  # in main process
+        suite.assert_called_once_with(result)
+        result.add_outcome.assert_not_called()
+        suite.reset_mock()
+        obj.outcomes = iter([('output', [  # in workers
+            ('success', 1, None), None, ('failed', 2, 'sub fail')], [
+            ('errors', 'setUpClass (module.TC)', 'error', None),
+            ('failed', 'test3 (i=1)', 'sub fail', 2)])])
+        obj.run_suite(result, suite)
+        suite.assert_not_called()
+        obj.stream.write.assert_called_once_with('output')
+        obj.stream.flush.assert_called_once_with()
+        self.assertEqual(result.add_outcome.call_count, 2)
+        result.add_outcome.assert_has_calls([  # test3 failed by subtest
+            call('test1', 'success', 1, None, subtests=False),
+            call('test3', 'failed', 2, 'sub fail', subtests=True)])
+        result.add_unrecorded_error.assert_has_calls([
+            call('errors', 'setUpClass (module.TC)', 'error', None),
+            call('failed', 'test3 (i=1)', 'sub fail', 'test3')])
+
+    @patch("testcases_executor.tc_runner.MemoryTracer")
+    @patch("testcases_executor.tc_runner.Watchdog")
+    def test_run_group_suites(self, mock_watchdog, mock_memory):
         """
         Assert stream.writeln calls, if suites runned, properties updated.
 
+        Parameters:
+        ----------
+        mock_watchdog : Mock
+            Mock of tc_watchdog.Watchdog .
+        mock_memory : Mock
+            Mock of tc_memory.MemoryTracer .
+
         Classes:
         ----------
         FakeResult:
@@ -68,27 +157,45 @@ class TestTestRunner(TestCase):
         FakeSuiteOne, FakeSuiteTwo:
             Fake suite with property _tests, to pass init during test.
         FakeGroup:
-            Fake group with suites property.
+            Fake group with suites and timeouts properties.
 
         Assertions:
         ----------
         assertEqual:
-            Assert stream.writeln calls, result durations and test_methods.
+            Assert stream.writeln calls, result durations and test_methods,
+            Watchdog maked for each suite with group's timeouts, duration of
+            gathered tests's testcase.
+        assert_called_with:
+            Assert MemoryTracer active with --mem, if not runned in workers,
+            errors without record kept from the ones before testcase.
         assert_has_calls:
             Assert stream.writeln call parameters.
         assertTupleEqual:
-            Assert tuple added to result.test_methods .
+            Assert tuple added to result.test_methods, only tests runned and
+            no next suite after failfast stop, nor cancelled ones.
+        assertTrue, assertFalse:
+            Assert group runned, not if all its testcases cancelled.
+        assertNotIn:
+            Assert no duration for testcase cancelled.
+        assert_called_once_with:
+            Assert result.start_group called with group, add_outcome with
+            resumed test's outcome.
         """
         class FakeResult():
 
             def __init__(self):
                 self.separator2 = 'separator2'
-                self.durations = {
-                    'tests': {
-                        'test1': 0.3, 'test2': 0.2,
-                        'test3': 0.2, 'test4': 0.6},
-                    'testcases': {}}
+                self.shouldStop = False
+                self.durations = {'testcases': {}}
+                self.records = {
+                    test: TestRecord(duration) for test, duration in [
+                        ('test1', 0.3), ('test2', 0.2),
+                        ('test3', 0.2), ('test4', 0.6)]}
                 self.test_methods = []
+                self.errors, self.failures = ['old error'], []
+                self.start_group = Mock()
+                self.add_outcome = Mock()
+                self.keep_unrecorded = Mock()
 
         class FakeTestOne():
             pass
@@ -116,6 +223,9 @@ class TestTestRunner(TestCase):
             def __init__(self):
                 self.suites = [
                     (test_one, suite_one), (test_two, suite_two)]
+                self.resumed = {}
+                self.timeout, self.testcase_timeout = 1, None
+                self.stall = 2
 
         result, group = FakeResult(), FakeGroup()
         obj = TestCasesRunner()
@@ -133,19 +243,132 @@ class TestTestRunner(TestCase):
             call(
                 '\x1b[2m testcases_executor.tests.test_tc_runner.py\x1b[0m\n'),
             call('\n ... \x1b[35m600.0 ms\x1b[0m\n')])
+        result.start_group.assert_called_once_with(group)
+        self.assertEqual(mock_watchdog.call_count, 2)
+        mock_watchdog.assert_called_with(1, None, 2)
+        self.assertIsNone(result.watchdog)
+        mock_memory.assert_called_with(False)  # without --mem
+        self.assertIsNone(result.memory)
         self.assertEqual(result.durations['testcases'][test_one], 0.7)
         self.assertEqual(result.durations['testcases'][test_two], 0.6)
+        result.keep_unrecorded.assert_called_with(
+            test_two, ['test4'], (1, 0))  # errors of previous runs not kept
         self.assertEqual(len(result.test_methods), 1)
         self.assertTupleEqual(result.test_methods[0], (
             group, [
                 (test_one, ['test1', 'test2', 'test3']),
                 (test_two, ['test4'])]))
+        result = FakeResult()  # stopped by failfast
+        del result.records['test3']
+        result.shouldStop = True
+        obj.run_group_suites(result, group)
+        self.assertTupleEqual(result.test_methods[0], (group, []))
+        obj.run_suite = Mock()
+        obj.run_suite.side_effect = lambda res, suite: setattr(
+            res, 'shouldStop', True) or True
+        result.shouldStop = False
+        obj.run_group_suites(result, group)
+        self.assertTupleEqual(result.test_methods[1], (
+            group, [(test_one, ['test1', 'test2'])]))
+        self.assertEqual(result.durations['testcases'][test_one], 0.5)
+        obj.mem = True  # with --mem, measured in main process
+        obj.run_group_suites(FakeResult(), group)
+        mock_memory.assert_called_with(True)
+        obj.outcomes = Mock()  # or in workers
+        obj.run_group_suites(FakeResult(), group)
+        mock_memory.assert_called_with(False)
+        obj.outcomes, obj.mem = None, False  # test completed in journal
+        obj.run_suite = Mock()
+        group.resumed = {test_two: [('test5', ['success', 0.1, None])]}
+        result = FakeResult()
+        result.records['test5'] = TestRecord(0.1)
+        obj.stream.reset_mock()
+        obj.run_group_suites(result, group)
+        result.add_outcome.assert_called_once_with(
+            'test5', 'success', 0.1, None)
+        obj.stream.writeln.assert_any_call('\x1b[2m 1 tests resumed\x1b[0m\n')
+        self.assertTupleEqual(result.test_methods[0][1][1], (
+            test_two, ['test5', 'test4']))
+        self.assertEqual(result.durations['testcases'][test_two], 0.7)
+        result = FakeResult()  # gathered async tests last as the longest
+        result.records['test5'] = TestRecord(0.1)
+        with patch("testcases_executor.tc_runner.SharedLoopSuite") as mock_sl:
+            mock_sl.gathers.return_value = True
+            obj.run_group_suites(result, group)
+        mock_sl.gathers.assert_called_with(test_two)
+        self.assertEqual(result.durations['testcases'][test_one], 0.3)
+        self.assertEqual(  # resumed ones not gathered with the others
+            result.durations['testcases'][test_two], 0.7)
+        group.resumed = {}  # with -q, only end of group's characters
+        obj.display = 'dots'
+        obj.stream.reset_mock()
+        obj.run_group_suites(FakeResult(), group)
+        obj.stream.writeln.assert_called_once_with()
+        obj.display = 'progress'  # nothing with --progress
+        obj.stream.reset_mock()
+        obj.run_group_suites(FakeResult(), group)
+        obj.stream.writeln.assert_not_called()
+        obj.display = 'tests'  # testcases cancelled in workers (failfast)
+        obj.run_suite = Mock(side_effect=[False, True])
+        obj.stream.reset_mock()
+        result = FakeResult()
+        self.assertTrue(obj.run_group_suites(result, group))
+        obj.stream.writeln.assert_any_call(
+            '\x1b[2m cancelled by failfast\x1b[0m\n')
+        self.assertTupleEqual(result.test_methods[0], (
+            group, [(test_two, ['test4'])]))
+        self.assertNotIn(test_one, result.durations['testcases'])
+        obj.run_suite = Mock(return_value=False)  # all cancelled
+        result = FakeResult()
+        self.assertFalse(obj.run_group_suites(result, group))
+        self.assertEqual(result.test_methods, [])
 
+    def test_plan_progress(self):
+        """
+        Assert tests planned, resumed ones too, and expected durations.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests planned, expected durations and their sum.
+        """
+        tests = []
+        for test_id in ['t1', 't2', 't3', 't6']:
+            tests.append(Mock())
+            tests[-1].id.return_value = test_id
+        group_one = Mock(suites=[
+            ('TestOne', Mock(_tests=tests[:2])),
+            ('TestTwo', Mock(_tests=tests[2:3]))])
+        group_one.resumed = {'TestTwo': ['t4', 't5']}
+        group_two = Mock(suites=[('TestFour', Mock(_tests=tests[3:]))])
+        group_two.resumed = {}
+        result = TestCasesResult('stream')
+        TestCasesRunner.plan_progress(
+            result, [group_one, group_two], {'t1': 1, 't2': 3, 't4': 8})
+        self.assertEqual(result.planned, 6)
+        self.assertEqual(
+            result.expected, {'t1': 1, 't2': 3, 't3': 4, 't6': 4})
+        self.assertEqual(result.expected_left, 12)
+
+    @patch("testcases_executor.tc_runner.save_failed")
+    @patch("testcases_executor.tc_runner.save_durations")
+    @patch("testcases_executor.tc_runner.load_durations")
     @patch("testcases_executor.tc_runner.datetime")
-    def test_run(self, mock_datetime):
+    def test_run(self, mock_datetime, mock_load, mock_save, mock_failed):
         """
         Assert stream.writeln calls, if groups suites runned, result updated.
 
+        Parameters:
+        ----------
+        mock_datetime : Mock
+            Mock of datetime.
+        mock_load : Mock
+            Mock of tc_cache.load_durations .
+        mock_save : Mock
+            Mock of tc_cache.save_durations .
+        mock_failed : Mock
+            Mock of tc_cache.save_failed .
+
         Classes:
         ----------
         FakeResult:
@@ -161,11 +384,18 @@ class TestTestRunner(TestCase):
         Assertions:
         ----------
         assertEqual:
-            Assert writeln, run_group_suites, printTotal calls and new result.
+            Assert writeln, run_group_suites, printTotal calls and new result,
+            no summary of a group cancelled in workers.
         assert_has_calls:
             Assert writeln, run_group_suites, printTotalcall parameters.
         assert_called_once_with:
-            Assert resultclass, printErrors, printInfos called with parameter.
+            Assert resultclass, printErrors, printInfos, printStats called
+            with parameter, printSlowest with --durations, save_durations
+            and save_failed called with result, journal opened with start
+            time and closed, history too, batches flushed at the end,
+            save_impact with tests's files recorded in main process.
+        assert_not_called:
+            Assert caches not saved for recorded results (merge).
         """
         class FakeResult():
 
@@ -181,10 +411,18 @@ class TestTestRunner(TestCase):
                 self.test_methods = []
                 self.n_tests = {'groups': {}}
                 self.failfast = None
+                self.shouldStop = False
+                self.journal = None
+                self.history = None
+                self.impact = None
                 self.printTotal = Mock()
                 self.printErrors = Mock()
+                self.printStats = Mock()
+                self.printSlowest = Mock()
                 self.printInfos = Mock()
                 self.testsRun = 7
+                self.display = None
+                self.planned = None
 
         class FakeGroup():
 
@@ -203,6 +441,7 @@ class TestTestRunner(TestCase):
             else:
                 result.test_methods.append(('group_two', [
                     ('TestFour', ['test6', 'test7'])]))
+            return True
 
         obj = TestCasesRunner()
         obj.resultclass = Mock()
@@ -231,6 +470,7 @@ class TestTestRunner(TestCase):
         obj.run_group_suites.assert_has_calls([
             call(result, group_one),
             call(result, group_two)])
+        self.assertIsNone(obj.outcomes)
         result.n_tests['groups'][group_one] = 5
         result.durations['groups'][group_one] = 7
         result.n_tests['groups'][group_two] = 2
@@ -243,4 +483,104 @@ class TestTestRunner(TestCase):
         result.printInfos.assert_has_calls([
             call((group_one, ['test1', 'test2', 'test3', 'test4', 'test5'])),
             call((group_two, ['test6', 'test7'])), call()])
+        result.printStats.assert_has_calls([
+            call((group_one, ['test1', 'test2', 'test3', 'test4', 'test5'])),
+            call((group_two, ['test6', 'test7'])), call()])
+        result.printSlowest.assert_not_called()
         self.assertEqual(new_result, result)
+        self.assertEqual(result.display, 'tests')
+        self.assertIsNone(result.planned)
+        obj.stream.flush.assert_not_called()  # line by line
+        mock_load.assert_not_called()
+        mock_save.assert_called_once_with(result)
+        mock_failed.assert_called_once_with(result)
+        mock_load.return_value = 'durations'
+        with patch(
+                "testcases_executor.tc_runner.TestCasesOutcomes") as mock_out:
+            with patch(
+                    "testcases_executor.tc_runner.make_tasks") as mock_tasks:
+                mock_tasks.return_value = 'tasks'
+                result.test_methods = []
+                obj.jobs = 2
+                obj.run([group_one, group_two])
+                mock_tasks.assert_called_once_with(
+                    [group_one, group_two], False)
+                mock_out.assert_called_once_with(
+                    'tasks', 2, 'durations', False, False, 'tests')
+                mock_out().close.assert_called_once_with()
+                self.assertIsNone(obj.outcomes)
+        obj.jobs = 1  # stopped by failfast, next groups not runned
+        obj.run_group_suites.reset_mock()
+        obj.run_group_suites.side_effect = lambda res, group: setattr(
+            res, 'shouldStop', True) or add_item_result(res, group)
+        result = FakeResult()
+        obj.resultclass.return_value = result
+        obj.run([group_one, group_two])
+        obj.run_group_suites.assert_called_once_with(result, group_one)
+        obj.run_group_suites.side_effect = [False, True]  # one cancelled
+        result = FakeResult()
+        result.test_methods = [('group_two', [
+            ('TestFour', ['test6', 'test7'])])]  # runned group two
+        obj.resultclass.return_value = result
+        obj.stream.reset_mock()
+        obj.display = 'dots'  # not said by each testcase
+        obj.run([group_one, group_two])
+        obj.stream.writeln.assert_any_call(
+            '\x1b[2m cancelled by failfast\x1b[0m\n')
+        obj.display = 'tests'
+        self.assertEqual(result.printTotal.call_count, 2)  # group two, total
+        self.assertEqual(list(result.n_tests['groups']), [group_two])
+        obj.run_group_suites.side_effect = add_item_result  # journal
+        obj.journal_path = 'journal.jsonl'
+        result = FakeResult()
+        obj.resultclass.return_value = result
+        with patch("testcases_executor.tc_runner.Journal") as mock_journal:
+            obj.run([group_one, group_two])
+        mock_journal.assert_called_once_with('journal.jsonl', 'now')
+        self.assertEqual(result.journal, mock_journal.return_value)
+        result.journal.close.assert_called_once_with()
+        obj.journal_path, obj.history = None, True  # history of runs
+        result = FakeResult()
+        obj.resultclass.return_value = result
+        with patch("testcases_executor.tc_runner.RunHistory") as mock_history:
+            obj.run([group_one, group_two])
+        mock_history.assert_called_once_with('now')
+        self.assertEqual(result.history, mock_history.return_value)
+        result.history.close.assert_called_once_with()
+        obj.history, obj.slowest = False, 5  # with --durations 5
+        result = FakeResult()
+        obj.resultclass.return_value = result
+        obj.run([group_one, group_two])
+        result.printSlowest.assert_called_once_with(5)
+        obj.slowest, obj.impact, obj.jobs = 0, True, 2  # --record-impact
+        result = FakeResult()
+        obj.resultclass.return_value = result
+        with patch(
+                "testcases_executor.tc_runner.ImpactTracer") as mock_tracer:
+            with patch(
+                    "testcases_executor.tc_runner.save_impact") as mock_impact:
+                with patch(
+                        "testcases_executor.tc_runner.TestCasesOutcomes"
+                        ) as mock_out:
+                    obj.run([group_one, group_two])
+        mock_out.assert_not_called()  # not in workers
+        self.assertEqual(result.impact, mock_tracer.return_value)
+        mock_impact.assert_called_once_with(result.impact.tests)
+        obj.impact, obj.jobs = False, 1
+        obj.journal_path = None  # tests planned for progress line
+        obj.display = 'progress'
+        obj.plan_progress = Mock()
+        mock_load.return_value = {'tests': 'tests durations'}
+        result = FakeResult()
+        obj.resultclass.return_value = result
+        obj.run([group_one, group_two])
+        self.assertEqual(result.display, 'progress')
+        obj.plan_progress.assert_called_once_with(
+            result, [group_one, group_two], 'tests durations')
+        obj.stream.flush.assert_called_with(True)  # last batch
+        obj.display, obj.recorded = 'tests', True  # merged, no cache saved
+        mock_save.reset_mock()
+        mock_failed.reset_mock()
+        obj.run([group_one, group_two])
+        mock_save.assert_not_called()
+        mock_failed.assert_not_called()
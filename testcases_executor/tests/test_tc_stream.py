@@ -0,0 +1,125 @@
+"""
+Module testcases_executor.tests.test_tc_stream .
+
+Contain TestCase for testcases_executor.tc_stream .
+
+unittest.TestCase sublasses:
+    TestBatchedStream
+
+Imports:
+    from io: StringIO
+    from unittest: TestCase
+    from unittest.mock: patch
+    from testcases_executor.tc_stream: BatchedStream
+"""
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+from testcases_executor.tc_stream import BatchedStream
+
+
+class TestBatchedStream(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_stream.BatchedStream .
+
+    Methods
+    ----------
+    test_init_stream():
+        Assert BatchedStream initialized with an empty buffer.
+    test_flush():
+        Assert buffer written at most every interval, else by timer.
+    test_update_line():
+        Assert progress line displayed, erased before next text.
+    """
+
+    def test_init_stream(self):
+        """
+        Assert BatchedStream initialized with an empty buffer.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert attributes values.
+        assertIsNone:
+            Assert no progress line nor timer.
+        """
+        obj = BatchedStream('stream')
+        self.assertEqual(obj.stream, 'stream')
+        self.assertEqual(obj.buffer, [])
+        self.assertIsNone(obj.line)
+        self.assertFalse(obj.shown)
+        self.assertEqual(obj.interval, 0.1)
+        self.assertEqual(obj.t_flush, 0)
+        self.assertIsNone(obj.timer)
+
+    @patch("testcases_executor.tc_stream.atexit")
+    @patch("testcases_executor.tc_stream.threading.Timer")
+    @patch("testcases_executor.tc_stream.time.monotonic")
+    def test_flush(self, mock_time, mock_timer, mock_atexit):
+        """
+        Assert buffer written at most every interval, else by timer.
+
+        Parameters:
+        ----------
+        mock_time : Mock
+            Mock of time.monotonic .
+        mock_timer : Mock
+            Mock of threading.Timer .
+        mock_atexit : Mock
+            Mock of atexit .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert text written by batches, buffer emptied.
+        assert_called_once_with:
+            Assert timer started once to write remaining text, cancelled,
+            remaining text written at exit until then.
+        """
+        obj = BatchedStream(StringIO())
+        mock_time.return_value = 10
+        obj.write('test1 ')
+        obj.write('OK\n')
+        obj.flush()
+        self.assertEqual(obj.stream.getvalue(), 'test1 OK\n')
+        self.assertEqual(obj.buffer, [])
+        self.assertEqual(obj.t_flush, 10)
+        mock_time.return_value = 10.05  # before interval, by timer
+        obj.write('test2 OK\n')
+        obj.flush()
+        obj.flush()
+        self.assertEqual(obj.stream.getvalue(), 'test1 OK\n')
+        mock_timer.assert_called_once_with(0.1, obj.flush, (True, ))
+        mock_timer().start.assert_called_once_with()
+        self.assertTrue(mock_timer().daemon)
+        mock_atexit.register.assert_called_once_with(obj.flush, True)
+        obj.flush(True)  # at the end of tests or by timer
+        self.assertEqual(obj.stream.getvalue(), 'test1 OK\ntest2 OK\n')
+        mock_timer().cancel.assert_called_once_with()
+        mock_atexit.unregister.assert_called_once_with(obj.flush)
+        self.assertIsNone(obj.timer)
+
+    def test_update_line(self):
+        """
+        Assert progress line displayed, erased before next text.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert text and lines written.
+        """
+        obj = BatchedStream(StringIO(), 0)
+        obj.update_line(' 1/2 tests')
+        obj.update_line(' 2/2 tests')  # only last line displayed
+        obj.flush()
+        self.assertEqual(obj.stream.getvalue(), '\r 2/2 tests\x1b[K')
+        self.assertTrue(obj.shown)
+        obj.flush()  # nothing new
+        self.assertEqual(obj.stream.getvalue(), '\r 2/2 tests\x1b[K')
+        obj.stream = StringIO()
+        obj.write('Total\n')
+        obj.flush()
+        self.assertEqual(obj.stream.getvalue(), '\r\x1b[KTotal\n')
+        self.assertFalse(obj.shown)
@@ -0,0 +1,81 @@
+"""
+Module testcases_executor.tests.test_tc_traces .
+
+Contain TestCase for testcases_executor.tc_traces .
+
+unittest.TestCase sublasses:
+    TestTracesFunctions
+    TestTracebackStore
+
+Imports:
+    from unittest: TestCase
+    from testcases_executor.tc_traces: traceback_signature, TracebackStore
+"""
+from unittest import TestCase
+from testcases_executor.tc_traces import traceback_signature, TracebackStore
+
+
+class TestTracesFunctions(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_traces functions.
+
+    Methods
+    ----------
+    test_traceback_signature():
+        Assert memory addresses normalized, traceback without kept itself.
+    """
+
+    def test_traceback_signature(self):
+        """
+        Assert memory addresses normalized, traceback without kept itself.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert addresses replaced.
+        assertIs:
+            Assert same string without address.
+        """
+        self.assertEqual(
+            traceback_signature("Error: <Obj object at 0x7f3a2c1b9e50>"),
+            "Error: <Obj object at 0x?>")
+        trace = "Traceback\n  line 12, in setUp\nError: broken"
+        self.assertIs(traceback_signature(trace), trace)
+
+
+class TestTracebackStore(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_traces.TracebackStore .
+
+    Methods
+    ----------
+    test_intern():
+        Assert traceback kept once by signature and counted.
+    """
+
+    def test_intern(self):
+        """
+        Assert traceback kept once by signature and counted.
+
+        Assertions:
+        ----------
+        assertIs:
+            Assert first traceback returned for same signature.
+        assertEqual:
+            Assert tracebacks kept and counts.
+        """
+        obj = TracebackStore()
+        self.assertEqual((obj.traces, obj.counts), ({}, {}))
+        first = obj.intern("Error: <Obj object at 0x7f3a2c1b9e50>")
+        self.assertIs(
+            obj.intern("Error: <Obj object at 0x7f3a2c1b9f10>"), first)
+        other = obj.intern("Error: other")
+        self.assertEqual(other, "Error: other")
+        self.assertEqual(len(obj.traces), 2)
+        self.assertEqual(obj.count(first), 2)
+        self.assertEqual(obj.count(other), 1)
+        self.assertEqual(obj.count("Error: not kept"), 0)
@@ -10,12 +10,16 @@ Imports:
     from unittest: TestCase
     from unittest.mock: patch
     from testcases_executor.tc_utils: (
-        raise_error, check_type, format_duration, BOLD, RED)
+        raise_error, check_type, format_duration, format_clock,
+        timed_part, format_timing, format_size, format_memory,
+        duration_stats, format_stats, BOLD, RED)
 """
 from unittest import TestCase
 from unittest.mock import patch
 from testcases_executor.tc_utils import (
-    raise_error, check_type, format_duration, BOLD, RED)
+    raise_error, check_type, format_duration, format_clock, timed_part,
+    format_timing, format_size, format_memory, duration_stats, format_stats,
+    BOLD, RED)
 
 
 class TestUtilsFunctions(TestCase):
@@ -32,6 +36,20 @@ class TestUtilsFunctions(TestCase):
         Assert if error is raised or not by check_type.
     test_format_duration():
         Assert if format_duration return str in s or ms depending of parameter.
+    test_format_clock():
+        Assert format_clock return m:ss, or h:mm:ss over an hour.
+    test_timed_part():
+        Assert duration of code inside added to part, even if raising.
+    test_format_timing():
+        Assert parts formatted in order, with CPU time.
+    test_format_size():
+        Assert size formatted with the biggest unit under 1024.
+    test_duration_stats():
+        Assert nearest rank percentiles and max of durations.
+    test_format_stats():
+        Assert percentiles and max formatted.
+    test_format_memory():
+        Assert peak and signed RSS growth formatted.
     """
 
     @patch("builtins.print")
@@ -101,3 +119,120 @@ class TestUtilsFunctions(TestCase):
         """
         self.assertEqual(format_duration(1.23591), "1.236 s")
         self.assertEqual(format_duration(0.00591847), "5.918 ms")
+
+    def test_format_clock(self):
+        """
+        Assert format_clock return m:ss, or h:mm:ss over an hour.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert format_clock returns.
+        """
+        self.assertEqual(format_clock(0.4), "0:00")
+        self.assertEqual(format_clock(125.9), "2:05")
+        self.assertEqual(format_clock(3725), "1:02:05")
+
+    @patch("testcases_executor.tc_utils.time.perf_counter_ns")
+    def test_timed_part(self, mock_time):
+        """
+        Assert duration of code inside added to part, even if raising.
+
+        Parameters:
+        ----------
+        mock_time : Mock
+            Mock of time.perf_counter_ns .
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert parts's durations.
+        assertRaises:
+            Assert error raised inside not catched.
+        """
+        mock_time.side_effect = [1000, 2000, 3000, 6000]
+        parts = {}
+        with timed_part(parts, 'setUp'):
+            pass
+        with self.assertRaises(ValueError):
+            with timed_part(parts, 'setUp'):
+                raise ValueError
+        self.assertEqual(parts, {'setUp': 4e-06})
+
+    def test_format_timing(self):
+        """
+        Assert parts formatted in order, with CPU time.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert formatted timing.
+        """
+        self.assertEqual(format_timing(None, None), "")
+        self.assertEqual(format_timing({}, 1.5), "CPU 1.5 s")
+        self.assertEqual(
+            format_timing(
+                {'cleanup': 0.002, 'test': 0.5, 'setUp': 0.001}, None),
+            "setUp 1.0 ms, test 500.0 ms, cleanup 2.0 ms")
+
+    def test_format_size(self):
+        """
+        Assert size formatted with the biggest unit under 1024.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert formatted sizes.
+        """
+        self.assertEqual(format_size(0), "0 B")
+        self.assertEqual(format_size(1023), "1023 B")
+        self.assertEqual(format_size(1536), "1.5 KiB")
+        self.assertEqual(format_size(-3 * 2 ** 20), "-3.0 MiB")
+        self.assertEqual(format_size(5 * 2 ** 40), "5120.0 GiB")
+
+    def test_format_memory(self):
+        """
+        Assert peak and signed RSS growth formatted.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert formatted memory.
+        """
+        self.assertEqual(format_memory(None, None), "")
+        self.assertEqual(format_memory(2048, None), "peak 2.0 KiB")
+        self.assertEqual(
+            format_memory(0, 2 ** 20), "peak 0 B, RSS +1.0 MiB")
+        self.assertEqual(
+            format_memory(10, -2048), "peak 10 B, RSS -2.0 KiB")
+
+    def test_duration_stats(self):
+        """
+        Assert nearest rank percentiles and max of durations.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert percentiles, empty without durations.
+        """
+        self.assertEqual(duration_stats([]), {})
+        self.assertEqual(
+            duration_stats([0.5]),
+            {'p50': 0.5, 'p90': 0.5, 'p99': 0.5, 'max': 0.5})
+        self.assertEqual(
+            duration_stats([i / 100 for i in range(200, 0, -1)]),
+            {'p50': 1, 'p90': 1.8, 'p99': 1.98, 'max': 2})
+
+    def test_format_stats(self):
+        """
+        Assert percentiles and max formatted.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert formatted percentiles.
+        """
+        self.assertEqual(format_stats({}), "")
+        self.assertEqual(
+            format_stats({'p50': 0.002, 'p90': 0.5, 'p99': 1, 'max': 1.5}),
+            "p50 2.0 ms, p90 500.0 ms, p99 1 s, max 1.5 s")
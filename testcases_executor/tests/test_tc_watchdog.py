@@ -0,0 +1,375 @@
+"""
+Module testcases_executor.tests.test_tc_watchdog .
+
+Contain TestCase for testcases_executor.tc_watchdog .
+
+unittest.TestCase sublasses:
+    TestWatchdog
+
+Imports:
+    asyncio
+    signal
+    time
+    from io: StringIO
+    from os.path: join, isfile
+    from tempfile: TemporaryDirectory
+    from threading: Thread
+    from unittest: (
+        TestCase, TestSuite, IsolatedAsyncioTestCase, skipUnless)
+    from unittest.mock: patch, Mock
+    from unittest.runner: _WritelnDecorator
+    from testcases_executor.tc_result: TestCasesResult
+    from testcases_executor.tc_watchdog: TestTimeout, Watchdog
+    from testcases_executor.tc_async: SharedLoopSuite
+"""
+import asyncio
+import signal
+import time
+from io import StringIO
+from os.path import join, isfile
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import (
+    TestCase, TestSuite, IsolatedAsyncioTestCase, skipUnless)
+from unittest.mock import patch, Mock
+from unittest.runner import _WritelnDecorator
+from testcases_executor.tc_result import TestCasesResult
+from testcases_executor.tc_watchdog import TestTimeout, Watchdog
+from testcases_executor.tc_async import SharedLoopSuite
+
+
+class TestWatchdog(TestCase):
+    """
+    A subclass of unittest.TestCase .
+
+    Tests for tc_watchdog.Watchdog .
+
+    Methods
+    ----------
+    test_init_watchdog():
+        Assert active only with a timeout, SIGALRM, in main thread.
+    test_enter_exit():
+        Assert SIGALRM's handler installed then restored, testcase deadline.
+    test_alarm():
+        Assert timeout raised inside a test's part, else kept as expired.
+    test_guard():
+        Assert guarded call marked inside, expired timeout raised once.
+    test_test_limit():
+        Assert deadline and reason of the shortest timeout, without SIGALRM.
+    test_limited():
+        Assert awaitable limited by deadline, timeout raised once.
+    test_timeouts():
+        Assert too long tests interrupted and recorded as errors.
+    test_timeouts_on_loop():
+        Assert too long tests on a shared loop limited on it, gathered too.
+    test_stall():
+        Assert stacks of a stalled test dumped in its file, others removed.
+    """
+
+    def test_init_watchdog(self):
+        """
+        Assert active only with a timeout, SIGALRM, in main thread.
+
+        Assertions:
+        ----------
+        assertFalse:
+            Assert not active without timeout, SIGALRM or in a thread.
+        assertTrue:
+            Assert active with a timeout.
+        assertEqual:
+            Assert timeouts attributes.
+        """
+        self.assertFalse(Watchdog().active)
+        obj = Watchdog(1, 5)
+        self.assertEqual(obj.timeout, 1)
+        self.assertEqual(obj.tc_timeout, 5)
+        self.assertEqual(obj.active, hasattr(signal, 'setitimer'))
+        self.assertIsNone(obj.tc_deadline)
+        self.assertFalse(obj.expired)
+        self.assertIsNone(obj.stall)
+        obj = Watchdog(stall=1)  # stacks dumps without SIGALRM
+        self.assertEqual(obj.stall, 1)
+        self.assertIsNone(obj.stall_file)
+        self.assertFalse(obj.active)
+        with patch("testcases_executor.tc_watchdog.signal", Mock(spec=[])):
+            self.assertFalse(Watchdog(1).active)  # windows
+        watchdogs = []
+        thread = Thread(target=lambda: watchdogs.append(Watchdog(1)))
+        thread.start()
+        thread.join()
+        self.assertFalse(watchdogs[0].active)
+
+    @skipUnless(hasattr(signal, 'setitimer'), "SIGALRM not available")
+    def test_enter_exit(self):
+        """
+        Assert SIGALRM's handler installed then restored, testcase deadline.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert SIGALRM's handler.
+        assertIsNone:
+            Assert no testcase deadline without testcase's timeout.
+        assertGreater:
+            Assert testcase deadline after now.
+        """
+        previous = signal.getsignal(signal.SIGALRM)
+        with Watchdog(1) as obj:
+            self.assertEqual(signal.getsignal(signal.SIGALRM), obj.alarm)
+            self.assertIsNone(obj.tc_deadline)
+        self.assertEqual(signal.getsignal(signal.SIGALRM), previous)
+        with Watchdog(tc_timeout=5) as obj:
+            self.assertGreater(obj.tc_deadline, time.monotonic() + 4)
+        self.assertEqual(signal.getsignal(signal.SIGALRM), previous)
+
+    def test_alarm(self):
+        """
+        Assert timeout raised inside a test's part, else kept as expired.
+
+        Assertions:
+        ----------
+        assertRaisesRegex:
+            Assert TestTimeout raised with reason inside a part.
+        assertTrue:
+            Assert expired outside a part.
+        """
+        obj = Watchdog(1)
+        obj.reason = "Test timeout of 1.0 s"
+        obj.inside = True
+        with self.assertRaisesRegex(TestTimeout, "Test timeout of 1.0 s"):
+            obj.alarm(signal.SIGINT, None)
+        obj.inside = False
+        obj.alarm(signal.SIGINT, None)
+        self.assertTrue(obj.expired)
+
+    def test_guard(self):
+        """
+        Assert guarded call marked inside, expired timeout raised once.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert guarded call returned value.
+        assertTrue:
+            Assert inside during call.
+        assertFalse:
+            Assert not inside after call, not expired after raised.
+        assertRaises:
+            Assert TestTimeout raised if expired.
+        """
+        obj = Watchdog(1)
+        guarded = obj.guard(lambda: obj.inside)
+        self.assertTrue(guarded())
+        self.assertFalse(obj.inside)
+        obj.expired = True
+        self.assertRaises(TestTimeout, guarded)
+        self.assertFalse(obj.expired)
+        self.assertTrue(guarded())
+
+    def test_test_limit(self):
+        """
+        Assert deadline and reason of the shortest timeout, without SIGALRM.
+
+        Assertions:
+        ----------
+        assertIsNone:
+            Assert no limit without timeout.
+        assertEqual:
+            Assert reason of test's or testcase's timeout.
+        assertAlmostEqual:
+            Assert deadline.
+        """
+        self.assertIsNone(Watchdog(stall=1).test_limit())
+        deadline, reason = Watchdog(0.5).test_limit()
+        self.assertAlmostEqual(deadline, time.monotonic() + 0.5, delta=0.1)
+        self.assertEqual(reason, "Test timeout of 500.0 ms")
+        with patch("testcases_executor.tc_watchdog.signal", Mock(spec=[])):
+            with Watchdog(5, 0.2) as obj:  # testcase's deadline, on windows
+                deadline, reason = obj.test_limit()
+        self.assertAlmostEqual(deadline, time.monotonic() + 0.2, delta=0.1)
+        self.assertEqual(reason, "Testcase timeout of 200.0 ms")
+
+    @skipUnless(hasattr(asyncio, 'timeout'), "asyncio.timeout not available")
+    def test_limited(self):
+        """
+        Assert awaitable limited by deadline, timeout raised once.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert awaitable's result.
+        assertRaisesRegex:
+            Assert TestTimeout raised with reason once deadline exceeded.
+        assertIsNone:
+            Assert deadline removed once raised.
+        assertRaises:
+            Assert TimeoutError raised by awaitable not a timeout.
+        """
+        async def wait(duration):
+            await asyncio.sleep(duration)
+            return duration
+
+        async def raise_timeout():
+            raise TimeoutError()
+
+        limited = Watchdog.limited
+        self.assertEqual(asyncio.run(limited(wait(0), None)), 0)
+        limit = [time.monotonic() + 0.1, "Test timeout of 100.0 ms"]
+        self.assertEqual(asyncio.run(limited(wait(0), limit)), 0)
+        with self.assertRaisesRegex(TestTimeout, "Test timeout of 100.0 ms"):
+            asyncio.run(limited(wait(5), limit))
+        self.assertIsNone(limit[0])
+        self.assertEqual(asyncio.run(limited(wait(0.2), limit)), 0.2)
+        limit = [time.monotonic() + 5, "Test timeout of 5.0 s"]
+        self.assertRaises(
+            TimeoutError, asyncio.run, limited(raise_timeout(), limit))
+
+    @skipUnless(hasattr(signal, 'setitimer'), "SIGALRM not available")
+    def test_timeouts(self):
+        """
+        Assert too long tests interrupted and recorded as errors.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with a too long test catching exceptions.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests status.
+        assertIn:
+            Assert timeout's reason in errors.
+        assertLess:
+            Assert too long test interrupted.
+        """
+        class FakeTestCase(TestCase):
+
+            def test_long(self):
+                try:
+                    time.sleep(5)
+                except Exception:
+                    pass
+
+            def test_ok(self):
+                pass
+
+        def run(timeout, tc_timeout):
+            result = TestCasesResult(_WritelnDecorator(StringIO()))
+            tests = [FakeTestCase('test_long'), FakeTestCase('test_ok')]
+            result.watchdog = Watchdog(timeout, tc_timeout)
+            with result.watchdog:
+                TestSuite(tests)(result)
+            return result.get_outcomes(tests)
+
+        outcomes = run(0.1, None)  # test's timeout
+        self.assertEqual(outcomes[0][0], 'errors')
+        self.assertLess(outcomes[0][1], 1)
+        self.assertIn("TestTimeout: Test timeout of 100.0 ms", outcomes[0][2])
+        self.assertEqual(outcomes[1][0], 'success')
+        outcomes = run(None, 0.1)  # testcase's timeout, next test at start
+        self.assertEqual(outcomes[0][0], 'errors')
+        self.assertIn("Testcase timeout of 100.0 ms", outcomes[0][2])
+        self.assertEqual(outcomes[1][0], 'errors')
+        self.assertIn("Testcase timeout of 100.0 ms", outcomes[1][2])
+        outcomes = run(0.1, 5)  # shorter test's timeout
+        self.assertIn("Test timeout of 100.0 ms", outcomes[0][2])
+        self.assertEqual(outcomes[1][0], 'success')
+
+    @skipUnless(hasattr(asyncio, 'Runner'), "asyncio.Runner not available")
+    def test_timeouts_on_loop(self):
+        """
+        Assert too long tests on a shared loop limited on it, gathered too.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Async testcase with a too long test, teared down after it.
+
+        Assertions:
+        ----------
+        assertEqual:
+            Assert tests status, too long test teared down.
+        assertIn:
+            Assert timeout's reason in errors.
+        assertLess:
+            Assert too long test interrupted.
+        """
+        class FakeTestCase(IsolatedAsyncioTestCase):
+            teared_down = []
+
+            async def asyncTearDown(self):
+                await asyncio.sleep(0)
+                self.teared_down.append(self._testMethodName)
+
+            async def test_long(self):
+                await asyncio.sleep(5)
+
+            async def test_ok(self):
+                await asyncio.sleep(0)
+
+        def run(timeout, tc_timeout):
+            result = TestCasesResult(_WritelnDecorator(StringIO()))
+            tests = [FakeTestCase('test_long'), FakeTestCase('test_ok')]
+            result.watchdog = Watchdog(timeout, tc_timeout)
+            with result.watchdog:
+                SharedLoopSuite(tests)(result)
+            return result.get_outcomes(tests)
+
+        for concurrent_tests in (False, True):  # --shared-loop, gathered
+            FakeTestCase.concurrent_tests = concurrent_tests
+            FakeTestCase.teared_down = []
+            outcomes = run(0.1, None)
+            self.assertEqual(outcomes[0][0], 'errors')
+            self.assertLess(outcomes[0][1], 1)
+            self.assertIn(
+                "TestTimeout: Test timeout of 100.0 ms", outcomes[0][2])
+            self.assertEqual(outcomes[1][0], 'success')
+            self.assertEqual(
+                sorted(FakeTestCase.teared_down), ['test_long', 'test_ok'])
+            outcomes = run(None, 0.1)
+            self.assertEqual(outcomes[0][0], 'errors')
+            self.assertIn("Testcase timeout of 100.0 ms", outcomes[0][2])
+
+    def test_stall(self):
+        """
+        Assert stacks of a stalled test dumped in its file, others removed.
+
+        Classes:
+        ----------
+        FakeTestCase:
+            Testcase with a stalled test.
+
+        Assertions:
+        ----------
+        assertIn:
+            Assert stalled test's frame in dumped stacks.
+        assertFalse:
+            Assert no file for a test not stalled.
+        assertIsNone:
+            Assert dumps stopped.
+        """
+        class FakeTestCase(TestCase):
+
+            def test_stalled(self):
+                time.sleep(0.3)
+
+            def test_ok(self):
+                pass
+
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        with patch(
+                "testcases_executor.tc_watchdog.stall_path",
+                lambda test_id: join(tmp_dir.name, test_id)):
+            result = TestCasesResult(_WritelnDecorator(StringIO()))
+            tests = [FakeTestCase('test_stalled'), FakeTestCase('test_ok')]
+            result.watchdog = Watchdog(stall=0.1)
+            with result.watchdog:
+                TestSuite(tests)(result)
+        self.assertIsNone(result.watchdog.stall_file)
+        with open(join(tmp_dir.name, tests[0].id()), 'r') as stall_file:
+            stacks = stall_file.read()
+        self.assertIn("most recent call first", stacks)
+        self.assertIn("test_stalled", stacks)
+        self.assertFalse(isfile(join(tmp_dir.name, tests[1].id())))